@@ -12,12 +12,29 @@ Author: Wind Energy Site Planning
 Version: 2.0
 """
 
-from typing import Dict, Optional, List, Tuple
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Optional, List, Sequence, Tuple
 import json
+import sqlite3
+import time
 from urllib.parse import urlencode
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    from shapely import STRtree
+    from shapely.geometry import Point, box, shape
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
 from qgis.core import (
     QgsPointXY,
     QgsCoordinateReferenceSystem,
@@ -49,6 +66,8 @@ class BGRSoilAPI:
     # Standard-Parameter für WFS GetFeature Request
     WFS_VERSION = "2.0.0"
 
+    USER_AGENT = 'QGIS Wind Turbine Calculator/2.0'
+
     # Bodenarten-Mapping von BGR-Codes zu unseren Kategorien
     BGR_SOIL_TYPE_MAPPING = {
         # Tone
@@ -95,6 +114,13 @@ class BGRSoilAPI:
         """
         self.logger = get_plugin_logger()
         self.timeout = timeout
+
+        # Persistente Session: Keep-Alive spart TLS-Handshakes bei Folgeabfragen
+        self._session = None
+        if REQUESTS_AVAILABLE:
+            self._session = requests.Session()
+            self._session.headers['User-Agent'] = self.USER_AGENT
+
         self.logger.info("BGR Soil API Client initialisiert")
 
     def query_soil_at_point(
@@ -172,6 +198,141 @@ class BGRSoilAPI:
                 'error': f'API-Fehler: {str(e)}'
             }
 
+    def query_soil_at_points(
+        self,
+        points: Sequence[QgsPointXY],
+        crs: QgsCoordinateReferenceSystem,
+        buffer_m: float = 100.0
+    ) -> List[Dict]:
+        """
+        Fragt Bodendaten für mehrere Punkte mit einer einzigen WFS-Abfrage ab.
+
+        Es wird ein GetFeature-Request über die gemeinsame Bounding Box aller
+        Punkte (inkl. Puffer) gestellt; die Zuordnung Feature → Punkt erfolgt
+        lokal über einen STRtree. Ohne shapely wird auf Einzelabfragen
+        zurückgegriffen.
+
+        Args:
+            points: Koordinaten der Abfragepunkte
+            crs: Koordinatenreferenzsystem der Punkte
+            buffer_m: Puffer-Radius um jeden Punkt in Metern
+
+        Returns:
+            Liste von Dicts wie bei query_soil_at_point(), in Reihenfolge der Punkte
+        """
+        points = list(points)
+        if not points:
+            return []
+
+        if not SHAPELY_AVAILABLE:
+            self.logger.warning("shapely nicht verfügbar - BGR-Abfrage einzeln pro Punkt")
+            return [self.query_soil_at_point(p, crs, buffer_m) for p in points]
+
+        try:
+            self.logger.info(f"BGR-Sammelabfrage für {len(points)} Punkte")
+
+            points_wgs84 = self._transform_points_to_wgs84(points, crs)
+            if points_wgs84 is None:
+                return [{
+                    'success': False,
+                    'error': 'Koordinatentransformation fehlgeschlagen'
+                } for _ in points]
+
+            # Gemeinsame Bounding Box aller Punkte inkl. Puffer
+            buffer_deg = buffer_m / 111000.0
+            xs = [p.x() for p in points_wgs84]
+            ys = [p.y() for p in points_wgs84]
+            bbox = (
+                min(xs) - buffer_deg,
+                min(ys) - buffer_deg,
+                max(xs) + buffer_deg,
+                max(ys) + buffer_deg
+            )
+
+            features = self._wfs_get_features_in_bbox(bbox)
+
+            # Nur Features mit Geometrie lassen sich räumlich zuordnen
+            indexed = [f for f in features if f.get('geometry')]
+            if not indexed:
+                self.logger.warning("Keine Bodendaten von BGR gefunden")
+                return [{
+                    'success': False,
+                    'error': 'Keine Bodendaten an diesem Standort verfügbar'
+                } for _ in points]
+
+            tree = STRtree([shape(f['geometry']) for f in indexed])
+
+            results = []
+            for x, y in zip(xs, ys):
+                # Bevorzugt das Feature, das den Punkt enthält; sonst das erste
+                # Feature im Puffer (entspricht der Einzelabfrage)
+                hits = tree.query(Point(x, y), predicate='intersects')
+                if len(hits) == 0:
+                    hits = tree.query(
+                        box(x - buffer_deg, y - buffer_deg, x + buffer_deg, y + buffer_deg)
+                    )
+
+                if len(hits) == 0:
+                    results.append({
+                        'success': False,
+                        'error': 'Keine Bodendaten an diesem Standort verfügbar'
+                    })
+                    continue
+
+                result = self._parse_soil_feature(indexed[int(min(hits))])
+                result['success'] = True
+                results.append(result)
+
+            self.logger.info(
+                f"BGR-Sammelabfrage: {sum(r['success'] for r in results)}/{len(points)} "
+                f"Punkte mit Bodendaten"
+            )
+
+            return results
+
+        except _BGREndpointUnavailable as e:
+            return [{
+                'success': False,
+                'error': str(e),
+                'endpoint_unavailable': True,
+            } for _ in points]
+        except Exception as e:
+            self.logger.error(f"BGR-Sammelabfrage fehlgeschlagen: {e}", exc_info=True)
+            return [{
+                'success': False,
+                'error': f'API-Fehler: {str(e)}'
+            } for _ in points]
+
+    def _transform_points_to_wgs84(
+        self,
+        points: List[QgsPointXY],
+        source_crs: QgsCoordinateReferenceSystem
+    ) -> Optional[List[QgsPointXY]]:
+        """
+        Transformiert mehrere Punkte mit einer gemeinsamen Transformation zu WGS84.
+
+        Args:
+            points: Punkte in Quell-CRS
+            source_crs: Quell-Koordinatenreferenzsystem
+
+        Returns:
+            Punkte in WGS84 oder None bei Fehler
+        """
+        try:
+            if source_crs.authid() == "EPSG:4326":
+                return list(points)
+
+            transform = QgsCoordinateTransform(
+                source_crs,
+                QgsCoordinateReferenceSystem("EPSG:4326"),
+                QgsProject.instance()
+            )
+            return [transform.transform(p) for p in points]
+
+        except Exception as e:
+            self.logger.error(f"Koordinatentransformation fehlgeschlagen: {e}")
+            return None
+
     def _transform_to_wgs84(
         self,
         point: QgsPointXY,
@@ -230,19 +391,34 @@ class BGRSoilAPI:
         Returns:
             Liste von Features als Dictionaries
         """
-        try:
-            # Konvertiere Buffer von Meter zu Grad (grobe Approximation)
-            # 1 Grad ≈ 111 km am Äquator
-            buffer_deg = buffer_m / 111000.0
+        # Konvertiere Buffer von Meter zu Grad (grobe Approximation)
+        # 1 Grad ≈ 111 km am Äquator
+        buffer_deg = buffer_m / 111000.0
 
-            # Bounding Box um Punkt
-            bbox = (
-                point.x() - buffer_deg,
-                point.y() - buffer_deg,
-                point.x() + buffer_deg,
-                point.y() + buffer_deg
-            )
+        # Bounding Box um Punkt
+        bbox = (
+            point.x() - buffer_deg,
+            point.y() - buffer_deg,
+            point.x() + buffer_deg,
+            point.y() + buffer_deg
+        )
+
+        return self._wfs_get_features_in_bbox(bbox)
+
+    def _wfs_get_features_in_bbox(
+        self,
+        bbox: Tuple[float, float, float, float]
+    ) -> List[Dict]:
+        """
+        Führt WFS GetFeature Request für eine Bounding Box aus.
+
+        Args:
+            bbox: (xmin, ymin, xmax, ymax) in WGS84
 
+        Returns:
+            Liste von Features als Dictionaries
+        """
+        try:
             # WFS GetFeature Parameter
             params = {
                 'SERVICE': 'WFS',
@@ -259,13 +435,7 @@ class BGRSoilAPI:
 
             self.logger.debug(f"WFS Request URL: {url}")
 
-            # HTTP Request
-            request = Request(url)
-            request.add_header('User-Agent', 'QGIS Wind Turbine Calculator/2.0')
-
-            with urlopen(request, timeout=self.timeout) as response:
-                data = response.read()
-                content = json.loads(data.decode('utf-8'))
+            content = json.loads(self._http_get(url).decode('utf-8'))
 
             # Parse GeoJSON Response
             if 'features' not in content:
@@ -307,6 +477,29 @@ class BGRSoilAPI:
             self.logger.error(f"Unerwarteter Fehler bei WFS-Request: {e}", exc_info=True)
             return []
 
+    def _http_get(self, url: str) -> bytes:
+        """
+        Lädt eine URL, über die persistente Session falls verfügbar.
+
+        Fehler werden wie bei urllib als HTTPError/URLError gemeldet.
+        """
+        if self._session is None:
+            request = Request(url)
+            request.add_header('User-Agent', self.USER_AGENT)
+
+            with urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+
+        try:
+            response = self._session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise URLError(e) from e
+
+        if response.status_code >= 400:
+            raise HTTPError(url, response.status_code, response.reason, response.headers, None)
+
+        return response.content
+
     def _parse_soil_feature(self, feature: Dict) -> Dict:
         """
         Parsed ein GeoJSON Feature zu Bodendaten.
@@ -408,7 +601,7 @@ class BGRSoilAPI:
             url = f"{self.BGR_WFS_BASE}?{urlencode(params)}"
 
             request = Request(url)
-            request.add_header('User-Agent', 'QGIS Wind Turbine Calculator/2.0')
+            request.add_header('User-Agent', self.USER_AGENT)
 
             with urlopen(request, timeout=self.timeout) as response:
                 status_code = response.getcode()
@@ -427,6 +620,75 @@ class BGRSoilAPI:
             }
 
 
+class BGRResultCache:
+    """
+    Persistenter Cache (SQLite) für BGR-Abfrageergebnisse.
+
+    Schlüssel sind auf 4 Nachkommastellen gerundete Koordinaten plus CRS,
+    damit wiederholte Läufe am selben Standort keinen WFS-Request auslösen.
+    """
+
+    DEFAULT_TTL_S = 30 * 24 * 3600  # 30 Tage
+
+    def __init__(self, db_path: Optional[Path] = None, ttl_s: float = DEFAULT_TTL_S):
+        """
+        Initialisiert den Cache und legt die Tabelle bei Bedarf an.
+
+        Args:
+            db_path: Pfad zur SQLite-Datei (default: Plugin-Arbeitsverzeichnis)
+            ttl_s: Gültigkeitsdauer eines Eintrags in Sekunden
+        """
+        if db_path is None:
+            db_path = Path.home() / '.qgis3' / 'windturbine_calculator_v2' / 'bgr_cache.sqlite'
+
+        self.db_path = Path(db_path)
+        self.ttl_s = ttl_s
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS bgr_results ("
+                "key TEXT PRIMARY KEY, created REAL NOT NULL, result TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(point: QgsPointXY, crs: QgsCoordinateReferenceSystem) -> str:
+        """Erzeugt den Cache-Schlüssel für einen Punkt."""
+        return f"{round(point.x(), 4)}|{round(point.y(), 4)}|{crs.authid()}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Liefert ein gültiges Ergebnis oder None."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT result FROM bgr_results WHERE key = ? AND created >= ?",
+                (key, time.time() - self.ttl_s)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, result: Dict):
+        """Speichert ein Ergebnis (überschreibt vorhandene Einträge)."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO bgr_results (key, created, result) VALUES (?, ?, ?)",
+                (key, time.time(), json.dumps(result))
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=5.0)
+
+
+_bgr_cache: Optional[BGRResultCache] = None
+
+
+def get_bgr_cache() -> BGRResultCache:
+    """Liefert den gemeinsamen BGR-Cache (wird beim ersten Aufruf angelegt)."""
+    global _bgr_cache
+    if _bgr_cache is None:
+        _bgr_cache = BGRResultCache()
+    return _bgr_cache
+
+
 def get_soil_data_from_bgr(
     coordinates: QgsPointXY,
     crs: QgsCoordinateReferenceSystem,
@@ -453,3 +715,26 @@ def get_soil_data_from_bgr(
     """
     api = BGRSoilAPI()
     return api.query_soil_at_point(coordinates, crs, buffer_m)
+
+
+def get_soil_data_batch(
+    points: Sequence[QgsPointXY],
+    crs: QgsCoordinateReferenceSystem,
+    buffer_m: float = 100.0,
+    api: Optional[BGRSoilAPI] = None
+) -> List[Dict]:
+    """
+    Convenience-Funktion für BGR-Abfrage mehrerer Standorte in einem Request.
+
+    Args:
+        points: Koordinaten der Standorte
+        crs: Koordinatenreferenzsystem
+        buffer_m: Puffer-Radius in Metern
+        api: Bestehender Client, um dessen HTTP-Session wiederzuverwenden
+
+    Returns:
+        Liste von Dicts (siehe BGRSoilAPI.query_soil_at_points)
+    """
+    if api is None:
+        api = BGRSoilAPI()
+    return api.query_soil_at_points(points, crs, buffer_m)
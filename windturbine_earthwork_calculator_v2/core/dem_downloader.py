@@ -12,6 +12,8 @@ Version: 2.0.0
 import os
 import math
 import base64
+import hashlib
+import shutil
 from pathlib import Path
 from typing import List, Tuple, Optional
 import tempfile
@@ -34,6 +36,55 @@ from ..utils.geometry_utils import create_bbox_with_buffer, get_centroid
 from ..utils.logging_utils import get_plugin_logger
 
 
+def copy_file(src, dst) -> None:
+    """
+    Copy src to dst as an independent file.
+
+    On Linux os.copy_file_range lets the kernel copy (or reflink on
+    copy-on-write filesystems) without passing the bytes through Python;
+    elsewhere, or if the kernel refuses, shutil.copyfile is used. An
+    existing dst is unlinked first, so a file hardlinked to dst is never
+    overwritten in place.
+    """
+    src, dst = os.fspath(src), os.fspath(dst)
+    if os.path.abspath(src) == os.path.abspath(dst):
+        return
+    if os.path.lexists(dst):
+        os.remove(dst)
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+def link_or_copy(src, dst) -> None:
+    """
+    Hardlink src to dst, falling back to copy_file.
+
+    Only for files that both live in the DEM cache: a hardlink shares the
+    inode, so anything handed to the user must go through copy_file.
+    """
+    src, dst = os.fspath(src), os.fspath(dst)
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            return
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        copy_file(src, dst)
+
+
 class DEMDownloader:
     """
     Downloads DEM tiles from hoehendaten.de API and creates mosaics.
@@ -52,6 +103,9 @@ class DEMDownloader:
     TILE_PREFIX = "dgm1_32"
     TILE_RESOLUTION = "1m"
 
+    # Finished mosaics are kept per tile set; oldest are evicted above this size
+    MOSAIC_CACHE_MAX_BYTES = 5 * 1024 ** 3
+
     def __init__(self, cache_dir: Optional[str] = None, force_refresh: bool = False):
         """
         Initialize DEM downloader.
@@ -79,6 +133,7 @@ class DEMDownloader:
 
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.mosaic_cache_dir = self.cache_dir / 'mosaics'
         self.logger.info(f"DEM cache directory: {self.cache_dir}")
 
     def calculate_tiles(self, bbox: QgsRectangle, buffer_m: float = 250) -> List[str]:
@@ -347,10 +402,13 @@ class DEMDownloader:
             raise ValueError("No tiles to mosaic")
 
         if len(tile_paths) == 1:
-            # Only one tile, no need to mosaic
-            self.logger.info("Only one tile, copying instead of mosaicking")
-            import shutil
-            shutil.copy(tile_paths[0], output_path)
+            # Only one tile, no need to mosaic; share the inode only
+            # if the result stays inside the cache
+            self.logger.info("Only one tile, linking instead of mosaicking")
+            if Path(output_path).resolve().is_relative_to(self.cache_dir.resolve()):
+                link_or_copy(tile_paths[0], output_path)
+            else:
+                copy_file(tile_paths[0], output_path)
             return output_path
 
         self.logger.info(f"Creating mosaic from {len(tile_paths)} tiles")
@@ -557,7 +615,33 @@ class DEMDownloader:
             for ds in datasets:
                 ds = None
 
-    def download_for_geometry(self, geometry: QgsGeometry, output_path: str,
+    def _mosaic_cache_path(self, tile_names: List[str]) -> Path:
+        """Cache path of the mosaic of a tile set (independent of tile order)."""
+        key = hashlib.sha1("|".join(sorted(tile_names)).encode()).hexdigest()[:16]
+        return self.mosaic_cache_dir / f"mosaic_{key}.tif"
+
+    def _evict_mosaic_cache(self):
+        """Delete least recently used mosaics while the cache exceeds its size limit."""
+        entries = []
+        for path in self.mosaic_cache_dir.glob("mosaic_*.tif"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.MOSAIC_CACHE_MAX_BYTES:
+                break
+            try:
+                path.unlink()
+                total -= size
+                self.logger.info(f"Evicted cached mosaic: {path.name}")
+            except OSError as e:
+                self.logger.warning(f"Could not evict cached mosaic {path.name}: {e}")
+
+    def download_for_geometry(self, geometry: QgsGeometry, output_path: Optional[str],
                              buffer_m: float = 250,
                              feedback: Optional[QgsProcessingFeedback] = None) -> str:
         """
@@ -565,13 +649,14 @@ class DEMDownloader:
 
         This is the main workflow method that:
         1. Calculates required tiles
-        2. Downloads tiles
-        3. Creates mosaic
+        2. Reuses the cached mosaic of this tile set, if any
+        3. Otherwise downloads tiles and creates (and caches) the mosaic
         4. Returns path to mosaic
 
         Args:
             geometry (QgsGeometry): Geometry to cover
-            output_path (str): Path for output mosaic
+            output_path (str): Path for output mosaic, or None to use the
+                cached mosaic in place
             buffer_m (float): Buffer distance in meters
             feedback (QgsProcessingFeedback): Feedback object
 
@@ -585,12 +670,26 @@ class DEMDownloader:
         if not tile_names:
             raise ValueError("No tiles calculated for geometry")
 
+        cache_path = self._mosaic_cache_path(tile_names)
+        if not self.force_refresh and cache_path.exists():
+            self.logger.info(f"Using cached DEM mosaic: {cache_path.name}")
+            if feedback:
+                feedback.pushInfo(f"Using cached DEM mosaic for {len(tile_names)} tile(s)")
+            os.utime(cache_path)  # mark as recently used
+            if output_path is None:
+                return str(cache_path)
+            copy_file(cache_path, output_path)
+            return output_path
+
         if feedback:
             feedback.pushInfo(f"Need to download {len(tile_names)} DEM tile(s)")
 
         # Download tiles
         tile_paths = self.download_tiles(tile_names, feedback)
 
+        if feedback and feedback.isCanceled():
+            raise Exception("DEM download cancelled")
+
         if not tile_paths:
             raise Exception("Failed to download any DEM tiles")
 
@@ -604,11 +703,29 @@ class DEMDownloader:
                     f"Warning: Only {len(tile_paths)}/{len(tile_names)} tiles available",
                     fatalError=False
                 )
+            # Incomplete coverage is not cached
+            if output_path is None:
+                fd, output_path = tempfile.mkstemp(suffix='.tif', prefix='dem_mosaic_')
+                os.close(fd)
+            return self.create_mosaic(tile_paths, output_path, feedback)
+
+        # Create mosaic in the cache, then hand it out
+        self.mosaic_cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.tif', prefix='partial_', dir=self.mosaic_cache_dir)
+        os.close(fd)
+        try:
+            self.create_mosaic(tile_paths, temp_path, feedback)
+            os.replace(temp_path, cache_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._evict_mosaic_cache()
 
-        # Create mosaic
-        mosaic_path = self.create_mosaic(tile_paths, output_path, feedback)
-
-        return mosaic_path
+        if output_path is None:
+            return str(cache_path)
+        copy_file(cache_path, output_path)
+        return output_path
 
     def get_cache_info(self) -> dict:
         """
@@ -627,8 +744,8 @@ class DEMDownloader:
         }
 
     def clear_cache(self):
-        """Clear all cached tiles."""
-        cache_files = list(self.cache_dir.glob("*.tif"))
+        """Clear all cached tiles and mosaics."""
+        cache_files = list(self.cache_dir.glob("*.tif")) + list(self.mosaic_cache_dir.glob("*.tif"))
         for f in cache_files:
             f.unlink()
         self.logger.info(f"Cleared {len(cache_files)} cached tiles")
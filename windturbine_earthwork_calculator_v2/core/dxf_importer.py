@@ -1377,7 +1377,9 @@ class DXFImporter:
             'area': polygon.area(),
             'perimeter': polygon.length(),
             'crs_epsg': self.crs_epsg,
-            'tolerance': self.tolerance
+            'tolerance': self.tolerance,
+            # Topology was checked above; lets later stages skip re-validation
+            'is_valid': is_valid
         }
 
         self.logger.info(
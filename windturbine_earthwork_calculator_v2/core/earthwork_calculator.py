@@ -27,10 +27,110 @@ try:
 except ImportError:
     GDAL_AVAILABLE = False
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit: the function stays plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
 from ..utils.geometry_utils import get_centroid
 from ..utils.logging_utils import get_plugin_logger
 from ..utils.gdal_compat import read_band_as_array
 
+# Heights evaluated per kernel call; progress/cancel are checked in between
+SWEEP_BLOCK_SIZE = 8
+
+# Coarse grid evaluated before the golden-section search (also charted)
+GRID_POINTS = 10
+
+_INV_PHI = (math.sqrt(5.0) - 1.0) / 2.0
+
+
+def _pixel_window(bbox, geotransform, x_size: int, y_size: int) -> Tuple[int, int, int, int]:
+    """
+    Pixel window of a raster covering a bounding box.
+
+    Rows are counted from the raster origin along pixel_height, which is
+    negative for north-up rasters: there the top edge (yMaximum) maps to
+    the first row. Both edges are converted and ordered, so the window is
+    correct for either sign.
+
+    Returns:
+        Tuple of (x_off, y_off, width, height), clamped to the raster;
+        width or height is <= 0 if the box lies outside
+    """
+    origin_x, pixel_width, _, origin_y, _, pixel_height = geotransform
+    x_min_px = max(0, int((bbox.xMinimum() - origin_x) / pixel_width))
+    x_max_px = min(x_size, int((bbox.xMaximum() - origin_x) / pixel_width) + 1)
+    row_top = (bbox.yMaximum() - origin_y) / pixel_height
+    row_bottom = (bbox.yMinimum() - origin_y) / pixel_height
+    y_min_px = max(0, int(min(row_top, row_bottom)))
+    y_max_px = min(y_size, int(max(row_top, row_bottom)) + 1)
+    return x_min_px, y_min_px, x_max_px - x_min_px, y_max_px - y_min_px
+
+
+@njit(parallel=True, cache=True)
+def _sweep_heights(elevations, inside, distances, heights,
+                   terrain_min, terrain_max, tan_slope, pixel_area):
+    """
+    Cut/fill volumes of platform and slope for many platform heights.
+
+    Args:
+        elevations: DEM values of all valid pixels around the platform (1D, float32)
+        inside: True for pixels inside the platform polygon
+        distances: Distance of each pixel centre to the polygon (0 inside)
+        heights: Platform heights to evaluate
+        terrain_min, terrain_max: Terrain range inside the platform
+        tan_slope: tan(slope angle)
+        pixel_area: Area of one DEM pixel (m²)
+
+    Returns:
+        Tuple of arrays (platform_cut, platform_fill, slope_cut, slope_fill,
+        slope_width), one value per height
+    """
+    n = heights.shape[0]
+    platform_cut = np.zeros(n)
+    platform_fill = np.zeros(n)
+    slope_cut = np.zeros(n)
+    slope_fill = np.zeros(n)
+    slope_width = np.zeros(n)
+
+    for k in prange(n):
+        height = heights[k]
+        width = max(abs(terrain_max - height), abs(terrain_min - height)) / tan_slope
+        p_cut = 0.0
+        p_fill = 0.0
+        s_cut = 0.0
+        s_fill = 0.0
+        for i in range(elevations.shape[0]):
+            diff = elevations[i] - height
+            if inside[i]:
+                if diff > 0:
+                    p_cut += diff
+                else:
+                    p_fill -= diff
+            elif distances[i] <= width:
+                # Slope at mid-height between platform and terrain
+                diff = diff / 2.0
+                if diff > 0:
+                    s_cut += diff
+                else:
+                    s_fill -= diff
+        platform_cut[k] = p_cut * pixel_area
+        platform_fill[k] = p_fill * pixel_area
+        slope_cut[k] = s_cut * pixel_area
+        slope_fill[k] = s_fill * pixel_area
+        slope_width[k] = width
+
+    return platform_cut, platform_fill, slope_cut, slope_fill, slope_width
+
 
 class EarthworkCalculator:
     """
@@ -108,20 +208,9 @@ class EarthworkCalculator:
             geotransform = ds.GetGeoTransform()
             bbox = geometry.boundingBox()
 
-            # Convert bbox to pixel coordinates
-            origin_x, pixel_width, _, origin_y, _, pixel_height = geotransform
-            x_min_px = int((bbox.xMinimum() - origin_x) / pixel_width)
-            x_max_px = int((bbox.xMaximum() - origin_x) / pixel_width) + 1
-            y_min_px = int((bbox.yMinimum() - origin_y) / pixel_height)
-            y_max_px = int((bbox.yMaximum() - origin_y) / pixel_height) + 1
-
-            x_min_px = max(0, x_min_px)
-            y_min_px = max(0, y_min_px)
-            x_max_px = min(ds.RasterXSize, x_max_px)
-            y_max_px = min(ds.RasterYSize, y_max_px)
-
-            width = x_max_px - x_min_px
-            height = y_max_px - y_min_px
+            x_min_px, y_min_px, width, height = _pixel_window(
+                bbox, geotransform, ds.RasterXSize, ds.RasterYSize
+            )
 
             if width <= 0 or height <= 0:
                 ds = None
@@ -136,44 +225,48 @@ class EarthworkCalculator:
                 return self._sample_dem_legacy(geometry)
 
             # Create mask from polygon
-            mem_driver = ogr.GetDriverByName('Memory')
-            mem_ds = mem_driver.CreateDataSource('memData')
-            mem_layer = mem_ds.CreateLayer('polygon', srs=None, geom_type=ogr.wkbPolygon)
-
-            wkt = geometry.asWkt()
-            ogr_geom = ogr.CreateGeometryFromWkt(wkt)
-            feature = ogr.Feature(mem_layer.GetLayerDefn())
-            feature.SetGeometry(ogr_geom)
-            mem_layer.CreateFeature(feature)
-
-            mask_driver = gdal.GetDriverByName('MEM')
-            mask_ds = mask_driver.Create('', width, height, 1, gdal.GDT_Byte)
-
-            mask_geotransform = list(geotransform)
-            mask_geotransform[0] = origin_x + x_min_px * pixel_width
-            mask_geotransform[3] = origin_y + y_min_px * pixel_height
-            mask_ds.SetGeoTransform(mask_geotransform)
-
-            mask_band = mask_ds.GetRasterBand(1)
-            mask_band.Fill(0)
-            gdal.RasterizeLayer(mask_ds, [1], mem_layer, burn_values=[1])
-
-            mask = read_band_as_array(mask_band, 0, 0, width, height)
+            mask = self._rasterize_polygon(geometry, geotransform, x_min_px, y_min_px, width, height)
             masked_data = data[mask == 1]
 
             if nodata is not None:
                 masked_data = masked_data[masked_data != nodata]
 
             ds = None
-            mask_ds = None
-            mem_ds = None
 
-            return masked_data.astype(float).flatten()
+            return masked_data.astype(np.float32, copy=False).ravel()
 
         except Exception as e:
             self.logger.warning(f"Vectorized sampling failed: {e}, using legacy method")
             return self._sample_dem_legacy(geometry)
 
+    @staticmethod
+    def _rasterize_polygon(geometry: QgsGeometry, geotransform, x_off: int, y_off: int,
+                           width: int, height: int) -> np.ndarray:
+        """Burn a polygon into a width x height mask aligned with a DEM window."""
+        mem_driver = ogr.GetDriverByName('Memory')
+        mem_ds = mem_driver.CreateDataSource('memData')
+        mem_layer = mem_ds.CreateLayer('polygon', srs=None, geom_type=ogr.wkbPolygon)
+
+        ogr_geom = ogr.CreateGeometryFromWkt(geometry.asWkt())
+        feature = ogr.Feature(mem_layer.GetLayerDefn())
+        feature.SetGeometry(ogr_geom)
+        mem_layer.CreateFeature(feature)
+
+        mask_driver = gdal.GetDriverByName('MEM')
+        mask_ds = mask_driver.Create('', width, height, 1, gdal.GDT_Byte)
+
+        origin_x, pixel_width, _, origin_y, _, pixel_height = geotransform
+        mask_geotransform = list(geotransform)
+        mask_geotransform[0] = origin_x + x_off * pixel_width
+        mask_geotransform[3] = origin_y + y_off * pixel_height
+        mask_ds.SetGeoTransform(mask_geotransform)
+
+        mask_band = mask_ds.GetRasterBand(1)
+        mask_band.Fill(0)
+        gdal.RasterizeLayer(mask_ds, [1], mem_layer, burn_values=[1])
+
+        return read_band_as_array(mask_band, 0, 0, width, height)
+
     def _sample_dem_legacy(self, geometry: QgsGeometry) -> np.ndarray:
         """Legacy DEM sampling using pixel-by-pixel iteration (slow but reliable)."""
         bbox = geometry.boundingBox()
@@ -210,7 +303,7 @@ class EarthworkCalculator:
                     if not block.isNoData(row, col) and value is not None:
                         elevations.append(float(value))
 
-        return np.array(elevations, dtype=float)
+        return np.array(elevations, dtype=np.float32)
 
     def calculate_slope_width(self, max_height_diff: float) -> float:
         """
@@ -297,6 +390,19 @@ class EarthworkCalculator:
             else:
                 slope_fill += abs(diff) * self.pixel_area
 
+        return self._build_results(
+            height, (terrain_min, terrain_max, terrain_mean, terrain_std),
+            platform_cut, platform_fill, slope_cut, slope_fill,
+            slope_width, slope_polygon.area()
+        )
+
+    def _build_results(self, height: float, terrain_stats: Tuple[float, float, float, float],
+                       platform_cut: float, platform_fill: float,
+                       slope_cut: float, slope_fill: float,
+                       slope_width: float, total_area: float) -> Dict:
+        """Assemble the rounded result dict of one height scenario."""
+        terrain_min, terrain_max, terrain_mean, terrain_std = terrain_stats
+
         # Calculate totals
         total_cut = platform_cut + slope_cut
         total_fill = platform_fill + slope_fill
@@ -305,10 +411,9 @@ class EarthworkCalculator:
 
         # Platform area
         platform_area = self.polygon.area()
-        total_area = slope_polygon.area()
 
         results = {
-            'platform_height': round(height, 2),
+            'platform_height': round(float(height), 2),
             'terrain_min': round(terrain_min, 2),
             'terrain_max': round(terrain_max, 2),
             'terrain_mean': round(terrain_mean, 2),
@@ -329,11 +434,173 @@ class EarthworkCalculator:
 
         return results
 
+    def _prepare_height_sweep(self, heights: np.ndarray) -> Optional[Dict]:
+        """
+        Read the DEM once for a whole height sweep.
+
+        The window covers the platform plus the widest slope of all heights.
+        For each valid pixel it keeps the elevation, whether the pixel lies
+        on the platform and its distance to the platform, so every height
+        only compares distances with its slope width instead of buffering
+        and re-sampling the polygon.
+
+        Args:
+            heights: Platform heights that will be evaluated
+
+        Returns:
+            Dict with the kernel inputs, or None if the DEM cannot be read
+            with GDAL (callers then use calculate_scenario per height)
+        """
+        if not GDAL_AVAILABLE:
+            return None
+
+        platform_elevations = self.sample_dem_in_polygon(self.polygon)
+        if len(platform_elevations) == 0:
+            return None
+
+        terrain_min = float(np.min(platform_elevations))
+        terrain_max = float(np.max(platform_elevations))
+        terrain_stats = (
+            terrain_min, terrain_max,
+            float(np.mean(platform_elevations)), float(np.std(platform_elevations))
+        )
+        tan_slope = math.tan(math.radians(self.slope_angle))
+        max_width = float(np.max(np.maximum(
+            np.abs(terrain_max - heights), np.abs(terrain_min - heights)
+        ))) / tan_slope
+
+        try:
+            ds = gdal.Open(self.dem_layer.source(), gdal.GA_ReadOnly)
+            if ds is None:
+                return None
+
+            band = ds.GetRasterBand(1)
+            nodata = band.GetNoDataValue()
+            geotransform = ds.GetGeoTransform()
+            origin_x, pixel_width, _, origin_y, _, pixel_height = geotransform
+            margin = max_width + max(abs(pixel_width), abs(pixel_height))
+            bbox = self.polygon.boundingBox().buffered(margin)
+
+            x_min_px, y_min_px, width, height = _pixel_window(
+                bbox, geotransform, ds.RasterXSize, ds.RasterYSize
+            )
+            if width <= 0 or height <= 0:
+                return None
+
+            data = read_band_as_array(band, x_min_px, y_min_px, width, height)
+            inside = self._rasterize_polygon(
+                self.polygon, geotransform, x_min_px, y_min_px, width, height
+            ) == 1
+            ds = None
+        except Exception as e:
+            self.logger.warning(f"Height sweep preparation failed: {e}, sampling per height")
+            return None
+
+        # Pixel centre coordinates of the window
+        cols = origin_x + (x_min_px + np.arange(width) + 0.5) * pixel_width
+        rows = origin_y + (y_min_px + np.arange(height) + 0.5) * pixel_height
+        xs, ys = np.meshgrid(cols, rows)
+
+        valid = np.ones(data.shape, dtype=bool) if nodata is None else data != nodata
+        # float32 holds cm precision of 1 m DEMs at half the memory traffic;
+        # the kernel still accumulates in float64
+        elevations = data[valid].astype(np.float32, copy=False)
+        inside = inside[valid]
+        distances = np.zeros(elevations.shape, dtype=np.float32)
+        outside = ~inside
+        distances[outside] = self._distance_to_polygon(xs[valid][outside], ys[valid][outside])
+
+        return {
+            'elevations': elevations,
+            'inside': inside,
+            'distances': distances,
+            'terrain_stats': terrain_stats,
+            'tan_slope': tan_slope,
+        }
+
+    def _distance_to_polygon(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Distance of each point to the nearest edge of the platform polygon."""
+        if self.polygon.isMultipart():
+            parts = self.polygon.asMultiPolygon()
+        else:
+            parts = [self.polygon.asPolygon()]
+
+        dist_sq = np.full(xs.shape, np.inf)
+        for part in parts:
+            for ring in part:
+                for a, b in zip(ring[:-1], ring[1:]):
+                    ax, ay = a.x(), a.y()
+                    dx, dy = b.x() - ax, b.y() - ay
+                    len_sq = dx * dx + dy * dy
+                    if len_sq > 0:
+                        t = np.clip(((xs - ax) * dx + (ys - ay) * dy) / len_sq, 0.0, 1.0)
+                    else:
+                        t = 0.0
+                    px = ax + t * dx - xs
+                    py = ay + t * dy - ys
+                    np.minimum(dist_sq, px * px + py * py, out=dist_sq)
+        return np.sqrt(dist_sq)
+
+    def _iter_scenarios(self, heights: np.ndarray, sweep: Optional[Dict],
+                        feedback: Optional[QgsProcessingFeedback] = None):
+        """
+        Yield (height, results) for each height of a sweep.
+
+        Uses the parallel _sweep_heights kernel on blocks of SWEEP_BLOCK_SIZE
+        heights, checking for cancellation between blocks. Falls back to
+        calculate_scenario per height if sweep is None (DEM could not be
+        prepared); failed scenarios are reported and yielded with results None.
+        """
+        if sweep is None:
+            for height in heights:
+                if feedback and feedback.isCanceled():
+                    return
+                try:
+                    yield height, self.calculate_scenario(height, feedback)
+                except Exception as e:
+                    self.logger.error(f"Error calculating scenario h={height:.1f}m: {e}")
+                    if feedback:
+                        feedback.reportError(f"Error at height {height:.1f}m: {e}", fatalError=False)
+                    yield height, None
+            return
+
+        terrain_min, terrain_max = sweep['terrain_stats'][:2]
+        for start in range(0, len(heights), SWEEP_BLOCK_SIZE):
+            if feedback and feedback.isCanceled():
+                return
+            block = heights[start:start + SWEEP_BLOCK_SIZE]
+            volumes = _sweep_heights(
+                sweep['elevations'], sweep['inside'], sweep['distances'], block,
+                terrain_min, terrain_max, sweep['tan_slope'], self.pixel_area
+            )
+            for j, height in enumerate(block):
+                platform_cut, platform_fill, slope_cut, slope_fill, slope_width = (
+                    float(values[j]) for values in volumes
+                )
+                total_area = self.polygon.buffer(slope_width, 16).area()
+                yield height, self._build_results(
+                    height, sweep['terrain_stats'],
+                    platform_cut, platform_fill, slope_cut, slope_fill,
+                    slope_width, total_area
+                )
+
     def find_optimum(self, min_height: float, max_height: float, step: float = 0.1,
                     feedback: Optional[QgsProcessingFeedback] = None) -> Tuple[float, Dict]:
         """
         Find optimal platform height that minimizes earthwork.
 
+        Total earthwork is (close to) convex in the platform height, so
+        instead of evaluating every step the search evaluates a coarse grid
+        of GRID_POINTS heights, brackets its minimum and narrows the bracket
+        by golden-section search down to single steps. The result is a
+        height of the regular step grid, found with O(log n) evaluations.
+
+        When the DEM could be prepared for the sweep kernel, the remaining
+        heights are evaluated as well (one cheap kernel pass), so
+        optimization['all_results'] holds the full sweep and the optimum is
+        taken over all steps. Without the kernel only the searched heights
+        are evaluated and listed.
+
         Args:
             min_height (float): Minimum height to test (m above sea level)
             max_height (float): Maximum height to test (m above sea level)
@@ -349,60 +616,73 @@ class EarthworkCalculator:
         )
 
         heights = np.arange(min_height, max_height + step, step)
-        num_scenarios = len(heights)
+        num_candidates = len(heights)
 
-        self.logger.info(f"Testing {num_scenarios} height scenarios")
+        self.logger.info(f"Searching {num_candidates} candidate heights")
 
         if feedback:
-            feedback.pushInfo(f"Testing {num_scenarios} height scenarios...")
-
-        best_height = None
-        best_volume = float('inf')
-        best_results = None
-
-        all_results = []
-
-        for i, height in enumerate(heights):
+            feedback.pushInfo(f"Searching {num_candidates} candidate heights...")
+
+        sweep = self._prepare_height_sweep(heights)
+        evaluated = {}  # height index -> results (None if the scenario failed)
+
+        def evaluate(indices):
+            todo = sorted(set(int(i) for i in indices) - evaluated.keys())
+            if todo:
+                scenarios = self._iter_scenarios(heights[todo], sweep, feedback)
+                for i, (_, results) in zip(todo, scenarios):
+                    evaluated[i] = results
+
+        def rank(i):
+            # Least total volume; tie-breaker: smaller net volume (balanced cut/fill)
+            results = evaluated.get(i)
+            if results is None:
+                return (float('inf'), float('inf'), i)
+            return (results['total_volume_moved'], abs(results['net_volume']), i)
+
+        # Coarse grid, then bracket its minimum by the neighbouring grid points
+        grid = np.unique(np.linspace(0, num_candidates - 1, min(num_candidates, GRID_POINTS)).round())
+        evaluate(grid)
+        for i in grid:
+            if feedback and evaluated.get(int(i)) is not None:
+                feedback.pushInfo(
+                    f"  h={heights[int(i)]:.1f}m, "
+                    f"volume={evaluated[int(i)]['total_volume_moved']:.0f}m³"
+                )
+        pos = min(range(len(grid)), key=lambda k: rank(int(grid[k])))
+        lo = int(grid[max(pos - 1, 0)])
+        hi = int(grid[min(pos + 1, len(grid) - 1)])
+
+        # Golden-section search on the step grid inside [lo, hi]
+        while hi - lo > 2:
             if feedback and feedback.isCanceled():
                 break
+            offset = max(1, int(round((hi - lo) * (1.0 - _INV_PHI))))
+            m1, m2 = lo + offset, hi - offset
+            if m1 >= m2:
+                break
+            evaluate((m1, m2))
+            if rank(m1) <= rank(m2):
+                hi = m2
+            else:
+                lo = m1
+            if feedback:
+                feedback.setProgress(int(100 * (1 - (hi - lo) / max(num_candidates - 1, 1))))
+        evaluate(range(lo, hi + 1))
+        num_scenarios = len(evaluated)
 
-            # Calculate scenario
-            try:
-                results = self.calculate_scenario(height, feedback)
-                all_results.append(results)
-
-                # Check if this is better than current best
-                total_volume = results['total_volume_moved']
-
-                if total_volume < best_volume:
-                    best_volume = total_volume
-                    best_height = height
-                    best_results = results
-                elif total_volume == best_volume:
-                    # Tie-breaker: prefer smaller net volume (balanced cut/fill)
-                    if abs(results['net_volume']) < abs(best_results['net_volume']):
-                        best_height = height
-                        best_results = results
-
-                # Progress update
-                if feedback and i % 10 == 0:
-                    progress = int((i / num_scenarios) * 100)
-                    feedback.setProgress(progress)
-                    feedback.pushInfo(
-                        f"  {i}/{num_scenarios}: h={height:.1f}m, "
-                        f"volume={total_volume:.0f}m³"
-                    )
-
-            except Exception as e:
-                self.logger.error(f"Error calculating scenario h={height:.1f}m: {e}")
-                if feedback:
-                    feedback.reportError(f"Error at height {height:.1f}m: {e}", fatalError=False)
+        # Full sweep for all_results; the kernel makes the remaining steps cheap
+        if sweep is not None and not (feedback and feedback.isCanceled()):
+            evaluate(range(num_candidates))
+
+        best_index = min(evaluated, key=rank, default=None)
+        best_results = evaluated.get(best_index) if best_index is not None else None
 
         if best_results is None:
             error_msg = (
                 f"Keine gültigen Szenarien gefunden!\n"
                 f"Höhenbereich: {min_height:.2f} - {max_height:.2f} m ü.NN\n"
-                f"Getestete Höhen: {num_scenarios}\n"
+                f"Getestete Höhen: {len(evaluated)}\n"
                 f"Mögliche Ursachen:\n"
                 f"  - Suchbereich zu klein\n"
                 f"  - DGM-Daten außerhalb des gültigen Bereichs\n"
@@ -411,6 +691,10 @@ class EarthworkCalculator:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
+        best_height = heights[best_index]
+        best_volume = best_results['total_volume_moved']
+        all_results = [evaluated[i] for i in sorted(evaluated) if evaluated[i] is not None]
+
         self.logger.info(
             f"Optimization complete: optimal height = {best_height:.2f}m, "
             f"total volume = {best_volume:.0f}m³"
@@ -425,6 +709,7 @@ class EarthworkCalculator:
         # Add optimization info to results
         best_results['optimization'] = {
             'num_scenarios': num_scenarios,
+            'num_candidates': num_candidates,
             'height_range': (min_height, max_height),
             'step': step,
             'all_results': all_results
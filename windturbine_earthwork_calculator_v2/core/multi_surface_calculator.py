@@ -25,6 +25,7 @@ import multiprocessing as mp
 from qgis.core import (
     QgsRasterLayer,
     QgsGeometry,
+    QgsGeometryEngine,
     QgsPointXY,
     QgsProcessingFeedback,
     QgsRectangle
@@ -59,7 +60,8 @@ from ..utils.geometry_utils import (
     calculate_slope_height,
     perpendicular_direction,
     calculate_terrain_slope,
-    get_polygon_orientation
+    get_polygon_orientation,
+    prepared_engine
 )
 from ..utils.geometry_3d import (
     polygon_to_polygonz,
@@ -668,7 +670,9 @@ class MultiSurfaceCalculator:
             return (-max_slope, max_slope)
 
         # Sample terrain in boom area
-        samples = self.sample_dem_with_positions(self.project.boom.geometry)
+        samples = self.sample_dem_with_positions(
+            self.project.boom.geometry, self.project.boom.engine
+        )
 
         if len(samples) < 5:
             self.logger.warning("Insufficient samples for slope direction detection, using full range")
@@ -751,7 +755,9 @@ class MultiSurfaceCalculator:
             return self.project.road_slope_percent
 
         # Sample terrain in road area
-        samples = self.sample_dem_with_positions(self.project.road_access.geometry)
+        samples = self.sample_dem_with_positions(
+            self.project.road_access.geometry, self.project.road_access.engine
+        )
 
         if len(samples) < 5:
             self.logger.warning("Insufficient samples for road slope direction detection")
@@ -999,6 +1005,7 @@ class MultiSurfaceCalculator:
         Returns:
             Array of elevation values (flattened)
         """
+        engine = prepared_engine(geometry)
         bbox = geometry.boundingBox()
 
         # Calculate pixel indices
@@ -1044,23 +1051,30 @@ class MultiSurfaceCalculator:
                 point_geom = QgsGeometry.fromPointXY(point)
 
                 # Check if point is within geometry
-                if geometry.contains(point_geom):
+                if engine.contains(point_geom.constGet()):
                     value = block.value(row, col)
                     if not block.isNoData(row, col) and value is not None:
                         elevations.append(float(value))
 
         return np.array(elevations, dtype=float)
 
-    def sample_dem_with_positions(self, geometry: QgsGeometry) -> list[tuple[QgsPointXY, float]]:
+    def sample_dem_with_positions(self, geometry: QgsGeometry,
+                                  engine: Optional[QgsGeometryEngine] = None
+                                  ) -> list[tuple[QgsPointXY, float]]:
         """
         Sample DEM values within a polygon with position information.
 
         Args:
             geometry: Polygon to sample
+            engine: Prepared engine for geometry (e.g. SurfaceConfig.engine);
+                    prepared here if not given
 
         Returns:
             List of (point, elevation) tuples
         """
+        if engine is None:
+            engine = prepared_engine(geometry)
+
         bbox = geometry.boundingBox()
 
         # Calculate pixel indices
@@ -1104,7 +1118,7 @@ class MultiSurfaceCalculator:
                 point_geom = QgsGeometry.fromPointXY(point)
 
                 # Check if point is within geometry
-                if geometry.contains(point_geom):
+                if engine.contains(point_geom.constGet()):
                     value = block.value(row, col)
                     if not block.isNoData(row, col) and value is not None:
                         samples.append((point, float(value)))
@@ -1146,7 +1160,7 @@ class MultiSurfaceCalculator:
                 target_height=self.project.fok,
                 cut_volume=0.0,
                 fill_volume=0.0,
-                platform_area=self.project.foundation.geometry.area(),
+                platform_area=self.project.foundation.area,
                 additional_data={
                     'foundation_bottom': round(self.project.foundation_bottom_elevation, 2),
                     'foundation_depth': round(self.project.foundation_depth, 2),
@@ -1173,9 +1187,9 @@ class MultiSurfaceCalculator:
 
         # Minimal fill (for reference - actual fill is concrete)
         # Just the volume of the foundation itself as placeholder
-        fill_volume_ref = self.project.foundation.geometry.area() * self.project.foundation_depth * 0.1
+        fill_volume_ref = self.project.foundation.area * self.project.foundation_depth * 0.1
 
-        area = self.project.foundation.geometry.area()
+        area = self.project.foundation.area
 
         self.logger.info(
             f"Foundation: cut={cut_volume:.1f}m³, "
@@ -1228,7 +1242,7 @@ class MultiSurfaceCalculator:
                 target_height=crane_height,
                 cut_volume=0.0,
                 fill_volume=0.0,
-                platform_area=self.project.crane_pad.geometry.area(),
+                platform_area=self.project.crane_pad.area,
                 additional_data={
                     'gravel_thickness': self.project.gravel_thickness,
                     'planum_height': round(crane_height - self.project.gravel_thickness, 2),
@@ -1281,7 +1295,7 @@ class MultiSurfaceCalculator:
         total_cut = cut_volume + slope_cut
         total_fill = fill_volume + slope_fill
 
-        area = self.project.crane_pad.geometry.area()
+        area = self.project.crane_pad.area
         total_area = slope_polygon.area()
 
         self.logger.info(
@@ -1356,7 +1370,9 @@ class MultiSurfaceCalculator:
             )
 
         # Sample terrain with positions
-        samples = self.sample_dem_with_positions(self.project.boom.geometry)
+        samples = self.sample_dem_with_positions(
+            self.project.boom.geometry, self.project.boom.engine
+        )
 
         if len(samples) == 0:
             self.logger.warning("No DEM data in boom area")
@@ -1365,7 +1381,7 @@ class MultiSurfaceCalculator:
                 target_height=crane_height,
                 cut_volume=0.0,
                 fill_volume=0.0,
-                platform_area=self.project.boom.geometry.area(),
+                platform_area=self.project.boom.area,
                 additional_data={
                     'slope_percent': boom_slope_percent if boom_slope_percent is not None else self.project.boom.slope_longitudinal,
                     'slope_direction': round(self.boom_slope_direction, 1),
@@ -1490,7 +1506,7 @@ class MultiSurfaceCalculator:
         total_cut = cut_volume + slope_cut
         total_fill = fill_volume + slope_fill
 
-        area = self.project.boom.geometry.area()
+        area = self.project.boom.area
         total_area = slope_polygon.area()
 
         self.logger.info(
@@ -1568,7 +1584,9 @@ class MultiSurfaceCalculator:
             rotor_height = crane_height + self.project.rotor_height_offset
 
         # Sample terrain with positions
-        samples = self.sample_dem_with_positions(self.project.rotor_storage.geometry)
+        samples = self.sample_dem_with_positions(
+            self.project.rotor_storage.geometry, self.project.rotor_storage.engine
+        )
 
         if len(samples) == 0:
             self.logger.warning("No DEM data in rotor storage area")
@@ -1577,7 +1595,7 @@ class MultiSurfaceCalculator:
                 target_height=rotor_height,
                 cut_volume=0.0,
                 fill_volume=0.0,
-                platform_area=self.project.rotor_storage.geometry.area(),
+                platform_area=self.project.rotor_storage.area,
                 additional_data={
                     'height_offset_from_crane': round(rotor_height_offset if rotor_height_offset is not None else self.project.rotor_height_offset, 2),
                     'holm_fill_volume': 0.0,
@@ -1646,7 +1664,7 @@ class MultiSurfaceCalculator:
         total_cut = cut_volume + slope_cut
         total_fill_with_slope = total_fill + slope_fill
 
-        area = self.project.rotor_storage.geometry.area()
+        area = self.project.rotor_storage.area
         total_area = slope_polygon.area()
 
         holm_info = ""
@@ -1729,7 +1747,9 @@ class MultiSurfaceCalculator:
             )
 
         # Sample terrain with positions
-        samples = self.sample_dem_with_positions(self.project.road_access.geometry)
+        samples = self.sample_dem_with_positions(
+            self.project.road_access.geometry, self.project.road_access.engine
+        )
 
         if len(samples) == 0:
             self.logger.warning("No DEM data in road access area")
@@ -1738,7 +1758,7 @@ class MultiSurfaceCalculator:
                 target_height=crane_height,
                 cut_volume=0.0,
                 fill_volume=0.0,
-                platform_area=self.project.road_access.geometry.area(),
+                platform_area=self.project.road_access.area,
                 additional_data={
                     'slope_percent': road_slope_percent if road_slope_percent is not None else 0.0, # Default to 0.0 if not provided and no samples
                     'slope_direction': round(self.road_slope_direction, 1) if self.road_slope_direction else 0.0,
@@ -1836,7 +1856,7 @@ class MultiSurfaceCalculator:
         total_cut = cut_volume + slope_cut
         total_fill = fill_volume + slope_fill
 
-        area = self.project.road_access.geometry.area()
+        area = self.project.road_access.area
         total_area = slope_polygon.area()
 
         # Calculate gravel volume (external material) if enabled
@@ -1919,10 +1939,10 @@ class MultiSurfaceCalculator:
             road_slope_used = road_result.additional_data.get('slope_percent', 0.0)
 
         # Calculate gravel fill (external material)
-        gravel_crane = self.project.crane_pad.geometry.area() * self.project.gravel_thickness
+        gravel_crane = self.project.crane_pad.area * self.project.gravel_thickness
         gravel_road = 0.0
         if self.project.road_access is not None and self.project.road_gravel_enabled:
-            gravel_road = self.project.road_access.geometry.area() * self.project.road_gravel_thickness
+            gravel_road = self.project.road_access.area * self.project.road_gravel_thickness
         gravel_total = gravel_crane + gravel_road
 
         # Compile results
@@ -43,7 +43,8 @@ from ..utils.geometry_utils import (
     create_cross_sections_over_bbox,
     create_longitudinal_sections_over_bbox,
     calculate_distance_from_edge,
-    calculate_slope_height
+    calculate_slope_height,
+    prepared_engine
 )
 from ..utils.logging_utils import get_plugin_logger
 
@@ -327,6 +328,15 @@ class ProfileGenerator:
 
         self.provider = dem_layer.dataProvider()
 
+        # Prepared engines index the surface edges once; the point-in-polygon
+        # test per profile sample then no longer scans every edge
+        self._crane_engine = prepared_engine(polygon)
+        self._foundation_engine = prepared_engine(foundation_geometry) if foundation_geometry else None
+        self._boom_engine = prepared_engine(boom_geometry) if boom_geometry else None
+        self._rotor_engine = prepared_engine(rotor_geometry) if rotor_geometry else None
+        self._road_engine = prepared_engine(road_geometry) if road_geometry else None
+        self._holm_engines = [prepared_engine(holm) for holm in self.rotor_holms]
+
     def generate_auto_profiles(self, num_profiles: int = 8,
                               extension_m: float = 50.0) -> List[Dict]:
         """
@@ -596,9 +606,10 @@ class ProfileGenerator:
         road_bbox = self.road_geometry.boundingBox() if self.road_geometry else None
 
         # Pre-compute holm bounding boxes
-        holm_bboxes = []
-        if self.rotor_holms:
-            holm_bboxes = [(holm, holm.boundingBox()) for holm in self.rotor_holms]
+        holm_bboxes = [
+            (engine, holm.boundingBox())
+            for holm, engine in zip(self.rotor_holms, self._holm_engines)
+        ]
 
         for dist in distances:
             # Interpolate point on line at distance
@@ -624,23 +635,23 @@ class ProfileGenerator:
             # PERFORMANCE OPTIMIZATION: Use bounding box pre-check before expensive .contains()
             in_foundation = (self.foundation_geometry and
                            foundation_bbox.contains(point) and
-                           self.foundation_geometry.contains(point_geom))
-            in_crane_pad = crane_bbox.contains(point) and self.polygon.contains(point_geom)
+                           self._foundation_engine.contains(point_geom.constGet()))
+            in_crane_pad = crane_bbox.contains(point) and self._crane_engine.contains(point_geom.constGet())
             in_boom = (self.boom_geometry and
                       boom_bbox.contains(point) and
-                      self.boom_geometry.contains(point_geom))
+                      self._boom_engine.contains(point_geom.constGet()))
             in_rotor = (self.rotor_geometry and
                        rotor_bbox.contains(point) and
-                       self.rotor_geometry.contains(point_geom))
+                       self._rotor_engine.contains(point_geom.constGet()))
             in_road = (self.road_geometry and
                       road_bbox.contains(point) and
-                      self.road_geometry.contains(point_geom))
+                      self._road_engine.contains(point_geom.constGet()))
 
             # Check if point is in any holm (support beam)
             # PERFORMANCE OPTIMIZATION: Use pre-computed holm bounding boxes
             if holm_bboxes:
-                for holm_geom, holm_bbox in holm_bboxes:
-                    if holm_bbox.contains(point) and holm_geom.contains(point_geom):
+                for holm_engine, holm_bbox in holm_bboxes:
+                    if holm_bbox.contains(point) and holm_engine.contains(point_geom.constGet()):
                         is_in_holm = True
                         break
 
@@ -738,8 +749,8 @@ class ProfileGenerator:
             in_holm.append(is_in_holm)
 
         # Convert to arrays
-        existing_z = np.array(existing_z, dtype=float)
-        bottom_z = np.array(bottom_z, dtype=float)
+        existing_z = np.array(existing_z, dtype=np.float32)
+        bottom_z = np.array(bottom_z, dtype=np.float32)
         crane_top_z = np.array(crane_top_z, dtype=object)  # Can contain None
         foundation_fok_z = np.array(foundation_fok_z, dtype=object)  # Can contain None
         foundation_bottom_z = np.array(foundation_bottom_z, dtype=object)  # Can contain None
@@ -1076,7 +1087,8 @@ class ProfileGenerator:
                                     volume_info: Optional[Dict] = None,
                                     feedback: Optional[QgsProcessingFeedback] = None,
                                     use_parallel: bool = True,
-                                    max_workers: int = None) -> List[Dict]:
+                                    max_workers: int = None,
+                                    executor: Optional[ProcessPoolExecutor] = None) -> List[Dict]:
         """
         Visualize multiple profile lines with unified scale.
 
@@ -1091,6 +1103,8 @@ class ProfileGenerator:
             feedback (QgsProcessingFeedback): Feedback object
             use_parallel (bool): Use parallel processing (default: True)
             max_workers (int): Maximum number of parallel workers
+            executor (ProcessPoolExecutor): Existing process pool to render in, so
+                several batches share warm workers (the caller shuts it down)
 
         Returns:
             List[Dict]: List of profile data with paths to PNG files
@@ -1140,7 +1154,7 @@ class ProfileGenerator:
             self.logger.info(f"Using parallel rendering for {len(all_profile_data)} profiles")
             return self._visualize_parallel(
                 all_profile_data, output_path, max_line_length, global_ylim,
-                vertical_exaggeration, volume_info, feedback, max_workers
+                vertical_exaggeration, volume_info, feedback, max_workers, executor
             )
         else:
             self.logger.info(f"Using sequential rendering for {len(all_profile_data)} profiles")
@@ -1195,64 +1209,82 @@ class ProfileGenerator:
 
     def _visualize_parallel(self, all_profile_data, output_path, max_line_length,
                            global_ylim, vertical_exaggeration, volume_info, feedback,
-                           max_workers=None) -> List[Dict]:
+                           max_workers=None, executor=None) -> List[Dict]:
         """Parallel profile visualization using ProcessPoolExecutor."""
+        if executor is not None:
+            self.logger.info(f"Rendering {len(all_profile_data)} profiles in parallel (shared pool)")
+            return self._render_parallel(
+                executor, all_profile_data, output_path, max_line_length, global_ylim,
+                vertical_exaggeration, volume_info, feedback
+            )
+
         if max_workers is None:
             max_workers = max(1, mp.cpu_count() - 1)
 
         self.logger.info(f"Rendering {len(all_profile_data)} profiles in parallel ({max_workers} workers)")
 
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return self._render_parallel(
+                executor, all_profile_data, output_path, max_line_length, global_ylim,
+                vertical_exaggeration, volume_info, feedback
+            )
+
+    def _render_parallel(self, executor, all_profile_data, output_path, max_line_length,
+                         global_ylim, vertical_exaggeration, volume_info, feedback) -> List[Dict]:
+        """Submit all profile plots to the executor and collect the results."""
         results = []
         completed = 0
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            futures = {}
-            for profile, profile_data in all_profile_data:
-                png_filename = f"{profile['type']}.png"
-                png_path = output_path / png_filename
-                line_length = profile.get('length', profile['geometry'].length())
+        # Submit all tasks
+        futures = {}
+        for profile, profile_data in all_profile_data:
+            png_filename = f"{profile['type']}.png"
+            png_path = output_path / png_filename
+            line_length = profile.get('length', profile['geometry'].length())
+
+            future = executor.submit(
+                _plot_single_profile,
+                profile_data,
+                str(png_path),
+                profile['type'],
+                vertical_exaggeration,
+                volume_info,
+                line_length,
+                (0, max_line_length),
+                global_ylim
+            )
+            futures[future] = (profile, profile_data, str(png_path), png_filename)
 
-                future = executor.submit(
-                    _plot_single_profile,
-                    profile_data,
-                    str(png_path),
-                    profile['type'],
-                    vertical_exaggeration,
-                    volume_info,
-                    line_length,
-                    (0, max_line_length),
-                    global_ylim
-                )
-                futures[future] = (profile, profile_data, str(png_path), png_filename)
-
-            # Process results as they complete
-            for future in as_completed(futures):
-                profile, profile_data, png_path, png_filename = futures[future]
-                completed += 1
-
-                if feedback and feedback.isCanceled():
-                    self.logger.info("Profile rendering cancelled by user")
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    break
-
-                try:
-                    _ = future.result()
-
-                    profile['data'] = profile_data
-                    profile['png_path'] = png_path
-                    results.append(profile)
-
-                    if feedback:
-                        feedback.pushInfo(f"  ✓ [{completed}/{len(all_profile_data)}] {png_filename}")
-
-                except Exception as e:
-                    self.logger.error(f"Failed to generate profile {profile['type']}: {e}")
-                    if feedback:
-                        feedback.reportError(
-                            f"Error generating profile {profile['type']}: {e}",
-                            fatalError=False
-                        )
+        # Process results as they complete
+        for future in as_completed(futures):
+            profile, profile_data, png_path, png_filename = futures[future]
+            completed += 1
+
+            if feedback and feedback.isCanceled():
+                self.logger.info("Profile rendering cancelled by user")
+                # The executor may be shared with other batches: only drop
+                # this batch's pending tasks, the owner shuts the pool down
+                for pending in futures:
+                    pending.cancel()
+                break
+
+            try:
+                _ = future.result()
+
+                profile['data'] = profile_data
+                profile['png_path'] = png_path
+                results.append(profile)
+
+                if feedback:
+                    feedback.pushInfo(f"  ✓ [{completed}/{len(all_profile_data)}] {png_filename}")
+
+            except Exception as e:
+                self.logger.error(f"Failed to generate profile {profile['type']}: {e}")
+                if feedback:
+                    feedback.reportError(
+                        f"Error generating profile {profile['type']}: {e}",
+                        fatalError=False
+                    )
 
         self.logger.info(f"Generated {len(results)}/{len(all_profile_data)} profile visualizations (parallel)")
         return results
@@ -8,155 +8,37 @@ Version: 2.0.0
 """
 
 import base64
+import codecs
+import hashlib
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Final, List, Optional, Tuple, Union
 
 from qgis.core import (
     QgsGeometry,
     QgsRasterLayer,
     QgsPointXY,
     QgsMapSettings,
-    QgsMapRendererCustomPainterJob,
+    QgsMapRendererParallelJob,
     QgsVectorLayer,
     QgsRectangle,
     QgsCoordinateReferenceSystem,
     QgsProject
 )
 from qgis.PyQt.QtGui import QImage, QPainter, QColor, QPen
-from qgis.PyQt.QtCore import QSize, QRect, Qt
+from qgis.PyQt.QtCore import QBuffer, QByteArray, QIODevice, QSize, QRect, Qt
 
 from ..utils.geometry_utils import get_centroid
 from ..utils.logging_utils import get_plugin_logger
 from .uncertainty import UncertaintyAnalysisResult
 
 
-class ReportGenerator:
-    """
-    Generates professional HTML reports for wind turbine earthwork calculations.
-
-    The report includes:
-    - Project summary and parameters
-    - Optimization results
-    - Volume calculations
-    - Terrain profile images
-    - Site map (optional)
-    """
-
-    def __init__(self, results: Dict, polygon: QgsGeometry,
-                 dem_layer: Optional[QgsRasterLayer] = None,
-                 platform_layer: Optional[QgsVectorLayer] = None,
-                 foundation_layer: Optional[QgsVectorLayer] = None,
-                 boom_layer: Optional[QgsVectorLayer] = None,
-                 rotor_layer: Optional[QgsVectorLayer] = None,
-                 road_access_layer: Optional[QgsVectorLayer] = None,
-                 profile_lines_layer: Optional[QgsVectorLayer] = None,
-                 dxf_layer: Optional[QgsVectorLayer] = None,
-                 uncertainty_result: Optional[UncertaintyAnalysisResult] = None):
-        """
-        Initialize report generator.
-
-        Args:
-            results (Dict): Optimization results from EarthworkCalculator
-            polygon (QgsGeometry): Platform polygon geometry
-            dem_layer (QgsRasterLayer): DEM layer (optional, for map generation)
-            platform_layer (QgsVectorLayer): Platform/crane pad polygon layer (optional)
-            foundation_layer (QgsVectorLayer): Foundation polygon layer (optional)
-            boom_layer (QgsVectorLayer): Boom surface polygon layer (optional)
-            rotor_layer (QgsVectorLayer): Rotor storage polygon layer (optional)
-            road_access_layer (QgsVectorLayer): Road access polygon layer (optional)
-            profile_lines_layer (QgsVectorLayer): Profile lines layer (optional)
-            dxf_layer (QgsVectorLayer): DXF import layer (optional)
-            uncertainty_result (UncertaintyAnalysisResult): Monte Carlo uncertainty results (optional)
-        """
-        self.results = results
-        self.polygon = polygon
-        self.dem_layer = dem_layer
-        self.platform_layer = platform_layer
-        self.foundation_layer = foundation_layer
-        self.boom_layer = boom_layer
-        self.rotor_layer = rotor_layer
-        self.road_access_layer = road_access_layer
-        self.profile_lines_layer = profile_lines_layer
-        self.dxf_layer = dxf_layer
-        self.uncertainty_result = uncertainty_result
-        self.logger = get_plugin_logger()
-
-        # Get centroid coordinates
-        centroid = get_centroid(polygon)
-        self.centroid_x = centroid.x()
-        self.centroid_y = centroid.y()
-
-    def generate_html(self, output_path: str, profile_pngs: Optional[List[str]] = None,
-                     config: Optional[Dict] = None, profiles_dir: Optional[str] = None):
-        """
-        Generate complete HTML report.
-
-        Args:
-            output_path (str): Path to save HTML file
-            profile_pngs (List[str]): Paths to profile PNG files (optional)
-            config (Dict): Configuration parameters (optional)
-            profiles_dir (str): Directory where profiles are saved (for overview map)
-        """
-        self.logger.info(f"Generating HTML report: {output_path}")
-
-        # Generate overview map if layers are available
-        overview_map_path = None
-        has_any_layer = (self.platform_layer or self.foundation_layer or
-                        self.boom_layer or self.rotor_layer or
-                        self.profile_lines_layer or self.dxf_layer)
-        if profiles_dir and has_any_layer:
-            try:
-                overview_map_path = str(Path(profiles_dir) / "overview_map.png")
-                self._generate_overview_map(overview_map_path, scale=3000)
-            except Exception as e:
-                self.logger.error(f"Failed to generate overview map: {e}")
-
-        # Generate HTML sections
-        html_header = self._generate_header()
-        html_summary = self._generate_summary()
-        html_parameters = self._generate_parameters(config)
-        html_results = self._generate_results()
-        html_uncertainty = self._generate_uncertainty_section()
-        html_stabilization = self._generate_stabilization_section()
-        html_quality = self._generate_quality_assurance_section() if self.results.get('stabilization') else ""
-        html_overview = self._generate_overview_section(overview_map_path)
-        html_profiles = self._generate_profiles_section(profile_pngs)
-        html_footer = self._generate_footer()
-
-        # Combine all sections
-        html_content = f"""<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Erdmassenberechnung Windenergieanlagen</title>
-    {self._get_css_styles()}
-</head>
-<body>
-    {html_header}
-    <div class="container">
-        {html_summary}
-        {html_parameters}
-        {html_results}
-        {html_uncertainty}
-        {html_stabilization}
-        {html_quality}
-        {html_overview}
-        {html_profiles}
-    </div>
-    {html_footer}
-</body>
-</html>
-"""
-
-        # Write to file
-        Path(output_path).write_text(html_content, encoding='utf-8')
-        self.logger.info(f"HTML report generated: {output_path}")
-
-    def _get_css_styles(self) -> str:
-        """Get CSS styles for the report."""
-        return """
+# Static report fragments. None of these depend on the generator state, so
+# they are built once at import instead of on every report.
+_CSS_STYLES: Final[str] = """
     <style>
         body {
             font-family: Arial, sans-serif;
@@ -294,23 +176,543 @@ class ReportGenerator:
     </style>
 """
 
-    def _generate_header(self) -> str:
-        """Generate HTML header section."""
-        return f"""
+_HEADER_TEMPLATE: Final[str] = """
     <div class="header">
         <h1>🌬️ Erdmassenberechnung Windenergieanlagen</h1>
         <p>Professioneller Bericht zur Plattformhöhen-Optimierung</p>
-        <p style="font-size: 0.9rem;">Erstellt am: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}</p>
+        <p style="font-size: 0.9rem;">Erstellt am: {timestamp}</p>
+    </div>
+"""
+
+_FOOTER_TEMPLATE: Final[str] = """
+    <div class="footer">
+        <p>Erdmassenberechnung Windenergieanlagen V2.0.0</p>
+        <p>Erstellt mit QGIS Processing Plugin</p>
+        <p style="font-size: 0.8rem;">Bericht erstellt am: {timestamp}</p>
+    </div>
+"""
+
+# Document frame around the generated sections, pre-encoded once
+_DOCUMENT_HEAD: Final[bytes] = ("""<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Erdmassenberechnung Windenergieanlagen</title>
+    """ + _CSS_STYLES + """
+</head>
+<body>
+    """).encode('utf-8')
+
+_DOCUMENT_TAIL: Final[bytes] = b"""
+</body>
+</html>
+"""
+
+# Static fragments between and inside the streamed sections, pre-encoded once
+_CONTAINER_OPEN: Final[bytes] = b"""
+    <div class="container">
+        """
+
+_SECTION_SEPARATOR: Final[bytes] = b"""
+        """
+
+_CONTAINER_CLOSE: Final[bytes] = b"""
+    </div>
+    """
+
+_PROFILES_SECTION_HEAD: Final[bytes] = """
+    <div class="section">
+        <h2>📉 Geländeschnitte</h2>
+        <p>Querschnitte mit bestehendem Gelände, geplanter Plattform und Abtrag/Auftrag-Bereichen.</p>
+        <div class="profile-grid">
+            """.encode('utf-8')
+
+_PROFILES_SECTION_TAIL: Final[bytes] = b"""
+        </div>
     </div>
 """
 
+_PROFILES_SECTION_EMPTY: Final[bytes] = """
+    <div class="section">
+        <h2>📉 Geländeschnitte</h2>
+        <p>Keine Profilbilder verfügbar.</p>
+    </div>
+""".encode('utf-8')
+
+_PROFILES_SECTION_FAILED: Final[bytes] = """
+    <div class="section">
+        <h2>📉 Geländeschnitte</h2>
+        <p>Fehler beim Laden der Profilbilder.</p>
+    </div>
+""".encode('utf-8')
+
+_PROFILE_ITEM_HEAD: Final[bytes] = b"""
+            <div class="profile-item">
+                <img src="data:image/png;base64,"""
+
+_OVERVIEW_SECTION_HEAD: Final[bytes] = """
+    <div class="section">
+        <h2>🗺️ Lageplan</h2>
+        <div style="text-align: center;">
+            <img src="data:image/png;base64,""".encode('utf-8')
+
+# Stabilization section templates, filled via str.format_map()
+_LIME_TMPL: Final[str] = """
+        <h3>Kalkstabilisierung</h3>
+        <table>
+            <tr>
+                <th>Parameter</th>
+                <th>Wert</th>
+                <th>Einheit</th>
+            </tr>
+            <tr>
+                <td>Dosierung (% Masse)</td>
+                <td>{percentage:.1f}</td>
+                <td>%</td>
+            </tr>
+            <tr>
+                <td>Flächenspezifisch</td>
+                <td>{kg_per_m2:.1f}</td>
+                <td>kg/m²</td>
+            </tr>
+            <tr>
+                <td>Volumenbezogen</td>
+                <td>{kg_per_m3:.1f}</td>
+                <td>kg/m³</td>
+            </tr>
+            <tr>
+                <td>Gesamtmenge</td>
+                <td>{total_lime_tons:.1f}</td>
+                <td>Tonnen</td>
+            </tr>
+            <tr>
+                <td>Behandlungstiefe</td>
+                <td>{treatment_depth_cm:.0f}</td>
+                <td>cm</td>
+            </tr>
+            <tr>
+                <td>Erwarteter Ev2 nach Behandlung</td>
+                <td>{expected_ev2_after:.1f}</td>
+                <td>MN/m²</td>
+            </tr>
+        </table>
+        """
+
+_NO_LIME_HTML: Final[str] = """
+        <p><i>Keine Kalkstabilisierung erforderlich (Ev2 ≥ 45 MN/m²)</i></p>
+        """
+
+_GRAVEL_TMPL: Final[str] = """
+        <h3>Schottertragschicht</h3>
+        <table>
+            <tr>
+                <th>Parameter</th>
+                <th>Wert</th>
+                <th>Einheit</th>
+            </tr>
+            <tr>
+                <td>Schichtdicke (verdichtet)</td>
+                <td>{thickness_cm:.0f}</td>
+                <td>cm</td>
+            </tr>
+            <tr>
+                <td>Volumen verdichtet</td>
+                <td>{compacted_volume_m3:.1f}</td>
+                <td>m³</td>
+            </tr>
+            <tr>
+                <td>Volumen lose (Auflockerung 1,15)</td>
+                <td>{loose_volume_m3:.1f}</td>
+                <td>m³</td>
+            </tr>
+            <tr>
+                <td>Masse (Rohdichte 2,1 t/m³)</td>
+                <td>{mass_tons:.0f}</td>
+                <td>Tonnen</td>
+            </tr>
+            <tr>
+                <td>Flächenspezifisch</td>
+                <td>{area_specific_kg_m2:.0f}</td>
+                <td>kg/m²</td>
+            </tr>
+        </table>
+        """
+
+_STABILIZATION_TMPL: Final[str] = """
+    <div class="section">
+        <h2>🏗️ Bodenstabilisierung und Materialmengen</h2>
+
+        <div class="grid">
+            <div class="card">
+                <h3>Bodenart</h3>
+                <div class="value">{soil_type}</div>
+            </div>
+            <div class="card">
+                <h3>Ausgangs-Ev2</h3>
+                <div class="value">{initial_ev2:.1f}</div>
+                <div class="unit">MN/m²</div>
+            </div>
+            <div class="card">
+                <h3>Ev2 nach Behandlung</h3>
+                <div class="value">{ev2_after_lime:.1f}</div>
+                <div class="unit">MN/m²</div>
+            </div>
+            <div class="card">
+                <h3>Finaler Ev2 (erwartet)</h3>
+                <div class="value">{final_ev2_expected:.1f}</div>
+                <div class="unit">MN/m²</div>
+            </div>
+        </div>
+
+        {lime_html}
+        {gravel_html}
+        {notes_html}
+    </div>
+    """
+
+# Display text per stabilization reliability rating
+_RELIABILITY_TEXT: Final[Dict[str, str]] = {
+    'high': 'Hoch - Berechnung basiert auf Standardwerten nach DIN/ZTV',
+    'medium': 'Mittel - Standortspezifische Prüfung empfohlen',
+    'low': 'Niedrig - Eignungsprüfung zwingend erforderlich'
+}
+
+_QA_STATIC_HTML: Final[str] = """
+        <h3>Wichtige Randbedingungen</h3>
+        <ul>
+            <li><strong>Standortvariabilität:</strong> Alle Werte sind typische Bereiche.
+                Standortspezifische Eignungsprüfungen nach TP BF-StB obligatorisch vor Ausführung.</li>
+            <li><strong>Feuchteempfindlichkeit:</strong> Bindige Bodenparameter stark wassergehaltsabhängig.
+                Ev2 kann bei Durchfeuchtung um 30-60% abfallen. Drainage und Oberflächenentwässerung kritisch.</li>
+            <li><strong>Verdichtungsqualität:</strong> Erreichbare Ev2-Werte abhängig von korrekter Verdichtungstechnik.
+                Plattendruckversuche nach DIN 18134 alle 200-500m² erforderlich.</li>
+            <li><strong>Zeitfaktoren:</strong> Kalkstabilisierung benötigt 7-28 Tage für volle Festigkeitsentwicklung.
+                Frosteinwirkung während Erhärtung vermeiden (Verarbeitung nur bei >5°C).</li>
+            <li><strong>Mischbinder-Optimierung:</strong> Kombinierte Kalk/Zement-Bindemittel oft leistungsfähiger,
+                besonders bei gemischkörnigen Böden.</li>
+        </ul>
+
+        <h3>Datenqualität und Prüfanforderungen</h3>
+
+        <h4>Hohe Zuverlässigkeit:</h4>
+        <ul>
+            <li>Ev2-Bereiche nach DIN-Standards</li>
+            <li>Verdichtungsfaktoren aus ZTV E-StB</li>
+            <li>Schotterdicken nach RStO 12</li>
+        </ul>
+
+        <h4>Mittlere Zuverlässigkeit (Eignungsprüfung erforderlich):</h4>
+        <ul>
+            <li>Kalkdosierungen (bodenabhängig)</li>
+            <li>Ev2-Verbesserungsfaktoren (2-5×, stark streuend)</li>
+            <li>Wassergehaltseinfluß</li>
+        </ul>
+
+        <h4>Standortspezifisch zu prüfen:</h4>
+        <ul>
+            <li>Exakte Ev2-Werte (nur durch Plattendruckversuch DIN 18134)</li>
+            <li>Detaillierte Plastizitätswerte (Laboruntersuchung)</li>
+            <li>Langzeitfestigkeit (zeitabhängig)</li>
+            <li>Frostsicherheit (Frost-Tau-Wechsel-Test)</li>
+        </ul>
+
+        <h3>Empfohlene Prüfungen</h3>
+        <table>
+            <tr>
+                <th>Prüfung</th>
+                <th>Norm/Richtlinie</th>
+                <th>Phase</th>
+            </tr>
+            <tr>
+                <td>Bodenkennwerte (Korngrößenverteilung, Plastizität)</td>
+                <td>DIN 18196</td>
+                <td>Planung</td>
+            </tr>
+            <tr>
+                <td>Eignungsprüfung Bodenverfestigung</td>
+                <td>TP BF-StB Teil B 11.1</td>
+                <td>Planung</td>
+            </tr>
+            <tr>
+                <td>Proctor-Versuch</td>
+                <td>DIN 18127</td>
+                <td>Planung</td>
+            </tr>
+            <tr>
+                <td>Probefeld (verschiedene Dosierungen)</td>
+                <td>ZTV E-StB</td>
+                <td>Vor Ausführung</td>
+            </tr>
+            <tr>
+                <td>Plattendruckversuch (Ev2)</td>
+                <td>DIN 18134</td>
+                <td>Ausführung/Abnahme</td>
+            </tr>
+            <tr>
+                <td>Dynamischer Plattendruckversuch (Evd)</td>
+                <td>TP BF-StB Teil B 8.3</td>
+                <td>Ausführung</td>
+            </tr>
+        </table>
+
+        <div class="highlight-box">
+            <h4>📌 Wichtiger Hinweis</h4>
+            <p>Diese Berechnungen dienen der <strong>Vordimensionierung und Kostenschätzung</strong>.
+            Vor Bauausführung sind zwingend erforderlich:</p>
+            <ul>
+                <li>Baugrundgutachten mit Plattendruckversuchen</li>
+                <li>Eignungsprüfung der Bindemittel nach TP BF-StB</li>
+                <li>Probefelder zur Dosierungsoptimierung</li>
+                <li>Qualitätskontrolle während der Ausführung</li>
+            </ul>
+        </div>
+    </div>
+    """
+
+
+# Read size for base64 streaming; a multiple of 3 so that encoded chunks
+# concatenate without padding in between.
+_B64_CHUNK_SIZE: Final[int] = 48 * 1024
+
+# Upper bound for concurrent profile image encoding
+_MAX_ENCODE_WORKERS: Final[int] = 8
+
+# Number format specs shared by the per-surface table rows
+_FMT_INT_GROUPED: Final[str] = ',.0f'
+_FMT_1DP_GROUPED: Final[str] = ',.1f'
+_FMT_1DP: Final[str] = '.1f'
+_FMT_2DP: Final[str] = '.2f'
+
+# Name patterns (lowercase) used to pick background layers from the project
+_BACKGROUND_LAYER_PATTERNS: Final[Dict[str, re.Pattern]] = {
+    'dgm': re.compile('dgm|höhenlinien|contour'),
+    'kataster': re.compile('kataster|flurstück'),
+    'luftbild': re.compile('luftbild|orthophoto|aerial'),
+    'basemap': re.compile('osm|openstreetmap|xyz|basemap|hintergrund'),
+}
+
+# Attribution labels for the background layer groups above
+_BACKGROUND_SOURCE_LABELS: Final[Dict[str, str]] = {
+    'dgm': 'DGM/Höhenmodell',
+    'kataster': 'Kataster/Flurstücke',
+    'luftbild': 'Luftbild',
+    'basemap': 'Basiskarte',
+}
+
+# Overview renders of this QGIS session, keyed by _overview_cache_key() and
+# evicted least recently used. Kept in memory so nothing is left behind in
+# the user's workspace.
+_OVERVIEW_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_OVERVIEW_CACHE_MAX_ENTRIES: Final[int] = 8
+
+
+def _join_tokens(tokens: List[Union[str, bytes]]) -> str:
+    """Join HTML tokens into one string, decoding pre-encoded fragments."""
+    return ''.join(t if isinstance(t, str) else t.decode('utf-8') for t in tokens)
+
+
+def _append_b64(out: List[str], path: Path) -> None:
+    """
+    Append the base64 encoding of a file to an output buffer chunk by chunk.
+
+    Avoids holding the raw file, the encoded bytes and the decoded string
+    in memory at the same time for large PNGs.
+
+    Args:
+        out (List[str]): Output buffer to append encoded chunks to
+        path (Path): File to encode
+    """
+    with open(path, 'rb') as f:
+        while chunk := f.read(_B64_CHUNK_SIZE):
+            out.append(base64.b64encode(chunk).decode('ascii'))
+
+
+def _encode_png_file(path: str) -> Tuple[List[str], Optional[Exception]]:
+    """
+    Base64-encode an image file for embedding, capturing any error.
+
+    Empty files are not opened and yield an empty chunk list.
+
+    Args:
+        path (str): Image file path
+
+    Returns:
+        Tuple[List[str], Optional[Exception]]: Encoded chunks and the error
+            raised while reading, if any
+    """
+    chunks = []
+    try:
+        png_file = Path(path)
+        if png_file.stat().st_size > 0:
+            _append_b64(chunks, png_file)
+    except Exception as e:
+        return [], e
+    return chunks, None
+
+
+def _append_b64_bytes(out: List[str], data: bytes) -> None:
+    """
+    Append the base64 encoding of in-memory data to an output buffer.
+
+    Args:
+        out (List[str]): Output buffer to append encoded chunks to
+        data (bytes): Data to encode
+    """
+    view = memoryview(data)
+    for offset in range(0, len(view), _B64_CHUNK_SIZE):
+        out.append(base64.b64encode(view[offset:offset + _B64_CHUNK_SIZE]).decode('ascii'))
+
+
+class ReportGenerator:
+    """
+    Generates professional HTML reports for wind turbine earthwork calculations.
+
+    The report includes:
+    - Project summary and parameters
+    - Optimization results
+    - Volume calculations
+    - Terrain profile images
+    - Site map (optional)
+    """
+
+    def __init__(self, results: Dict, polygon: QgsGeometry,
+                 dem_layer: Optional[QgsRasterLayer] = None,
+                 platform_layer: Optional[QgsVectorLayer] = None,
+                 foundation_layer: Optional[QgsVectorLayer] = None,
+                 boom_layer: Optional[QgsVectorLayer] = None,
+                 rotor_layer: Optional[QgsVectorLayer] = None,
+                 road_access_layer: Optional[QgsVectorLayer] = None,
+                 profile_lines_layer: Optional[QgsVectorLayer] = None,
+                 dxf_layer: Optional[QgsVectorLayer] = None,
+                 uncertainty_result: Optional[UncertaintyAnalysisResult] = None):
+        """
+        Initialize report generator.
+
+        Args:
+            results (Dict): Optimization results from EarthworkCalculator
+            polygon (QgsGeometry): Platform polygon geometry
+            dem_layer (QgsRasterLayer): DEM layer (optional, for map generation)
+            platform_layer (QgsVectorLayer): Platform/crane pad polygon layer (optional)
+            foundation_layer (QgsVectorLayer): Foundation polygon layer (optional)
+            boom_layer (QgsVectorLayer): Boom surface polygon layer (optional)
+            rotor_layer (QgsVectorLayer): Rotor storage polygon layer (optional)
+            road_access_layer (QgsVectorLayer): Road access polygon layer (optional)
+            profile_lines_layer (QgsVectorLayer): Profile lines layer (optional)
+            dxf_layer (QgsVectorLayer): DXF import layer (optional)
+            uncertainty_result (UncertaintyAnalysisResult): Monte Carlo uncertainty results (optional)
+        """
+        self.results = results
+        self.polygon = polygon
+        self.dem_layer = dem_layer
+        self.platform_layer = platform_layer
+        self.foundation_layer = foundation_layer
+        self.boom_layer = boom_layer
+        self.rotor_layer = rotor_layer
+        self.road_access_layer = road_access_layer
+        self.profile_lines_layer = profile_lines_layer
+        self.dxf_layer = dxf_layer
+        self.uncertainty_result = uncertainty_result
+        self.logger = get_plugin_logger()
+
+        # Get centroid coordinates
+        centroid = get_centroid(polygon)
+        self.centroid_x = centroid.x()
+        self.centroid_y = centroid.y()
+
+    def generate_html(self, output_path: str, profile_pngs: Optional[List[str]] = None,
+                     config: Optional[Dict] = None, profiles_dir: Optional[str] = None,
+                     save_overview_map: bool = False, cache_overview: bool = True):
+        """
+        Generate complete HTML report.
+
+        Args:
+            output_path (str): Path to save HTML file
+            profile_pngs (List[str]): Paths to profile PNG files (optional)
+            config (Dict): Configuration parameters (optional)
+            profiles_dir (str): Directory where profiles are saved (for overview map)
+            save_overview_map (bool): Also write the overview map as
+                overview_map.png into profiles_dir (default: embed only)
+            cache_overview (bool): Reuse an unchanged overview render from
+                this session instead of rendering it again
+        """
+        self.logger.info(f"Generating HTML report: {output_path}")
+
+        # Render overview map in memory if layers are available
+        overview_png = None
+        has_any_layer = (self.platform_layer or self.foundation_layer or
+                        self.boom_layer or self.rotor_layer or
+                        self.profile_lines_layer or self.dxf_layer)
+        if profiles_dir and has_any_layer:
+            try:
+                if cache_overview:
+                    overview_png = self._load_or_render_overview(scale=3000)
+                else:
+                    overview_png = self._render_overview_image(scale=3000)
+                if save_overview_map:
+                    overview_map_path = Path(profiles_dir) / "overview_map.png"
+                    overview_map_path.write_bytes(overview_png)
+                    self.logger.info(f"Overview map saved: {overview_map_path}")
+            except Exception as e:
+                self.logger.error(f"Failed to generate overview map: {e}")
+
+        # Generate HTML sections
+        html_header = self._generate_header()
+        html_summary = self._generate_summary()
+        html_parameters = self._generate_parameters(config)
+        html_results = self._generate_results()
+        html_uncertainty = self._generate_uncertainty_section()
+        html_stabilization = self._generate_stabilization_section()
+        html_quality = self._generate_quality_assurance_section() if self.results.get('stabilization') else ""
+        overview_tokens = self._emit_overview_section(overview_png)
+        profile_tokens = self._emit_profiles_section(profile_pngs)
+        html_footer = self._generate_footer()
+
+        # Combine all sections; the parts are encoded and written one by one
+        # so the full document never exists as a single joined string and
+        # embedded image data goes from base64 chunk to file in one pass
+        html_parts = [
+            _DOCUMENT_HEAD, html_header, _CONTAINER_OPEN,
+            html_summary, _SECTION_SEPARATOR,
+            html_parameters, _SECTION_SEPARATOR,
+            html_results, _SECTION_SEPARATOR,
+            html_uncertainty, _SECTION_SEPARATOR,
+            html_stabilization, _SECTION_SEPARATOR,
+            html_quality, _SECTION_SEPARATOR,
+            *overview_tokens, _SECTION_SEPARATOR,
+            *profile_tokens, _CONTAINER_CLOSE,
+            html_footer, _DOCUMENT_TAIL,
+        ]
+
+        # Write to file, encoding part by part as it streams to the buffered
+        # writer; static parts are already UTF-8 encoded
+        encode = codecs.getincrementalencoder('utf-8')().encode
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            write = f.write
+            for part in html_parts:
+                write(part if isinstance(part, bytes) else encode(part))
+            write(encode('', final=True))
+        self.logger.info(f"HTML report generated: {output_path}")
+
+    def _get_css_styles(self) -> str:
+        """Get CSS styles for the report."""
+        return _CSS_STYLES
+
+    def _generate_header(self) -> str:
+        """Generate HTML header section."""
+        return _HEADER_TEMPLATE.format(
+            timestamp=datetime.now().strftime('%d.%m.%Y %H:%M:%S')
+        )
+
     def _generate_summary(self) -> str:
         """Generate summary section."""
+        results = self.results
         # Use crane_height (new structure) with fallback to platform_height (old structure)
-        optimal_height = self.results.get('crane_height', self.results.get('platform_height', 0))
-        total_cut = self.results.get('total_cut', 0)
-        total_fill = self.results.get('total_fill', 0)
-        total_volume = self.results.get('total_volume_moved', 0)
+        optimal_height = results.get('crane_height', results.get('platform_height', 0))
+        total_cut = results.get('total_cut', 0)
+        total_fill = results.get('total_fill', 0)
+        total_volume = results.get('total_volume_moved', 0)
+        net_volume = results.get('net_volume', 0)
 
         return f"""
     <div class="section">
@@ -340,7 +742,7 @@ class ReportGenerator:
             </div>
             <div class="card">
                 <h3>Netto-Bilanz</h3>
-                <div class="value">{self.results.get('net_volume', 0):,.0f}</div>
+                <div class="value">{net_volume:,.0f}</div>
                 <div class="unit">m³</div>
             </div>
         </div>
@@ -349,11 +751,12 @@ class ReportGenerator:
 
     def _generate_parameters(self, config: Optional[Dict] = None) -> str:
         """Generate parameters section."""
+        results = self.results
         if config is None:
             config = {}
 
         # Get data from new multi-surface structure
-        surfaces = self.results.get('surfaces', {})
+        surfaces = results.get('surfaces', {})
         crane_pad = surfaces.get('kranstellflaeche', {})
 
         # Check if we have new multi-surface structure or old single-surface structure
@@ -362,22 +765,22 @@ class ReportGenerator:
         if is_new_structure:
             # New multi-surface structure
             # Platform area: use total_platform_area or sum from surfaces
-            platform_area = self.results.get('total_platform_area', 0)
+            platform_area = results.get('total_platform_area', 0)
             if platform_area == 0 and crane_pad:
                 platform_area = crane_pad.get('area', 0)
 
             # Total area: total_platform_area + total_slope_area
-            total_platform = self.results.get('total_platform_area', 0)
-            total_slope = self.results.get('total_slope_area', 0)
+            total_platform = results.get('total_platform_area', 0)
+            total_slope = results.get('total_slope_area', 0)
             total_area = total_platform + total_slope
 
             # Slope width from crane pad additional data
             slope_width = crane_pad.get('slope_width', 0)
         else:
             # Old single-surface structure
-            platform_area = self.results.get('platform_area', 0)
-            total_area = self.results.get('total_area', 0)
-            slope_width = self.results.get('slope_width', 0)
+            platform_area = results.get('platform_area', 0)
+            total_area = results.get('total_area', 0)
+            slope_width = results.get('slope_width', 0)
 
         return f"""
     <div class="section">
@@ -420,8 +823,9 @@ class ReportGenerator:
 
     def _generate_results(self) -> str:
         """Generate detailed results section."""
+        results = self.results
         # Get data from new multi-surface structure
-        surfaces = self.results.get('surfaces', {})
+        surfaces = results.get('surfaces', {})
         crane_pad = surfaces.get('kranstellflaeche', {})
 
         # Check if we have new multi-surface structure or old single-surface structure
@@ -449,15 +853,15 @@ class ReportGenerator:
                 slope_fill += surface_data.get('fill', 0)
         else:
             # Old single-surface structure
-            terrain_min = self.results.get('terrain_min', 0)
-            terrain_max = self.results.get('terrain_max', 0)
-            terrain_mean = self.results.get('terrain_mean', 0)
-            terrain_range = self.results.get('terrain_range', terrain_max - terrain_min)
+            terrain_min = results.get('terrain_min', 0)
+            terrain_max = results.get('terrain_max', 0)
+            terrain_mean = results.get('terrain_mean', 0)
+            terrain_range = results.get('terrain_range', terrain_max - terrain_min)
 
-            platform_cut = self.results.get('platform_cut', 0)
-            platform_fill = self.results.get('platform_fill', 0)
-            slope_cut = self.results.get('slope_cut', 0)
-            slope_fill = self.results.get('slope_fill', 0)
+            platform_cut = results.get('platform_cut', 0)
+            platform_fill = results.get('platform_fill', 0)
+            slope_cut = results.get('slope_cut', 0)
+            slope_fill = results.get('slope_fill', 0)
 
         # Choose labels based on structure type
         primary_label = "Kranstellfläche" if is_new_structure else "Plattform"
@@ -515,8 +919,8 @@ class ReportGenerator:
             </tr>
             <tr style="font-weight: bold; background-color: #f0f0f0;">
                 <td>Gesamt</td>
-                <td>{self.results.get('total_cut', 0):,.0f} m³</td>
-                <td>{self.results.get('total_fill', 0):,.0f} m³</td>
+                <td>{results.get('total_cut', 0):,.0f} m³</td>
+                <td>{results.get('total_fill', 0):,.0f} m³</td>
             </tr>
         </table>
     </div>
@@ -524,7 +928,8 @@ class ReportGenerator:
 
     def _generate_surface_details(self) -> str:
         """Generate detailed section for each individual surface."""
-        surfaces = self.results.get('surfaces', {})
+        results = self.results
+        surfaces = results.get('surfaces', {})
 
         if not surfaces:
             return ""  # Old structure doesn't have individual surfaces
@@ -549,39 +954,47 @@ class ReportGenerator:
             display_name = surface_names.get(surface_key, surface_key)
 
             # Extract values
-            cut = surface_data.get('cut', 0)
-            fill = surface_data.get('fill', 0)
-            total_moved = cut + fill
-            net = cut - fill
-
-            area = surface_data.get('area', 0)
-            slope_area = surface_data.get('slope_area', 0)
-            total_area = surface_data.get('total_area', area + slope_area)
-
-            target_height = surface_data.get('target_height', 0)
-            planum_height = surface_data.get('planum_height', target_height)
-
-            terrain_min = surface_data.get('terrain_min', 0)
-            terrain_max = surface_data.get('terrain_max', 0)
-            terrain_mean = surface_data.get('terrain_mean', 0)
+            get = surface_data.get
+            cut = get('cut', 0)
+            fill = get('fill', 0)
+
+            area = get('area', 0)
+            slope_area = get('slope_area', 0)
+            total_area = get('total_area', area + slope_area)
+
+            target_height = get('target_height', 0)
+            planum_height = get('planum_height', target_height)
+
+            # Pre-format the numeric cells with the shared format specs
+            cut_str = format(cut, _FMT_INT_GROUPED)
+            fill_str = format(fill, _FMT_INT_GROUPED)
+            total_moved_str = format(cut + fill, _FMT_INT_GROUPED)
+            net_str = format(cut - fill, _FMT_INT_GROUPED)
+            area_str = format(area, _FMT_1DP_GROUPED)
+            slope_area_str = format(slope_area, _FMT_1DP_GROUPED)
+            total_area_str = format(total_area, _FMT_1DP_GROUPED)
+            target_height_str = format(target_height, _FMT_2DP)
+            planum_height_str = format(planum_height, _FMT_2DP)
+            terrain_min_str = format(get('terrain_min', 0), _FMT_2DP)
+            terrain_max_str = format(get('terrain_max', 0), _FMT_2DP)
 
             # Additional info
-            gravel_thickness = surface_data.get('gravel_thickness', 0)
-            slope_width = surface_data.get('slope_width', 0)
+            gravel_thickness_str = format(get('gravel_thickness', 0), _FMT_2DP)
+            slope_width_str = format(get('slope_width', 0), _FMT_2DP)
 
             # Build additional row for surface-specific info
             additional_row = ""
             if surface_key == 'auslegerflaeche':
                 # Boom surface specific: slope percent and max distance
-                boom_slope_pct = surface_data.get('slope_percent', 0)
-                boom_max_dist = surface_data.get('max_distance', 0)
+                boom_slope_pct = format(get('slope_percent', 0), _FMT_1DP)
+                boom_max_dist = format(get('max_distance', 0), _FMT_1DP)
                 additional_row = f"""
             <tr>
                 <td></td>
                 <td>Längsneigung</td>
-                <td>{boom_slope_pct:.1f} %</td>
+                <td>{boom_slope_pct} %</td>
                 <td>Länge</td>
-                <td>{boom_max_dist:.1f} m</td>
+                <td>{boom_max_dist} m</td>
             </tr>"""
             elif surface_key == 'kranstellflaeche':
                 # Crane pad specific: gravel thickness
@@ -589,26 +1002,26 @@ class ReportGenerator:
             <tr>
                 <td></td>
                 <td>Schotterdicke</td>
-                <td>{gravel_thickness:.2f} m</td>
+                <td>{gravel_thickness_str} m</td>
                 <td></td>
                 <td></td>
             </tr>"""
             elif surface_key == 'zufahrt':
                 # Road access specific: slope percent, length, gravel thickness
-                road_slope_pct = surface_data.get('slope_percent', 0)
-                road_max_dist = surface_data.get('max_distance', 0)
+                road_slope_pct = format(get('slope_percent', 0), _FMT_1DP)
+                road_max_dist = format(get('max_distance', 0), _FMT_1DP)
                 additional_row = f"""
             <tr>
                 <td></td>
                 <td>Längsneigung</td>
-                <td>{road_slope_pct:.1f} %</td>
+                <td>{road_slope_pct} %</td>
                 <td>Länge</td>
-                <td>{road_max_dist:.1f} m</td>
+                <td>{road_max_dist} m</td>
             </tr>
             <tr>
                 <td></td>
                 <td>Schotterdicke</td>
-                <td>{gravel_thickness:.2f} m</td>
+                <td>{gravel_thickness_str} m</td>
                 <td></td>
                 <td></td>
             </tr>"""
@@ -617,43 +1030,43 @@ class ReportGenerator:
             <tr>
                 <td rowspan="2" style="vertical-align: middle; font-weight: bold; background-color: #f5f5f5;">{display_name}</td>
                 <td>Fläche</td>
-                <td>{area:,.1f} m²</td>
+                <td>{area_str} m²</td>
                 <td>Böschungsfläche</td>
-                <td>{slope_area:,.1f} m²</td>
+                <td>{slope_area_str} m²</td>
             </tr>
             <tr>
                 <td>Gesamtfläche</td>
-                <td>{total_area:,.1f} m²</td>
+                <td>{total_area_str} m²</td>
                 <td>Böschungsbreite</td>
-                <td>{slope_width:.2f} m</td>
+                <td>{slope_width_str} m</td>
             </tr>
             <tr>
                 <td></td>
                 <td>Zielhöhe (OK)</td>
-                <td>{target_height:.2f} m ü.NN</td>
+                <td>{target_height_str} m ü.NN</td>
                 <td>Planumshöhe (UK)</td>
-                <td>{planum_height:.2f} m ü.NN</td>
+                <td>{planum_height_str} m ü.NN</td>
             </tr>
             <tr>
                 <td></td>
                 <td>Gelände min</td>
-                <td>{terrain_min:.2f} m ü.NN</td>
+                <td>{terrain_min_str} m ü.NN</td>
                 <td>Gelände max</td>
-                <td>{terrain_max:.2f} m ü.NN</td>
+                <td>{terrain_max_str} m ü.NN</td>
             </tr>{additional_row}
             <tr>
                 <td></td>
                 <td>Abtrag</td>
-                <td style="color: #c0392b;">{cut:,.0f} m³</td>
+                <td style="color: #c0392b;">{cut_str} m³</td>
                 <td>Auftrag</td>
-                <td style="color: #27ae60;">{fill:,.0f} m³</td>
+                <td style="color: #27ae60;">{fill_str} m³</td>
             </tr>
             <tr style="border-bottom: 2px solid #667eea;">
                 <td></td>
                 <td>Gesamt bewegt</td>
-                <td>{total_moved:,.0f} m³</td>
+                <td>{total_moved_str} m³</td>
                 <td>Netto (Abtrag-Auftrag)</td>
-                <td>{net:,.0f} m³</td>
+                <td>{net_str} m³</td>
             </tr>
 """)
 
@@ -661,14 +1074,14 @@ class ReportGenerator:
             return ""
 
         # Get global values
-        fok = self.results.get('fok', 0)
-        crane_height = self.results.get('crane_height', 0)
-        boom_slope = self.results.get('boom_slope_percent', 0)
-        rotor_offset = self.results.get('rotor_height_offset_optimized', 0)
-        road_slope = self.results.get('road_slope_percent', 0)
-        gravel_external = self.results.get('gravel_fill_external', 0)
-        gravel_crane = self.results.get('gravel_crane_external', 0)
-        gravel_road = self.results.get('gravel_road_external', 0)
+        fok = results.get('fok', 0)
+        crane_height = results.get('crane_height', 0)
+        boom_slope = results.get('boom_slope_percent', 0)
+        rotor_offset = results.get('rotor_height_offset_optimized', 0)
+        road_slope = results.get('road_slope_percent', 0)
+        gravel_external = results.get('gravel_fill_external', 0)
+        gravel_crane = results.get('gravel_crane_external', 0)
+        gravel_road = results.get('gravel_road_external', 0)
 
         # Build gravel info string
         if gravel_road > 0:
@@ -852,17 +1265,20 @@ class ReportGenerator:
 
     def _generate_profiles_section(self, profile_pngs: Optional[List[str]] = None) -> str:
         """Generate terrain profiles section."""
+        return _join_tokens(self._emit_profiles_section(profile_pngs))
+
+    def _emit_profiles_section(self, profile_pngs: Optional[List[str]] = None) -> List[Union[str, bytes]]:
+        """
+        Generate terrain profiles section as a list of HTML tokens.
+
+        Encoded image data is kept as separate chunks so it can be written
+        out without joining it into one string first.
+        """
         if not profile_pngs:
-            return """
-    <div class="section">
-        <h2>📉 Geländeschnitte</h2>
-        <p>Keine Profilbilder verfügbar.</p>
-    </div>
-"""
+            return [_PROFILES_SECTION_EMPTY]
 
         # Sort profile PNGs: first cross-sections (Querprofil), then longitudinal (Längsprofil)
         # Each group sorted by number (01, 02, 03, ...)
-        import re
 
         def sort_key(png_path):
             """Generate sort key for profile PNG paths."""
@@ -884,52 +1300,48 @@ class ReportGenerator:
 
         sorted_pngs = sorted(profile_pngs, key=sort_key)
 
+        # Encode profile images concurrently; base64 and file reads release
+        # the GIL, and map() keeps the sorted order
+        with ThreadPoolExecutor(max_workers=min(_MAX_ENCODE_WORKERS, len(sorted_pngs))) as executor:
+            encoded = list(executor.map(_encode_png_file, sorted_pngs))
+
         # Embed profile images
         profile_html = []
-        for i, png_path in enumerate(sorted_pngs):
-            try:
-                # Read and encode image
-                with open(png_path, 'rb') as f:
-                    img_data = base64.b64encode(f.read()).decode('utf-8')
+        for png_path, (img_chunks, error) in zip(sorted_pngs, encoded):
+            if error is not None:
+                self.logger.error(f"Failed to embed profile image {png_path}: {error}")
+                continue
+            if not img_chunks:
+                self.logger.warning(f"Skipping empty profile image: {png_path}")
+                continue
 
-                profile_name = Path(png_path).stem
-                profile_html.append(f"""
-            <div class="profile-item">
-                <img src="data:image/png;base64,{img_data}" alt="{profile_name}">
+            profile_name = Path(png_path).stem
+            profile_html.append(_PROFILE_ITEM_HEAD)
+            profile_html.extend(img_chunks)
+            profile_html.append(f"""" alt="{profile_name}">
                 <p>{profile_name}</p>
             </div>
 """)
-            except Exception as e:
-                self.logger.error(f"Failed to embed profile image {png_path}: {e}")
 
         if not profile_html:
-            return """
-    <div class="section">
-        <h2>📉 Geländeschnitte</h2>
-        <p>Fehler beim Laden der Profilbilder.</p>
-    </div>
-"""
+            return [_PROFILES_SECTION_FAILED]
 
-        return f"""
-    <div class="section">
-        <h2>📉 Geländeschnitte</h2>
-        <p>Querschnitte mit bestehendem Gelände, geplanter Plattform und Abtrag/Auftrag-Bereichen.</p>
-        <div class="profile-grid">
-            {''.join(profile_html)}
-        </div>
-    </div>
-"""
+        return [_PROFILES_SECTION_HEAD, *profile_html, _PROFILES_SECTION_TAIL]
+
+    def _generate_overview_section(self, overview_png: Optional[bytes] = None) -> str:
+        """Generate overview map section from in-memory PNG data."""
+        return _join_tokens(self._emit_overview_section(overview_png))
+
+    def _emit_overview_section(self, overview_png: Optional[bytes] = None) -> List[Union[str, bytes]]:
+        """
+        Generate overview map section as a list of HTML tokens.
 
-    def _generate_overview_section(self, overview_map_path: Optional[str] = None) -> str:
-        """Generate overview map section."""
-        if not overview_map_path or not Path(overview_map_path).exists():
-            return ""
+        The PNG is base64-encoded in chunks straight into the token list.
+        """
+        if not overview_png:
+            return []
 
         try:
-            # Read and encode image
-            with open(overview_map_path, 'rb') as f:
-                img_data = base64.b64encode(f.read()).decode('utf-8')
-
             # Build source attribution
             source_html = ""
             if hasattr(self, 'background_sources') and self.background_sources:
@@ -940,30 +1352,43 @@ class ReportGenerator:
             {sources_list}
         </div>"""
 
-            return f"""
-    <div class="section">
-        <h2>🗺️ Lageplan</h2>
-        <div style="text-align: center;">
-            <img src="data:image/png;base64,{img_data}" alt="Lageplan" style="max-width: 100%; border: 1px solid #ddd; border-radius: 4px;">
+            section = [_OVERVIEW_SECTION_HEAD]
+            _append_b64_bytes(section, overview_png)
+            section.append(f"""" alt="Lageplan" style="max-width: 100%; border: 1px solid #ddd; border-radius: 4px;">
         </div>{source_html}
     </div>
-"""
+""")
+            return section
         except Exception as e:
             self.logger.error(f"Failed to embed overview map: {e}")
-            return ""
+            return []
 
     def _generate_overview_map(self, output_path: str, scale: int = 3000):
         """
-        Generate overview map using QGIS rendering.
+        Generate overview map using QGIS rendering and save it to disk.
 
         Args:
             output_path (str): Path to save map image
             scale (int): Map scale (default: 3000 for 1:3000)
+        """
+        Path(output_path).write_bytes(self._render_overview_image(scale))
+        self.logger.info(f"Overview map saved: {output_path}")
+
+    def _render_overview_image(self, scale: int = 3000,
+                               background_layers: Optional[Dict] = None) -> bytes:
+        """
+        Render overview map using QGIS rendering into an in-memory PNG.
+
+        Background layer sources are stored in ``self.background_sources``.
+
+        Args:
+            scale (int): Map scale (default: 3000 for 1:3000)
+            background_layers (Dict): Pre-computed result of
+                _find_background_layers() (optional)
 
         Returns:
-            List of source layer names used as background
+            bytes: PNG-encoded map image
         """
-        self.background_sources = []  # Store sources for later use
 
         # Calculate extent based on profile lines (if available) or polygon
         # Profile lines define the maximum extent of the construction site
@@ -998,20 +1423,20 @@ class ReportGenerator:
         # Calculate output size based on scale
         # Scale 1:3000 means 1mm on screen = 3000mm = 3m in reality
         # DPI 300 → 1 inch = 25.4mm → 1 pixel = 25.4/300 mm
-        dpi = 300
-        mm_per_pixel = 25.4 / dpi
-        m_per_pixel = (mm_per_pixel / 1000) * scale
-        
-        width_pixels = int(extent.width() / m_per_pixel)
-        height_pixels = int(extent.height() / m_per_pixel)
-        
-        # Limit size to reasonable values
+        dpi = 300.0
         max_size = 4000
-        if width_pixels > max_size or height_pixels > max_size:
-            scale_factor = max_size / max(width_pixels, height_pixels)
-            width_pixels = int(width_pixels * scale_factor)
-            height_pixels = int(height_pixels * scale_factor)
-        
+        longest_side = max(extent.width(), extent.height())
+
+        # Derive the DPI from the pixel budget up front so the render never
+        # exceeds max_size and symbology stays consistent with the image size
+        max_dpi = max_size * 25.4 / (longest_side * 1000 / scale)
+        if dpi > max_dpi:
+            dpi = max_dpi
+
+        m_per_pixel = (25.4 / dpi / 1000) * scale
+        width_pixels = min(max_size, max(1, int(extent.width() / m_per_pixel)))
+        height_pixels = min(max_size, max(1, int(extent.height() / m_per_pixel)))
+
         map_settings.setOutputSize(QSize(width_pixels, height_pixels))
         map_settings.setOutputDpi(dpi)
 
@@ -1019,22 +1444,14 @@ class ReportGenerator:
         # Layer order in list: LAST layer in list is rendered FIRST (background)
         # So we reverse the visual order
         layers = []
-        project_layers = QgsProject.instance().mapLayers()
-        
-        # Helper function to find layer by name pattern
-        def find_layer(name_patterns):
-            """Find layer by name pattern (case-insensitive)"""
-            for layer_id, layer in project_layers.items():
-                layer_name = layer.name().lower()
-                for pattern in name_patterns:
-                    if pattern.lower() in layer_name:
-                        return layer
-            return None
-        
-        # Find background layers from project
-        dgm_layer_project = find_layer(['dgm', 'höhenlinien', 'contour'])
-        kataster_layer_project = find_layer(['kataster', 'flurstück'])
-        luftbild_layer_project = find_layer(['luftbild', 'orthophoto', 'aerial'])
+
+        # Find background layers from project (single pass over all layers)
+        if background_layers is None:
+            background_layers = self._find_background_layers()
+        self.background_sources = self._describe_background_layers(background_layers)
+        dgm_layer_project = background_layers.get('dgm')
+        kataster_layer_project = background_layers.get('kataster')
+        luftbild_layer_project = background_layers.get('luftbild')
         
         # Layer order: FIRST in list = rendered on TOP, LAST = rendered on BOTTOM
         # Desired order from bottom to top: Background -> DEM -> Polygons -> Lines
@@ -1080,40 +1497,44 @@ class ReportGenerator:
         # === BOTTOM: Background/DEM layers (add last, rendered at bottom) ===
         if dgm_layer_project:
             layers.append(dgm_layer_project)
-            self.background_sources.append(f"DGM/Höhenmodell: {dgm_layer_project.name()}")
             self.logger.info(f"Found DGM layer: {dgm_layer_project.name()}")
 
         if kataster_layer_project:
             layers.append(kataster_layer_project)
-            self.background_sources.append(f"Kataster/Flurstücke: {kataster_layer_project.name()}")
             self.logger.info(f"Found Kataster layer: {kataster_layer_project.name()}")
 
         if luftbild_layer_project:
             layers.append(luftbild_layer_project)
-            self.background_sources.append(f"Luftbild: {luftbild_layer_project.name()}")
             self.logger.info(f"Found Luftbild layer: {luftbild_layer_project.name()}")
 
         # Try to find OSM/XYZ tile layer as base background (very bottom)
-        osm_layer_project = find_layer(['osm', 'openstreetmap', 'xyz', 'basemap', 'hintergrund'])
+        osm_layer_project = background_layers.get('basemap')
         if osm_layer_project:
             layers.append(osm_layer_project)
-            self.background_sources.append(f"Basiskarte: {osm_layer_project.name()}")
             self.logger.info(f"Found OSM/basemap layer: {osm_layer_project.name()}")
         
         map_settings.setLayers(layers)
         map_settings.setBackgroundColor(QColor(255, 255, 255))
 
-        # Render map
-        image = QImage(QSize(width_pixels, height_pixels), QImage.Format_ARGB32_Premultiplied)
-        image.fill(QColor(255, 255, 255).rgb())
+        # Only pay for what is visible: no selection highlighting, and let
+        # QGIS cull/simplify vector features against the map extent
+        map_settings.setFlag(QgsMapSettings.DrawSelection, False)
+        map_settings.setFlag(QgsMapSettings.UseRenderingOptimization, True)
 
-        painter = QPainter(image)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        # Render map; the parallel job renders layers on worker threads and
+        # composes them into its own image
+        # Opaque white background, so no alpha channel is needed
+        map_settings.setOutputImageFormat(QImage.Format_RGB32)
+        map_settings.setFlag(QgsMapSettings.Antialiasing, True)
 
-        job = QgsMapRendererCustomPainterJob(map_settings, painter)
+        job = QgsMapRendererParallelJob(map_settings)
         job.start()
         job.waitForFinished()
+        image = job.renderedImage()
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
 
         # Calculate actual meters per pixel based on extent and image size
         actual_m_per_pixel = extent.width() / width_pixels
@@ -1123,9 +1544,111 @@ class ReportGenerator:
 
         painter.end()
 
-        # Save image
-        image.save(output_path)
-        self.logger.info(f"Overview map saved: {output_path} ({width_pixels}×{height_pixels})")
+        # Encode PNG in memory instead of writing and re-reading a file
+        png_data = QByteArray()
+        png_buffer = QBuffer(png_data)
+        png_buffer.open(QIODevice.WriteOnly)
+        image.save(png_buffer, "PNG")
+        png_buffer.close()
+
+        self.logger.info(f"Overview map rendered ({width_pixels}×{height_pixels})")
+        return bytes(png_data)
+
+    def _find_background_layers(self) -> Dict:
+        """
+        Find background layers in the current QGIS project by name.
+
+        Each layer name is lowercased once and matched against all pattern
+        groups in _BACKGROUND_LAYER_PATTERNS; the first matching layer per
+        group wins.
+
+        Returns:
+            Dict: Mapping of pattern group key to the matched layer
+        """
+        found = {}
+        for layer in QgsProject.instance().mapLayers().values():
+            layer_name = layer.name().lower()
+            for key, pattern in _BACKGROUND_LAYER_PATTERNS.items():
+                if key not in found and pattern.search(layer_name):
+                    found[key] = layer
+            if len(found) == len(_BACKGROUND_LAYER_PATTERNS):
+                break
+        return found
+
+    def _describe_background_layers(self, background_layers: Dict) -> List[str]:
+        """
+        Build source attribution lines for the found background layers.
+
+        Args:
+            background_layers (Dict): Result of _find_background_layers()
+
+        Returns:
+            List[str]: Attribution lines in rendering order
+        """
+        return [
+            f"{label}: {background_layers[key].name()}"
+            for key, label in _BACKGROUND_SOURCE_LABELS.items()
+            if key in background_layers
+        ]
+
+    def _overview_cache_key(self, scale: int, background_layers: Dict) -> str:
+        """
+        Fingerprint everything that determines the rendered overview map.
+
+        Memory layers are recreated on every run, so they are identified by
+        name, feature count and extent rather than by layer ID.
+
+        Args:
+            scale (int): Map scale
+            background_layers (Dict): Result of _find_background_layers()
+
+        Returns:
+            str: Hex digest usable as a file name component
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(bytes(self.polygon.asWkb()))
+        digest.update(str(scale).encode('ascii'))
+        if self.dem_layer:
+            digest.update(self.dem_layer.source().encode('utf-8'))
+        for layer in (self.profile_lines_layer, self.dxf_layer, self.foundation_layer,
+                      self.platform_layer, self.boom_layer, self.rotor_layer,
+                      self.road_access_layer):
+            if layer:
+                digest.update(
+                    f"{layer.name()}|{layer.featureCount()}|{layer.extent().toString()}".encode('utf-8')
+                )
+        for layer in background_layers.values():
+            digest.update(layer.id().encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_or_render_overview(self, scale: int = 3000) -> bytes:
+        """
+        Return the overview map PNG, reusing a cached render if unchanged.
+
+        Renders are kept in the in-memory _OVERVIEW_CACHE for the QGIS
+        session, keyed by _overview_cache_key().
+
+        Args:
+            scale (int): Map scale (default: 3000 for 1:3000)
+
+        Returns:
+            bytes: PNG-encoded map image
+        """
+        background_layers = self._find_background_layers()
+        key = self._overview_cache_key(scale, background_layers)
+
+        png = _OVERVIEW_CACHE.get(key)
+        if png:
+            _OVERVIEW_CACHE.move_to_end(key)
+            self.logger.info("Reusing cached overview map")
+            self.background_sources = self._describe_background_layers(background_layers)
+            return png
+
+        png = self._render_overview_image(scale, background_layers)
+        _OVERVIEW_CACHE[key] = png
+        while len(_OVERVIEW_CACHE) > _OVERVIEW_CACHE_MAX_ENTRIES:
+            _OVERVIEW_CACHE.popitem(last=False)
+        return png
 
     def _draw_scale_bar(self, painter: QPainter, img_width: int, img_height: int, m_per_pixel: float):
         """
@@ -1211,97 +1734,27 @@ class ReportGenerator:
     def _generate_stabilization_section(self) -> str:
         """Generiert Abschnitt zu Bodenstabilisierung."""
 
-        if not self.results.get('stabilization'):
+        stab = self.results.get('stabilization')
+        if not stab:
             return ""
 
-        stab = self.results['stabilization']
-
         # Kalkbehandlung
-        lime_html = ""
-        if stab.get('lime_treatment'):
-            lime = stab['lime_treatment']
-            lime_html = f"""
-        <h3>Kalkstabilisierung</h3>
-        <table>
-            <tr>
-                <th>Parameter</th>
-                <th>Wert</th>
-                <th>Einheit</th>
-            </tr>
-            <tr>
-                <td>Dosierung (% Masse)</td>
-                <td>{lime['percentage']:.1f}</td>
-                <td>%</td>
-            </tr>
-            <tr>
-                <td>Flächenspezifisch</td>
-                <td>{lime['kg_per_m2']:.1f}</td>
-                <td>kg/m²</td>
-            </tr>
-            <tr>
-                <td>Volumenbezogen</td>
-                <td>{lime['kg_per_m3']:.1f}</td>
-                <td>kg/m³</td>
-            </tr>
-            <tr>
-                <td>Gesamtmenge</td>
-                <td>{stab['total_lime_tons']:.1f}</td>
-                <td>Tonnen</td>
-            </tr>
-            <tr>
-                <td>Behandlungstiefe</td>
-                <td>{lime['treatment_depth_m']*100:.0f}</td>
-                <td>cm</td>
-            </tr>
-            <tr>
-                <td>Erwarteter Ev2 nach Behandlung</td>
-                <td>{lime['expected_ev2_after']:.1f}</td>
-                <td>MN/m²</td>
-            </tr>
-        </table>
-        """
+        lime = stab.get('lime_treatment')
+        if lime:
+            lime_html = _LIME_TMPL.format_map({
+                **lime,
+                'total_lime_tons': stab['total_lime_tons'],
+                'treatment_depth_cm': lime['treatment_depth_m'] * 100,
+            })
         else:
-            lime_html = """
-        <p><i>Keine Kalkstabilisierung erforderlich (Ev2 ≥ 45 MN/m²)</i></p>
-        """
+            lime_html = _NO_LIME_HTML
 
         # Schottertragschicht
         gravel = stab['gravel_layer']
-        gravel_html = f"""
-        <h3>Schottertragschicht</h3>
-        <table>
-            <tr>
-                <th>Parameter</th>
-                <th>Wert</th>
-                <th>Einheit</th>
-            </tr>
-            <tr>
-                <td>Schichtdicke (verdichtet)</td>
-                <td>{gravel['thickness_m']*100:.0f}</td>
-                <td>cm</td>
-            </tr>
-            <tr>
-                <td>Volumen verdichtet</td>
-                <td>{gravel['compacted_volume_m3']:.1f}</td>
-                <td>m³</td>
-            </tr>
-            <tr>
-                <td>Volumen lose (Auflockerung 1,15)</td>
-                <td>{gravel['loose_volume_m3']:.1f}</td>
-                <td>m³</td>
-            </tr>
-            <tr>
-                <td>Masse (Rohdichte 2,1 t/m³)</td>
-                <td>{gravel['mass_tons']:.0f}</td>
-                <td>Tonnen</td>
-            </tr>
-            <tr>
-                <td>Flächenspezifisch</td>
-                <td>{gravel['area_specific_kg_m2']:.0f}</td>
-                <td>kg/m²</td>
-            </tr>
-        </table>
-        """
+        gravel_html = _GRAVEL_TMPL.format_map({
+            **gravel,
+            'thickness_cm': gravel['thickness_m'] * 100,
+        })
 
         # Qualitätshinweise
         notes_html = ""
@@ -1316,48 +1769,18 @@ class ReportGenerator:
         </div>
         """
 
-        return f"""
-    <div class="section">
-        <h2>🏗️ Bodenstabilisierung und Materialmengen</h2>
-
-        <div class="grid">
-            <div class="card">
-                <h3>Bodenart</h3>
-                <div class="value">{stab['soil_type']}</div>
-            </div>
-            <div class="card">
-                <h3>Ausgangs-Ev2</h3>
-                <div class="value">{stab['initial_ev2']:.1f}</div>
-                <div class="unit">MN/m²</div>
-            </div>
-            <div class="card">
-                <h3>Ev2 nach Behandlung</h3>
-                <div class="value">{stab['ev2_after_lime']:.1f}</div>
-                <div class="unit">MN/m²</div>
-            </div>
-            <div class="card">
-                <h3>Finaler Ev2 (erwartet)</h3>
-                <div class="value">{stab['final_ev2_expected']:.1f}</div>
-                <div class="unit">MN/m²</div>
-            </div>
-        </div>
-
-        {lime_html}
-        {gravel_html}
-        {notes_html}
-    </div>
-    """
+        return _STABILIZATION_TMPL.format_map({
+            **stab,
+            'lime_html': lime_html,
+            'gravel_html': gravel_html,
+            'notes_html': notes_html,
+        })
 
     def _generate_quality_assurance_section(self) -> str:
         """Generiert Abschnitt zu Qualitätssicherung und Datenqualität."""
 
-        reliability = self.results.get('stabilization', {}).get('reliability_rating', 'medium')
-
-        reliability_text = {
-            'high': 'Hoch - Berechnung basiert auf Standardwerten nach DIN/ZTV',
-            'medium': 'Mittel - Standortspezifische Prüfung empfohlen',
-            'low': 'Niedrig - Eignungsprüfung zwingend erforderlich'
-        }
+        stab = self.results.get('stabilization') or {}
+        reliability_text = _RELIABILITY_TEXT.get(stab.get('reliability_rating', 'medium'), 'Unbekannt')
 
         return f"""
     <div class="section">
@@ -1365,106 +1788,12 @@ class ReportGenerator:
 
         <div class="highlight-box">
             <h3>Zuverlässigkeit der Berechnung</h3>
-            <p><strong>{reliability_text.get(reliability, 'Unbekannt')}</strong></p>
-        </div>
-
-        <h3>Wichtige Randbedingungen</h3>
-        <ul>
-            <li><strong>Standortvariabilität:</strong> Alle Werte sind typische Bereiche.
-                Standortspezifische Eignungsprüfungen nach TP BF-StB obligatorisch vor Ausführung.</li>
-            <li><strong>Feuchteempfindlichkeit:</strong> Bindige Bodenparameter stark wassergehaltsabhängig.
-                Ev2 kann bei Durchfeuchtung um 30-60% abfallen. Drainage und Oberflächenentwässerung kritisch.</li>
-            <li><strong>Verdichtungsqualität:</strong> Erreichbare Ev2-Werte abhängig von korrekter Verdichtungstechnik.
-                Plattendruckversuche nach DIN 18134 alle 200-500m² erforderlich.</li>
-            <li><strong>Zeitfaktoren:</strong> Kalkstabilisierung benötigt 7-28 Tage für volle Festigkeitsentwicklung.
-                Frosteinwirkung während Erhärtung vermeiden (Verarbeitung nur bei >5°C).</li>
-            <li><strong>Mischbinder-Optimierung:</strong> Kombinierte Kalk/Zement-Bindemittel oft leistungsfähiger,
-                besonders bei gemischkörnigen Böden.</li>
-        </ul>
-
-        <h3>Datenqualität und Prüfanforderungen</h3>
-
-        <h4>Hohe Zuverlässigkeit:</h4>
-        <ul>
-            <li>Ev2-Bereiche nach DIN-Standards</li>
-            <li>Verdichtungsfaktoren aus ZTV E-StB</li>
-            <li>Schotterdicken nach RStO 12</li>
-        </ul>
-
-        <h4>Mittlere Zuverlässigkeit (Eignungsprüfung erforderlich):</h4>
-        <ul>
-            <li>Kalkdosierungen (bodenabhängig)</li>
-            <li>Ev2-Verbesserungsfaktoren (2-5×, stark streuend)</li>
-            <li>Wassergehaltseinfluß</li>
-        </ul>
-
-        <h4>Standortspezifisch zu prüfen:</h4>
-        <ul>
-            <li>Exakte Ev2-Werte (nur durch Plattendruckversuch DIN 18134)</li>
-            <li>Detaillierte Plastizitätswerte (Laboruntersuchung)</li>
-            <li>Langzeitfestigkeit (zeitabhängig)</li>
-            <li>Frostsicherheit (Frost-Tau-Wechsel-Test)</li>
-        </ul>
-
-        <h3>Empfohlene Prüfungen</h3>
-        <table>
-            <tr>
-                <th>Prüfung</th>
-                <th>Norm/Richtlinie</th>
-                <th>Phase</th>
-            </tr>
-            <tr>
-                <td>Bodenkennwerte (Korngrößenverteilung, Plastizität)</td>
-                <td>DIN 18196</td>
-                <td>Planung</td>
-            </tr>
-            <tr>
-                <td>Eignungsprüfung Bodenverfestigung</td>
-                <td>TP BF-StB Teil B 11.1</td>
-                <td>Planung</td>
-            </tr>
-            <tr>
-                <td>Proctor-Versuch</td>
-                <td>DIN 18127</td>
-                <td>Planung</td>
-            </tr>
-            <tr>
-                <td>Probefeld (verschiedene Dosierungen)</td>
-                <td>ZTV E-StB</td>
-                <td>Vor Ausführung</td>
-            </tr>
-            <tr>
-                <td>Plattendruckversuch (Ev2)</td>
-                <td>DIN 18134</td>
-                <td>Ausführung/Abnahme</td>
-            </tr>
-            <tr>
-                <td>Dynamischer Plattendruckversuch (Evd)</td>
-                <td>TP BF-StB Teil B 8.3</td>
-                <td>Ausführung</td>
-            </tr>
-        </table>
-
-        <div class="highlight-box">
-            <h4>📌 Wichtiger Hinweis</h4>
-            <p>Diese Berechnungen dienen der <strong>Vordimensionierung und Kostenschätzung</strong>.
-            Vor Bauausführung sind zwingend erforderlich:</p>
-            <ul>
-                <li>Baugrundgutachten mit Plattendruckversuchen</li>
-                <li>Eignungsprüfung der Bindemittel nach TP BF-StB</li>
-                <li>Probefelder zur Dosierungsoptimierung</li>
-                <li>Qualitätskontrolle während der Ausführung</li>
-            </ul>
+            <p><strong>{reliability_text}</strong></p>
         </div>
-    </div>
-    """
+""" + _QA_STATIC_HTML
 
     def _generate_footer(self) -> str:
         """Generate HTML footer."""
-        return f"""
-    <div class="footer">
-        <p>Erdmassenberechnung Windenergieanlagen V2.0.0</p>
-        <p>Erstellt mit QGIS Processing Plugin</p>
-        <p style="font-size: 0.8rem;">Bericht erstellt am: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}</p>
-    </div>
-"""
+        return _FOOTER_TEMPLATE.format(
+            timestamp=datetime.now().strftime('%d.%m.%Y %H:%M:%S')
+        )
@@ -8,13 +8,45 @@ Author: Wind Energy Site Planning
 Version: 2.0
 """
 
-from typing import Dict, Optional, Tuple
-import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Optional, Sequence, Tuple
+import logging
+import sqlite3
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Ersatz für numba.njit: Funktion bleibt reines Python."""
+        def decorator(func):
+            return func
+        return decorator
 
 from qgis.core import QgsPointXY
 
 from ..utils.logging_utils import get_plugin_logger
 
+try:
+    from .bgr_soil_api import (
+        BGRResultCache,
+        BGRSoilAPI,
+        get_bgr_cache,
+        get_soil_data_batch,
+        get_soil_data_from_bgr
+    )
+    BGR_API_AVAILABLE = True
+except ImportError:
+    BGR_API_AVAILABLE = False
+
 
 # Ev2-Standardwerte nach Bodenart (MN/m²)
 SOIL_EV2_RANGES = {
@@ -51,6 +83,11 @@ GRAVEL_THICKNESS_TABLE = [
     (0, 0.40)
 ]
 
+# Schwellwerte und Dicken aufsteigend sortiert; einzige Form der Tabelle für
+# JIT-Kernel (Numba unterstützt keine globalen Listen) und np.searchsorted
+_GRAVEL_EV2_THRESHOLDS = np.array([ev2 for ev2, _ in reversed(GRAVEL_THICKNESS_TABLE)], dtype=float)
+_GRAVEL_THICKNESSES = np.array([t for _, t in reversed(GRAVEL_THICKNESS_TABLE)], dtype=float)
+
 # Typische optimale Wassergehalte nach Proctor (%)
 # Basierend auf DIN 18127 Erfahrungswerte
 OPTIMUM_WATER_CONTENT = {
@@ -84,6 +121,339 @@ DIN_SOIL_CLASSIFICATION = {
     'OK': 'Lehm'
 }
 
+# Konstanten für Berechnungen
+_TREATMENT_DEPTH_M: Final[float] = 0.30  # Standard-Behandlungstiefe in Metern
+_SOIL_BULK_DENSITY: Final[float] = 1.8   # Rohdichte Boden in t/m³
+_GRAVEL_BULK_DENSITY: Final[float] = 2.1  # Rohdichte Schotter in t/m³
+_GRAVEL_LOOSENING_FACTOR: Final[float] = 1.15  # Auflockerungsfaktor Schotter
+
+# Ev2-Verbesserungsfaktoren durch Kalkstabilisierung
+# (konservativ: 2-3x, optimal: 4-5x)
+_EV2_IMPROVEMENT_FACTOR_MIN: Final[float] = 2.0
+_EV2_IMPROVEMENT_FACTOR_MAX: Final[float] = 4.0
+
+# Qualitätshinweise ohne variable Anteile
+_NOTE_WATER_UNKNOWN: Final[str] = "Wassergehalt unbekannt - Standarddosierung verwendet"
+_NOTE_HIGH_LIME: Final[str] = (
+    "WARNUNG: Hohe Kalkdosierung - Eignungsprüfung nach "
+    "TP BF-StB zwingend erforderlich!"
+)
+_NOTE_NO_STABILIZATION: Final[str] = "Planum-Ev2 ausreichend - keine Bodenverfestigung nötig"
+_NOTE_THICK_GRAVEL: Final[str] = (
+    "Dicke Schotterschicht - Stufenweise Verdichtung erforderlich "
+    "(max. 20cm pro Lage)"
+)
+_NOTE_COHESIVE: Final[str] = "Bindiger Boden - Drainage und Oberflächenentwässerung kritisch!"
+_NOTE_VERY_SOFT: Final[str] = (
+    "ACHTUNG: Sehr weicher Untergrund - Tragfähigkeitsprüfung "
+    "und ggf. Bodenaustausch erwägen"
+)
+_NOTE_LIME_UNSUITABLE_TMPL: Final[str] = (
+    "Kalkstabilisierung für {soil_type} nicht geeignet - "
+    "Alternative Maßnahmen prüfen (Bodenaustausch, Zement)"
+)
+# Vorformatiert für alle bekannten Bodenarten
+_NOTE_LIME_UNSUITABLE = {
+    soil: _NOTE_LIME_UNSUITABLE_TMPL.format(soil_type=soil) for soil in LIME_DOSAGE_RANGES
+}
+
+# Rückgabe der BGR-Abfragen, wenn das BGR-API-Modul nicht geladen werden konnte
+_BGR_UNAVAILABLE: Final[Dict[str, Any]] = {
+    'soil_type': None,
+    'soil_code': None,
+    'source': 'BGR WFS (nicht verfügbar)',
+    'available': False,
+    'error': 'BGR-API-Modul fehlt'
+}
+
+# Bindige Böden (Drainage-Hinweis) und nichtbindige Böden (Zuverlässigkeit)
+_COHESIVE_SOILS = frozenset(('Ton', 'Schluff', 'Lehm'))
+_NONCOHESIVE_SOILS = frozenset(('Sand', 'Kies'))
+
+
+class SoilCode(IntEnum):
+    """Kanonischer Index der vereinfachten Bodenarten in _SOIL_TABLE."""
+    Ton = 0
+    Schluff = 1
+    Lehm = 2
+    Sand = 3
+    Kies = 4
+
+
+_SOIL_CODES = {code.name: code for code in SoilCode}
+
+# Bodenarten, für die Kalkstabilisierung überhaupt in Frage kommt (nicht Sand/Kies)
+_LIME_APPLICABLE = frozenset(
+    soil for soil, (dosage_min, _) in LIME_DOSAGE_RANGES.items() if dosage_min > 0
+)
+
+# Bodenkennwerte als Structure-of-Arrays (eine Zeile je SoilCode),
+# abgeleitet aus LIME_DOSAGE_RANGES und OPTIMUM_WATER_CONTENT
+_SOIL_TABLE = np.array(
+    [
+        (*LIME_DOSAGE_RANGES[code.name], OPTIMUM_WATER_CONTENT[code.name])
+        for code in SoilCode
+    ],
+    dtype=[('dmin', 'f8'), ('dmax', 'f8'), ('w_opt', 'f8')]
+)
+
+# Normalisierte (großgeschriebene) DIN-Klassen, interniert für schnelle Vergleiche
+_DIN_TO_CODE = {
+    sys.intern(din_class.upper().strip()): _SOIL_CODES[soil_type]
+    for din_class, soil_type in DIN_SOIL_CLASSIFICATION.items()
+}
+
+
+@dataclass(slots=True, frozen=True)
+class LimeResult:
+    """
+    Ergebnis der Kalkdosierung.
+
+    Attributes:
+        percentage: Kalkdosierung in % Masse (0 = nicht geeignet)
+        kg_per_m3: Kalkmenge in kg/m³ (bei 30cm Tiefe)
+        kg_per_m2: Kalkmenge in kg/m² (flächenspezifisch)
+        treatment_depth_m: Behandlungstiefe in m
+        expected_ev2_after: Erwarteter Ev2 nach Behandlung in MN/m²
+    """
+    percentage: float
+    kg_per_m3: float
+    kg_per_m2: float
+    treatment_depth_m: float
+    expected_ev2_after: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'percentage': self.percentage,
+            'kg_per_m3': self.kg_per_m3,
+            'kg_per_m2': self.kg_per_m2,
+            'treatment_depth_m': self.treatment_depth_m,
+            'expected_ev2_after': self.expected_ev2_after
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class GravelResult:
+    """
+    Ergebnis der Schottertragschicht-Bemessung.
+
+    Attributes:
+        thickness_m: Schichtdicke verdichtet in m
+        compacted_volume_m3: Volumen verdichtet in m³
+        loose_volume_m3: Volumen lose (mit Auflockerung) in m³
+        mass_tons: Masse in Tonnen
+        area_specific_kg_m2: Flächenspezifische Masse in kg/m²
+    """
+    thickness_m: float
+    compacted_volume_m3: float
+    loose_volume_m3: float
+    mass_tons: float
+    area_specific_kg_m2: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'thickness_m': self.thickness_m,
+            'compacted_volume_m3': self.compacted_volume_m3,
+            'loose_volume_m3': self.loose_volume_m3,
+            'mass_tons': self.mass_tons,
+            'area_specific_kg_m2': self.area_specific_kg_m2
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class StabilizationResult:
+    """
+    Vollständiges Ergebnis der Bodenstabilisierung einer Kranstellfläche.
+
+    Alle Zahlenwerte sind ungerundet; gerundet wird erst bei der Ausgabe
+    (Bericht, Log) über Formatangaben.
+
+    Attributes:
+        area_m2: Flächengröße in m²
+        initial_ev2: Ausgangs-Ev2 in MN/m²
+        soil_type: Bodenart
+        lime_treatment: Kalkbehandlung oder None (nicht erforderlich)
+        ev2_after_lime: Ev2 nach Kalkbehandlung in MN/m²
+        gravel_layer: Schottertragschicht
+        final_ev2_expected: Erwarteter finaler Ev2 in MN/m²
+        total_lime_tons: Gesamtmenge Kalk in Tonnen
+        total_gravel_tons: Gesamtmenge Schotter in Tonnen
+        quality_notes: Hinweise zur Bauausführung
+        reliability_rating: 'high', 'medium' oder 'low'
+    """
+    area_m2: float
+    initial_ev2: float
+    soil_type: str
+    lime_treatment: Optional[LimeResult]
+    ev2_after_lime: float
+    gravel_layer: GravelResult
+    final_ev2_expected: float
+    total_lime_tons: float
+    total_gravel_tons: float
+    quality_notes: Tuple[str, ...]
+    reliability_rating: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (e.g. HTML report)."""
+        return {
+            'area_m2': self.area_m2,
+            'initial_ev2': self.initial_ev2,
+            'soil_type': self.soil_type,
+            'lime_treatment': self.lime_treatment.to_dict() if self.lime_treatment else None,
+            'ev2_after_lime': self.ev2_after_lime,
+            'gravel_layer': self.gravel_layer.to_dict(),
+            'final_ev2_expected': self.final_ev2_expected,
+            'total_lime_tons': self.total_lime_tons,
+            'total_gravel_tons': self.total_gravel_tons,
+            'quality_notes': list(self.quality_notes),
+            'reliability_rating': self.reliability_rating
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class StabilizationSite:
+    """
+    Eingangsdaten eines WEA-Standorts für calculate_many().
+
+    Attributes:
+        point: WEA-Standort
+        crs: Koordinatenreferenzsystem des Standorts
+        platform_area_m2: Kranstellfläche in m²
+        current_ev2: Aktueller Ev2-Wert in MN/m²
+        soil_type: Bodenart; None = über BGR ermitteln
+        water_content: Aktueller Wassergehalt in % (None = unbekannt)
+        optimum_water: Optimaler Wassergehalt in % (None = unbekannt)
+    """
+    point: QgsPointXY
+    crs: Any
+    platform_area_m2: float
+    current_ev2: float
+    soil_type: Optional[str] = None
+    water_content: Optional[float] = None
+    optimum_water: Optional[float] = None
+
+
+def _as_float_array(values: Optional[Sequence[Optional[float]]], n: int) -> np.ndarray:
+    """Wandelt optionale Werte in ein Float-Array um (None = 0 = unbekannt)."""
+    if values is None:
+        return np.zeros(n)
+    return np.array([0.0 if v is None else v for v in values], dtype=float)
+
+
+@lru_cache(maxsize=128)
+def _din_to_soil_type(din_class: str) -> str:
+    """Bildet eine DIN 18196 Bodenklasse auf den vereinfachten Typ ab."""
+    try:
+        return _DIN_TO_CODE[din_class.upper().strip()].name
+    except KeyError:
+        raise ValueError(
+            f"Unbekannte DIN-Bodenklasse: {din_class}. "
+            f"Bekannte Klassen: {', '.join(DIN_SOIL_CLASSIFICATION.keys())}"
+        ) from None
+
+
+@njit(cache=True)
+def _stabilization_kernel(
+    water_content, optimum_water, current_ev2, target_ev2,
+    dosage_min, dosage_max, treatment_depth_m, soil_density
+):
+    """
+    Rechenkern für Kalkdosierung und Schichtdicke, flächenunabhängig (pro m²).
+
+    Einzige skalare Umsetzung der Formeln; estimate_lime_dosage(),
+    calculate_gravel_layer() und calculate_full_requirements() rufen ihn
+    über den Cache _stabilization_per_m2() auf,
+    calculate_full_requirements_batch() rechnet dieselben Formeln
+    vektorisiert. Ohne Rundung, Dicts und Logging.
+    dosage_min = 0 bedeutet: keine Kalkbehandlung, der Schotter wird
+    direkt auf current_ev2 bemessen.
+
+    Returns:
+        Tuple (Dosierung %, kg/m², kg/m³, Ev2 nach Kalk, Wasserkorrektur %,
+        Ev2-Verhältnis, Ev2-Korrektur %, Schichtdicke m)
+    """
+    final_dosage = 0.0
+    kg_per_m2 = 0.0
+    kg_per_m3 = 0.0
+    expected_ev2_after = current_ev2
+    water_correction = 0.0
+    ev2_ratio = 1.0
+    ev2_correction = 0.0
+    subgrade_ev2 = current_ev2
+
+    if dosage_min > 0:
+        # Pro 1% Wasserüberschuss: +0.3% Kalk für Trocknung
+        if water_content > 0 and optimum_water > 0:
+            water_excess = water_content - optimum_water
+            if water_excess > 0:
+                water_correction = water_excess * 0.3
+
+        # Sehr hohe Verbesserung benötigt mehr Bindemittel
+        if current_ev2 > 0:
+            ev2_ratio = target_ev2 / current_ev2
+        if ev2_ratio > 3.0:
+            ev2_correction = 1.0
+
+        # Mittlere Basis-Dosierung plus Korrekturen, begrenzt auf 2-8%
+        final_dosage = (dosage_min + dosage_max) / 2.0 + water_correction + ev2_correction
+        final_dosage = max(2.0, min(8.0, final_dosage))
+
+        # Bodenmasse pro m²: Behandlungstiefe × Rohdichte (t/m²)
+        kg_per_m2 = (final_dosage / 100.0) * (treatment_depth_m * soil_density) * 1000
+        kg_per_m3 = kg_per_m2 / treatment_depth_m
+        # Konservative Verbesserung: Faktor 2.0 - 2.8 je nach Dosierung
+        expected_ev2_after = min(current_ev2 * (2.0 + final_dosage / 10.0), target_ev2)
+        # Schotter wird auf den gerundeten Ev2 nach Kalk bemessen
+        subgrade_ev2 = round(expected_ev2_after, 1)
+
+    # Schichtdicke aus Tabelle per Binärsuche über die aufsteigenden
+    # Schwellwerte (unterhalb des kleinsten Schwellwerts: dickste Schicht)
+    i = np.searchsorted(_GRAVEL_EV2_THRESHOLDS, subgrade_ev2, side='right') - 1
+    thickness_m = _GRAVEL_THICKNESSES[max(i, 0)]
+
+    return (
+        final_dosage, kg_per_m2, kg_per_m3, expected_ev2_after,
+        water_correction, ev2_ratio, ev2_correction, thickness_m
+    )
+
+
+@lru_cache(maxsize=256)
+def _stabilization_per_m2(
+    water_content: float,
+    optimum_water: float,
+    current_ev2: float,
+    target_ev2: float,
+    dosage_min: float,
+    dosage_max: float
+) -> Tuple[float, ...]:
+    """
+    Flächenunabhängige Kennwerte aus _stabilization_kernel(), gecacht für
+    wiederkehrende Bodenprofile (gleiche Bodenart, Ev2 und Wassergehalte).
+    """
+    return _stabilization_kernel(
+        water_content, optimum_water, current_ev2, target_ev2,
+        dosage_min, dosage_max, _TREATMENT_DEPTH_M, _SOIL_BULK_DENSITY
+    )
+
+
+def _gravel_quantities(area_m2: float, thickness_m: float) -> Tuple[float, float, float, float]:
+    """
+    Schottermengen einer Fläche aus der Schichtdicke.
+
+    Gleiche Rechenreihenfolge wie calculate_full_requirements_batch(),
+    damit Einzel- und Batch-Ergebnisse bitgleich bleiben.
+
+    Returns:
+        Tuple (Volumen verdichtet m³, Volumen lose m³, Masse t, kg/m² Schotter)
+    """
+    compacted_volume_m3 = area_m2 * thickness_m
+    loose_volume_m3 = compacted_volume_m3 * _GRAVEL_LOOSENING_FACTOR
+    mass_tons = compacted_volume_m3 * _GRAVEL_BULK_DENSITY
+    area_specific_kg_m2 = (mass_tons / area_m2) * 1000 if area_m2 > 0 else 0.0
+    return compacted_volume_m3, loose_volume_m3, mass_tons, area_specific_kg_m2
+
 
 class SoilStabilizationCalculator:
     """
@@ -99,20 +469,19 @@ class SoilStabilizationCalculator:
     Standortspezifische Eignungsprüfungen sind zwingend erforderlich!
     """
 
+    __slots__ = ('logger', '_bgr_api')
+
     def __init__(self):
         """Initialisiere mit Konstanten und Lookup-Tabellen."""
         self.logger = get_plugin_logger()
+        self._bgr_api = None  # BGR-Client, wird bei der ersten Abfrage angelegt
 
-        # Konstanten für Berechnungen
-        self.TREATMENT_DEPTH_M = 0.30  # Standard-Behandlungstiefe in Metern
-        self.SOIL_BULK_DENSITY = 1.8   # Rohdichte Boden in t/m³
-        self.GRAVEL_BULK_DENSITY = 2.1  # Rohdichte Schotter in t/m³
-        self.GRAVEL_LOOSENING_FACTOR = 1.15  # Auflockerungsfaktor Schotter
-
-        # Ev2-Verbesserungsfaktoren durch Kalkstabilisierung
-        # (konservativ: 2-3x, optimal: 4-5x)
-        self.EV2_IMPROVEMENT_FACTOR_MIN = 2.0
-        self.EV2_IMPROVEMENT_FACTOR_MAX = 4.0
+        if NUMBA_AVAILABLE:
+            # Kompilierung vorziehen, damit der erste echte Aufruf nicht wartet
+            _stabilization_kernel(
+                0.0, 0.0, 30.0, 60.0, 4.0, 6.0,
+                _TREATMENT_DEPTH_M, _SOIL_BULK_DENSITY
+            )
 
         self.logger.info("SoilStabilizationCalculator initialisiert")
 
@@ -123,7 +492,7 @@ class SoilStabilizationCalculator:
         optimum_water: float,
         current_ev2: float,
         target_ev2: float = 60.0
-    ) -> Dict:
+    ) -> LimeResult:
         """
         Berechnet Kalkdosierung basierend auf Bodenparametern.
 
@@ -135,98 +504,55 @@ class SoilStabilizationCalculator:
             target_ev2: Ziel-Ev2 nach Kalkbehandlung in MN/m² (default: 60)
 
         Returns:
-            Dict mit:
-                - percentage: Kalkdosierung in % Masse
-                - kg_per_m3: Kalkmenge in kg/m³ (bei 30cm Tiefe)
-                - kg_per_m2: Kalkmenge in kg/m² (flächenspezifisch)
-                - treatment_depth_m: Behandlungstiefe in m
-                - expected_ev2_after: Erwarteter Ev2 nach Behandlung
+            LimeResult mit Dosierung, Kalkmengen, Behandlungstiefe und
+            erwartetem Ev2 nach Behandlung
         """
         try:
             self.logger.info(
-                f"Berechne Kalkdosierung: Bodenart={soil_type}, "
-                f"w={water_content}%, Ev2={current_ev2} MN/m²"
+                "Berechne Kalkdosierung: Bodenart=%s, w=%s%%, Ev2=%s MN/m²",
+                soil_type, water_content, current_ev2
             )
 
             # Basis-Dosierung aus Lookup-Tabelle
-            if soil_type not in LIME_DOSAGE_RANGES:
+            code = _SOIL_CODES.get(soil_type)
+            if code is None:
                 raise ValueError(f"Unbekannte Bodenart: {soil_type}")
 
-            dosage_min, dosage_max = LIME_DOSAGE_RANGES[soil_type]
+            row = _SOIL_TABLE[code]
+            dosage_min, dosage_max = float(row['dmin']), float(row['dmax'])
 
             # Keine Kalkstabilisierung für Sand/Kies empfohlen
             if dosage_min == 0:
                 self.logger.warning(
-                    f"Kalkstabilisierung für {soil_type} nicht empfohlen"
+                    "Kalkstabilisierung für %s nicht empfohlen", soil_type
                 )
-                return {
-                    'percentage': 0.0,
-                    'kg_per_m3': 0.0,
-                    'kg_per_m2': 0.0,
-                    'treatment_depth_m': 0.0,
-                    'expected_ev2_after': current_ev2
-                }
-
-            # Basis-Dosierung (Mittelwert)
-            base_dosage = (dosage_min + dosage_max) / 2.0
-
-            # Korrektur für Wassergehalt
-            water_correction = 0.0
-            if water_content > 0 and optimum_water > 0:
-                water_excess = water_content - optimum_water
-                if water_excess > 0:
-                    # Zusätzlicher Kalk für Trocknung
-                    # Pro 1% Wasserüberschuss: +0.3% Kalk
-                    water_correction = water_excess * 0.3
-                    self.logger.info(
-                        f"Wassergehalt {water_content}% > Optimum {optimum_water}%: "
-                        f"+{water_correction:.1f}% Kalk für Trocknung"
-                    )
+                return self._lime_treatment_result(0.0, 0.0, 0.0, current_ev2, current_ev2)
 
-            # Korrektur für Ev2-Verbesserungsbedarf
-            ev2_ratio = target_ev2 / current_ev2 if current_ev2 > 0 else 1.0
-            ev2_correction = 0.0
+            (final_dosage, kg_per_m2, kg_per_m3, expected_ev2_after,
+             water_correction, ev2_ratio, ev2_correction, _) = _stabilization_per_m2(
+                float(water_content), float(optimum_water), float(current_ev2),
+                float(target_ev2), dosage_min, dosage_max
+            )
 
-            if ev2_ratio > 3.0:
-                # Sehr hohe Verbesserung benötigt mehr Bindemittel
-                ev2_correction = 1.0
+            if water_correction > 0:
                 self.logger.info(
-                    f"Hoher Ev2-Verbesserungsbedarf ({ev2_ratio:.1f}x): "
-                    f"+{ev2_correction:.1f}% Kalk"
+                    "Wassergehalt %s%% > Optimum %s%%: +%.1f%% Kalk für Trocknung",
+                    water_content, optimum_water, water_correction
                 )
 
-            # Finale Dosierung
-            final_dosage = base_dosage + water_correction + ev2_correction
-
-            # Begrenzung auf sinnvolle Werte (2-8%)
-            final_dosage = max(2.0, min(8.0, final_dosage))
-
-            # Umrechnung auf kg/m³ und kg/m²
-            # Behandlungsvolumen pro m²: 1 m² × 0.3 m = 0.3 m³
-            # Masse Boden: 0.3 m³ × 1.8 t/m³ = 0.54 t/m²
-            treatment_volume_per_m2 = self.TREATMENT_DEPTH_M  # m³/m²
-            soil_mass_per_m2 = treatment_volume_per_m2 * self.SOIL_BULK_DENSITY  # t/m²
-
-            kg_per_m2 = (final_dosage / 100.0) * soil_mass_per_m2 * 1000  # kg/m²
-            kg_per_m3 = kg_per_m2 / self.TREATMENT_DEPTH_M  # kg/m³
-
-            # Erwartete Ev2-Verbesserung
-            # Konservative Schätzung: 2.5-fache Verbesserung bei optimaler Dosierung
-            improvement_factor = 2.0 + (final_dosage / 10.0)  # 2.0 - 2.8
-            expected_ev2_after = min(current_ev2 * improvement_factor, target_ev2)
+            if ev2_correction > 0:
+                self.logger.info(
+                    "Hoher Ev2-Verbesserungsbedarf (%.1fx): +%.1f%% Kalk",
+                    ev2_ratio, ev2_correction
+                )
 
-            result = {
-                'percentage': round(final_dosage, 1),
-                'kg_per_m3': round(kg_per_m3, 1),
-                'kg_per_m2': round(kg_per_m2, 1),
-                'treatment_depth_m': self.TREATMENT_DEPTH_M,
-                'expected_ev2_after': round(expected_ev2_after, 1)
-            }
+            result = self._lime_treatment_result(
+                final_dosage, kg_per_m3, kg_per_m2, expected_ev2_after, current_ev2
+            )
 
             self.logger.info(
-                f"Kalkdosierung berechnet: {result['percentage']}% "
-                f"({result['kg_per_m2']} kg/m²), "
-                f"erwarteter Ev2: {result['expected_ev2_after']} MN/m²"
+                "Kalkdosierung berechnet: %s%% (%s kg/m²), erwarteter Ev2: %s MN/m²",
+                result.percentage, result.kg_per_m2, result.expected_ev2_after
             )
 
             return result
@@ -240,7 +566,7 @@ class SoilStabilizationCalculator:
         subgrade_ev2: float,
         target_ev2: float = 120.0,
         area_m2: float = 1.0
-    ) -> Dict:
+    ) -> GravelResult:
         """
         Berechnet Schottertragschicht nach RStO 12.
 
@@ -250,53 +576,35 @@ class SoilStabilizationCalculator:
             area_m2: Flächengröße in m² (default: 1.0)
 
         Returns:
-            Dict mit:
-                - thickness_m: Schichtdicke verdichtet in m
-                - compacted_volume_m3: Volumen verdichtet in m³
-                - loose_volume_m3: Volumen lose (mit Auflockerung)
-                - mass_tons: Masse in Tonnen
-                - area_specific_kg_m2: Flächenspezifische Masse in kg/m²
+            GravelResult mit Schichtdicke, Volumina, Masse und
+            flächenspezifischer Masse
         """
         try:
             self.logger.info(
-                f"Berechne Schottertragschicht: Planum Ev2={subgrade_ev2} MN/m², "
-                f"Fläche={area_m2:.0f} m²"
+                "Berechne Schottertragschicht: Planum Ev2=%s MN/m², Fläche=%.0f m²",
+                subgrade_ev2, area_m2
             )
 
-            # Schichtdicke aus Tabelle ermitteln
-            thickness_m = 0.40  # Default: dickste Schicht
-
-            for min_ev2, thickness in GRAVEL_THICKNESS_TABLE:
-                if subgrade_ev2 >= min_ev2:
-                    thickness_m = thickness
-                    break
+            # Ohne Kalk (dosage_min = 0) bemisst der Kern nur den Schotter
+            thickness_m = _stabilization_per_m2(
+                0.0, 0.0, float(subgrade_ev2), float(target_ev2), 0.0, 0.0
+            )[-1]
+            (compacted_volume_m3, loose_volume_m3,
+             mass_tons, area_specific_kg_m2) = _gravel_quantities(float(area_m2), thickness_m)
 
             self.logger.info(
-                f"Schichtdicke aus RStO 12: {thickness_m*100:.0f} cm "
-                f"(bei Planum-Ev2 {subgrade_ev2} MN/m²)"
+                "Schichtdicke aus RStO 12: %.0f cm (bei Planum-Ev2 %s MN/m²)",
+                thickness_m * 100, subgrade_ev2
             )
 
-            # Volumenberechnung
-            compacted_volume_m3 = area_m2 * thickness_m
-            loose_volume_m3 = compacted_volume_m3 * self.GRAVEL_LOOSENING_FACTOR
-
-            # Massenberechnung (verdichteter Zustand)
-            mass_tons = compacted_volume_m3 * self.GRAVEL_BULK_DENSITY
-
-            # Flächenspezifisch
-            area_specific_kg_m2 = (mass_tons / area_m2) * 1000 if area_m2 > 0 else 0
-
-            result = {
-                'thickness_m': round(thickness_m, 2),
-                'compacted_volume_m3': round(compacted_volume_m3, 1),
-                'loose_volume_m3': round(loose_volume_m3, 1),
-                'mass_tons': round(mass_tons, 1),
-                'area_specific_kg_m2': round(area_specific_kg_m2, 0)
-            }
+            result = self._gravel_layer_result(
+                thickness_m, compacted_volume_m3, loose_volume_m3,
+                mass_tons, area_specific_kg_m2
+            )
 
             self.logger.info(
-                f"Schottertragschicht: {result['thickness_m']*100:.0f} cm, "
-                f"{result['mass_tons']:.0f} t ({result['loose_volume_m3']:.0f} m³ lose)"
+                "Schottertragschicht: %.0f cm, %.0f t (%.0f m³ lose)",
+                result.thickness_m * 100, result.mass_tons, result.loose_volume_m3
             )
 
             return result
@@ -312,7 +620,7 @@ class SoilStabilizationCalculator:
         current_ev2: float,
         water_content: Optional[float] = None,
         optimum_water: Optional[float] = None
-    ) -> Dict:
+    ) -> StabilizationResult:
         """
         Vollständige Berechnung für Kranstellfläche.
 
@@ -324,161 +632,416 @@ class SoilStabilizationCalculator:
             optimum_water: Optimaler Wassergehalt in % (optional)
 
         Returns:
-            Dict mit vollständigen Ergebnissen:
-                - area_m2: Flächengröße
-                - initial_ev2: Ausgangs-Ev2
-                - soil_type: Bodenart
-                - lime_treatment: Dict mit Kalkbehandlung oder None
-                - ev2_after_lime: Ev2 nach Kalkbehandlung
-                - gravel_layer: Dict mit Schottertragschicht
-                - final_ev2_expected: Erwarteter finaler Ev2
-                - total_lime_tons: Gesamtmenge Kalk in Tonnen
-                - total_gravel_tons: Gesamtmenge Schotter in Tonnen
-                - quality_notes: Liste mit Hinweisen
-                - reliability_rating: 'high', 'medium', 'low'
+            StabilizationResult mit Kalkbehandlung, Schottertragschicht,
+            Gesamtmengen, Qualitätshinweisen und Zuverlässigkeitsbewertung
         """
         try:
-            self.logger.info("=" * 60)
-            self.logger.info("BODENSTABILISIERUNG - Vollständige Berechnung")
-            self.logger.info("=" * 60)
-            self.logger.info(f"Fläche: {platform_area_m2:.0f} m²")
-            self.logger.info(f"Bodenart: {soil_type}")
-            self.logger.info(f"Ausgangs-Ev2: {current_ev2} MN/m²")
-
-            quality_notes = []
+            log_info = self.logger.isEnabledFor(logging.INFO)
+            if log_info:
+                self.logger.info("=" * 60)
+                self.logger.info("BODENSTABILISIERUNG - Vollständige Berechnung")
+                self.logger.info("=" * 60)
+                self.logger.info("Fläche: %.0f m²", platform_area_m2)
+                self.logger.info("Bodenart: %s", soil_type)
+                self.logger.info("Ausgangs-Ev2: %s MN/m²", current_ev2)
 
             # Setze Standardwerte für optionale Parameter
             if water_content is None or water_content == 0:
                 water_content = 0
-                quality_notes.append(
-                    "Wassergehalt unbekannt - Standarddosierung verwendet"
-                )
 
             if optimum_water is None or optimum_water == 0:
                 optimum_water = 0
 
             # === SCHRITT 1: Kalkstabilisierung (falls erforderlich) ===
+            # Kalkbehandlung bei Ev2 < 45 MN/m²
+            needs_lime = current_ev2 < 45.0
+            lime_applicable = needs_lime and soil_type in _LIME_APPLICABLE
             lime_treatment = None
-            ev2_after_lime = current_ev2
-            total_lime_tons = 0.0
+            dosage_min = dosage_max = 0.0  # 0 = Schotter direkt auf Bestands-Ev2
 
-            # Kalkbehandlung bei Ev2 < 45 MN/m²
-            if current_ev2 < 45.0:
+            if lime_applicable:
                 self.logger.info("Ev2 < 45 MN/m² → Kalkstabilisierung erforderlich")
+                row = _SOIL_TABLE[_SOIL_CODES[soil_type]]
+                dosage_min, dosage_max = float(row['dmin']), float(row['dmax'])
+            elif needs_lime:
+                # Sand/Kies: Kalk nicht geeignet, Kalkberechnung entfällt
+                if soil_type not in _SOIL_CODES:
+                    raise ValueError(f"Unbekannte Bodenart: {soil_type}")
 
-                lime_treatment = self.estimate_lime_dosage(
-                    soil_type=soil_type,
-                    water_content=water_content,
-                    optimum_water=optimum_water,
-                    current_ev2=current_ev2,
-                    target_ev2=60.0  # Ziel: mindestens 60 MN/m²
+                self.logger.warning(
+                    "Kalkstabilisierung für %s nicht empfohlen", soil_type
+                )
+                lime_treatment = self._lime_treatment_result(
+                    0.0, 0.0, 0.0, current_ev2, current_ev2
                 )
-
-                if lime_treatment['percentage'] > 0:
-                    ev2_after_lime = lime_treatment['expected_ev2_after']
-                    total_lime_tons = (lime_treatment['kg_per_m2'] * platform_area_m2) / 1000
-
-                    quality_notes.append(
-                        f"Kalkstabilisierung mit {lime_treatment['percentage']:.1f}% "
-                        f"(ca. {total_lime_tons:.1f} t) erforderlich"
-                    )
-
-                    if lime_treatment['percentage'] > 6.0:
-                        quality_notes.append(
-                            "WARNUNG: Hohe Kalkdosierung - Eignungsprüfung nach "
-                            "TP BF-StB zwingend erforderlich!"
-                        )
-                else:
-                    quality_notes.append(
-                        f"Kalkstabilisierung für {soil_type} nicht geeignet - "
-                        "Alternative Maßnahmen prüfen (Bodenaustausch, Zement)"
-                    )
             else:
                 self.logger.info("Ev2 ≥ 45 MN/m² → Keine Kalkstabilisierung erforderlich")
-                quality_notes.append(
-                    "Planum-Ev2 ausreichend - keine Bodenverfestigung nötig"
-                )
 
-            # === SCHRITT 2: Schottertragschicht ===
-            gravel_layer = self.calculate_gravel_layer(
-                subgrade_ev2=ev2_after_lime,
-                target_ev2=120.0,
-                area_m2=platform_area_m2
+            # === SCHRITT 2: Kalk und Schottertragschicht in einem Rechenkern ===
+            (final_dosage, kg_per_m2, kg_per_m3, expected_ev2_after, _, _, _,
+             thickness_m) = _stabilization_per_m2(
+                float(water_content), float(optimum_water), float(current_ev2),
+                60.0,  # Ziel: mindestens 60 MN/m² nach Kalk
+                dosage_min, dosage_max
             )
-
-            total_gravel_tons = gravel_layer['mass_tons']
-
-            quality_notes.append(
-                f"Schottertragschicht {gravel_layer['thickness_m']*100:.0f} cm "
-                f"(ca. {total_gravel_tons:.0f} t)"
+            (compacted_volume_m3, loose_volume_m3,
+             mass_tons, area_specific_kg_m2) = _gravel_quantities(
+                float(platform_area_m2), thickness_m
             )
 
-            # === SCHRITT 3: Finaler Ev2 ===
-            # Mit Schottertragschicht wird Ziel-Ev2 erreicht
-            final_ev2_expected = 120.0
+            if lime_applicable:
+                lime_treatment = self._lime_treatment_result(
+                    final_dosage, kg_per_m3, kg_per_m2, expected_ev2_after, current_ev2
+                )
+            gravel_layer = self._gravel_layer_result(
+                thickness_m, compacted_volume_m3, loose_volume_m3,
+                mass_tons, area_specific_kg_m2
+            )
 
-            # === SCHRITT 4: Zuverlässigkeitsbewertung ===
-            reliability_rating = self._assess_reliability(
+            # === SCHRITT 3-5: Ergebnis, Bewertung und Hinweise ===
+            result = self._build_requirements_result(
+                platform_area_m2=platform_area_m2,
                 soil_type=soil_type,
                 current_ev2=current_ev2,
                 water_content=water_content,
-                lime_treatment=lime_treatment
+                lime_treatment=lime_treatment,
+                gravel_layer=gravel_layer
             )
 
-            # === SCHRITT 5: Zusätzliche Qualitätshinweise ===
-            if gravel_layer['thickness_m'] > 0.30:
-                quality_notes.append(
-                    "Dicke Schotterschicht - Stufenweise Verdichtung erforderlich "
-                    "(max. 20cm pro Lage)"
-                )
+            if log_info:
+                self.logger.info("=" * 60)
+                self.logger.info("ERGEBNIS:")
+                self.logger.info("  Kalk: %.1f t", result.total_lime_tons)
+                self.logger.info("  Schotter: %.0f t", result.total_gravel_tons)
+                self.logger.info("  Finaler Ev2: %.0f MN/m²", result.final_ev2_expected)
+                self.logger.info("  Zuverlässigkeit: %s", result.reliability_rating)
+                self.logger.info("=" * 60)
 
-            if soil_type in ['Ton', 'Schluff', 'Lehm']:
-                quality_notes.append(
-                    "Bindiger Boden - Drainage und Oberflächenentwässerung kritisch!"
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Fehler bei Gesamtberechnung: {e}", exc_info=True)
+            raise
+
+    def calculate_many(
+        self,
+        sites: Sequence[StabilizationSite],
+        default_soil_type: str = 'Schluff',
+        max_workers: Optional[int] = None
+    ) -> List[StabilizationResult]:
+        """
+        Vollständige Berechnung für mehrere WEA-Standorte.
+
+        Fehlende Bodenarten werden parallel über BGR abgefragt (I/O-gebunden,
+        daher Threads); die eigentliche Berechnung läuft anschließend
+        vektorisiert über calculate_full_requirements_batch().
+
+        Args:
+            sites: Standorte mit Fläche, Ev2 und optional Bodenart/Wassergehalt
+            default_soil_type: Bodenart, falls BGR keine verwertbaren Daten liefert
+            max_workers: Anzahl paralleler BGR-Abfragen (1 = sequentiell,
+                z.B. wenn nur der QGIS-Hauptthread genutzt werden darf)
+
+        Returns:
+            Liste von StabilizationResult in Reihenfolge der Standorte
+        """
+        sites = list(sites)
+        if not sites:
+            return []
+
+        soil_types = [site.soil_type for site in sites]
+        unknown = [i for i, soil in enumerate(soil_types) if soil is None]
+
+        if unknown:
+            if max_workers is None:
+                max_workers = min(16, len(unknown))
+
+            # Gemeinsamen BGR-Client vorab anlegen, damit alle Threads
+            # dieselbe HTTP-Session nutzen
+            if self._bgr_api is None and BGR_API_AVAILABLE:
+                self._bgr_api = BGRSoilAPI()
+
+            def query(site: StabilizationSite) -> Dict:
+                return self.query_soil_data_from_bgr(site.point, site.crs)
+
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    soil_data = list(executor.map(query, [sites[i] for i in unknown]))
+            else:
+                soil_data = [query(sites[i]) for i in unknown]
+
+            for i, data in zip(unknown, soil_data):
+                soil_type = data.get('soil_type')
+                if soil_type not in _SOIL_CODES:
+                    self.logger.warning(
+                        "Keine verwertbare BGR-Bodenart für Standort %d (%s) - verwende %s",
+                        i, soil_type, default_soil_type
+                    )
+                    soil_type = default_soil_type
+                soil_types[i] = soil_type
+
+        return self.calculate_full_requirements_batch(
+            platform_areas_m2=[site.platform_area_m2 for site in sites],
+            soil_types=soil_types,
+            current_ev2s=[site.current_ev2 for site in sites],
+            water_contents=[site.water_content for site in sites],
+            optimum_waters=[site.optimum_water for site in sites]
+        )
+
+    def calculate_full_requirements_batch(
+        self,
+        platform_areas_m2: Sequence[float],
+        soil_types: Sequence[str],
+        current_ev2s: Sequence[float],
+        water_contents: Optional[Sequence[Optional[float]]] = None,
+        optimum_waters: Optional[Sequence[Optional[float]]] = None
+    ) -> List[StabilizationResult]:
+        """
+        Vollständige Berechnung für mehrere Kranstellflächen auf einmal.
+
+        Liefert für jede Fläche dasselbe Ergebnis wie
+        calculate_full_requirements(), rechnet Kalkdosierung und
+        Schotterdicke aber als NumPy-Arrayoperationen statt pro Fläche.
+
+        Args:
+            platform_areas_m2: Kranstellflächen in m²
+            soil_types: Bodenarten (z.B. 'Ton', 'Schluff')
+            current_ev2s: Aktuelle Ev2-Werte in MN/m²
+            water_contents: Aktuelle Wassergehalte in % (optional, None = unbekannt)
+            optimum_waters: Optimale Wassergehalte in % (optional, None = unbekannt)
+
+        Returns:
+            Liste von StabilizationResult wie bei calculate_full_requirements()
+
+        Raises:
+            ValueError: Wenn Eingabelängen nicht übereinstimmen oder eine
+                Bodenart mit Kalkbedarf unbekannt ist
+        """
+        soil_types = list(soil_types)
+        n = len(soil_types)
+
+        areas = np.asarray(platform_areas_m2, dtype=float)
+        ev2 = np.asarray(current_ev2s, dtype=float)
+        water = _as_float_array(water_contents, n)
+        optimum = _as_float_array(optimum_waters, n)
+
+        if not (areas.shape == ev2.shape == water.shape == optimum.shape == (n,)):
+            raise ValueError("Eingabelisten müssen gleich lang sein")
+
+        self.logger.info("Bodenstabilisierung (Batch): %d Kranstellflächen", n)
+
+        # Bodenarten auf Tabellenindex abbilden (-1 = unbekannt)
+        codes = np.fromiter(
+            (_SOIL_CODES.get(soil, -1) for soil in soil_types), dtype=np.intp, count=n
+        )
+        needs_lime = ev2 < 45.0
+        unknown = needs_lime & (codes < 0)
+        if unknown.any():
+            raise ValueError(f"Unbekannte Bodenart: {soil_types[int(np.argmax(unknown))]}")
+
+        # === Kalkdosierung (vektorisiert) ===
+        safe_codes = np.where(codes < 0, 0, codes)
+        soil_rows = _SOIL_TABLE[safe_codes]
+        dosage_min = soil_rows['dmin']
+        dosage_max = soil_rows['dmax']
+        lime_applicable = needs_lime & (dosage_min > 0)
+
+        base_dosage = (dosage_min + dosage_max) / 2.0
+        water_known = (water > 0) & (optimum > 0)
+        water_correction = np.where(water_known, np.maximum(water - optimum, 0.0), 0.0) * 0.3
+        ev2_ratio = np.divide(60.0, ev2, out=np.ones(n), where=ev2 > 0)
+        ev2_correction = np.where(ev2_ratio > 3.0, 1.0, 0.0)
+        final_dosage = np.clip(base_dosage + water_correction + ev2_correction, 2.0, 8.0)
+        final_dosage = np.where(lime_applicable, final_dosage, 0.0)
+
+        soil_mass_per_m2 = _TREATMENT_DEPTH_M * _SOIL_BULK_DENSITY
+        kg_per_m2 = (final_dosage / 100.0) * soil_mass_per_m2 * 1000
+        kg_per_m3 = kg_per_m2 / _TREATMENT_DEPTH_M
+        expected_ev2_after = np.minimum(ev2 * (2.0 + final_dosage / 10.0), 60.0)
+
+        # === Schottertragschicht (vektorisiert) ===
+        subgrade_ev2 = np.where(lime_applicable, np.round(expected_ev2_after, 1), ev2)
+        thickness_idx = np.searchsorted(_GRAVEL_EV2_THRESHOLDS, subgrade_ev2, side='right') - 1
+        thickness_m = _GRAVEL_THICKNESSES[np.maximum(thickness_idx, 0)]
+        compacted_volume_m3 = areas * thickness_m
+        loose_volume_m3 = compacted_volume_m3 * _GRAVEL_LOOSENING_FACTOR
+        mass_tons = compacted_volume_m3 * _GRAVEL_BULK_DENSITY
+        area_specific_kg_m2 = np.divide(
+            mass_tons, areas, out=np.zeros(n), where=areas > 0
+        ) * 1000
+
+        # === Ergebnisse pro Fläche ===
+        results = []
+        for k in range(n):
+            lime_treatment = None
+            if needs_lime[k]:
+                lime_treatment = self._lime_treatment_result(
+                    float(final_dosage[k]), float(kg_per_m3[k]), float(kg_per_m2[k]),
+                    float(expected_ev2_after[k]), float(ev2[k])
                 )
 
-            if current_ev2 < 25.0:
+            gravel_layer = self._gravel_layer_result(
+                float(thickness_m[k]), float(compacted_volume_m3[k]),
+                float(loose_volume_m3[k]), float(mass_tons[k]),
+                float(area_specific_kg_m2[k])
+            )
+
+            results.append(self._build_requirements_result(
+                platform_area_m2=float(areas[k]),
+                soil_type=soil_types[k],
+                current_ev2=float(ev2[k]),
+                water_content=float(water[k]),
+                lime_treatment=lime_treatment,
+                gravel_layer=gravel_layer
+            ))
+
+        return results
+
+    def _lime_treatment_result(
+        self,
+        final_dosage: float,
+        kg_per_m3: float,
+        kg_per_m2: float,
+        expected_ev2_after: float,
+        current_ev2: float
+    ) -> LimeResult:
+        """LimeResult aus Rohwerten; Dosierung 0 = Kalk nicht geeignet."""
+        if final_dosage <= 0:
+            return LimeResult(
+                percentage=0.0,
+                kg_per_m3=0.0,
+                kg_per_m2=0.0,
+                treatment_depth_m=0.0,
+                expected_ev2_after=current_ev2
+            )
+
+        return LimeResult(
+            percentage=final_dosage,
+            kg_per_m3=kg_per_m3,
+            kg_per_m2=kg_per_m2,
+            treatment_depth_m=_TREATMENT_DEPTH_M,
+            expected_ev2_after=expected_ev2_after
+        )
+
+    def _gravel_layer_result(
+        self,
+        thickness_m: float,
+        compacted_volume_m3: float,
+        loose_volume_m3: float,
+        mass_tons: float,
+        area_specific_kg_m2: float
+    ) -> GravelResult:
+        """GravelResult aus Rohwerten."""
+        return GravelResult(
+            thickness_m=thickness_m,
+            compacted_volume_m3=compacted_volume_m3,
+            loose_volume_m3=loose_volume_m3,
+            mass_tons=mass_tons,
+            area_specific_kg_m2=area_specific_kg_m2
+        )
+
+    def _build_requirements_result(
+        self,
+        platform_area_m2: float,
+        soil_type: str,
+        current_ev2: float,
+        water_content: float,
+        lime_treatment: Optional[LimeResult],
+        gravel_layer: GravelResult
+    ) -> StabilizationResult:
+        """
+        Stellt das Ergebnis inkl. Qualitätshinweisen und Bewertung zusammen.
+
+        Args:
+            platform_area_m2: Kranstellfläche in m²
+            soil_type: Bodenart
+            current_ev2: Ausgangs-Ev2 in MN/m²
+            water_content: Wassergehalt in % (0 = unbekannt)
+            lime_treatment: Ergebnis von estimate_lime_dosage() oder None
+            gravel_layer: Ergebnis von calculate_gravel_layer()
+
+        Returns:
+            StabilizationResult wie bei calculate_full_requirements()
+        """
+        quality_notes = []
+
+        if water_content == 0:
+            quality_notes.append(_NOTE_WATER_UNKNOWN)
+
+        # Kalkstabilisierung
+        ev2_after_lime = current_ev2
+        total_lime_tons = 0.0
+
+        if lime_treatment is not None:
+            if lime_treatment.percentage > 0:
+                ev2_after_lime = lime_treatment.expected_ev2_after
+                total_lime_tons = (lime_treatment.kg_per_m2 * platform_area_m2) / 1000
+
                 quality_notes.append(
-                    "ACHTUNG: Sehr weicher Untergrund - Tragfähigkeitsprüfung "
-                    "und ggf. Bodenaustausch erwägen"
+                    f"Kalkstabilisierung mit {lime_treatment.percentage:.1f}% "
+                    f"(ca. {total_lime_tons:.1f} t) erforderlich"
                 )
-                reliability_rating = 'low'
-
-            # === ERGEBNIS ===
-            result = {
-                'area_m2': round(platform_area_m2, 1),
-                'initial_ev2': round(current_ev2, 1),
-                'soil_type': soil_type,
-                'lime_treatment': lime_treatment,
-                'ev2_after_lime': round(ev2_after_lime, 1),
-                'gravel_layer': gravel_layer,
-                'final_ev2_expected': round(final_ev2_expected, 1),
-                'total_lime_tons': round(total_lime_tons, 1),
-                'total_gravel_tons': round(total_gravel_tons, 0),
-                'quality_notes': quality_notes,
-                'reliability_rating': reliability_rating
-            }
 
-            self.logger.info("=" * 60)
-            self.logger.info("ERGEBNIS:")
-            self.logger.info(f"  Kalk: {result['total_lime_tons']:.1f} t")
-            self.logger.info(f"  Schotter: {result['total_gravel_tons']:.0f} t")
-            self.logger.info(f"  Finaler Ev2: {result['final_ev2_expected']:.0f} MN/m²")
-            self.logger.info(f"  Zuverlässigkeit: {result['reliability_rating']}")
-            self.logger.info("=" * 60)
+                if lime_treatment.percentage > 6.0:
+                    quality_notes.append(_NOTE_HIGH_LIME)
+            else:
+                note = _NOTE_LIME_UNSUITABLE.get(soil_type)
+                if note is None:
+                    note = _NOTE_LIME_UNSUITABLE_TMPL.format(soil_type=soil_type)
+                quality_notes.append(note)
+        else:
+            quality_notes.append(_NOTE_NO_STABILIZATION)
 
-            return result
+        # Schottertragschicht
+        total_gravel_tons = gravel_layer.mass_tons
 
-        except Exception as e:
-            self.logger.error(f"Fehler bei Gesamtberechnung: {e}", exc_info=True)
-            raise
+        quality_notes.append(
+            f"Schottertragschicht {gravel_layer.thickness_m*100:.0f} cm "
+            f"(ca. {total_gravel_tons:.0f} t)"
+        )
+
+        # Finaler Ev2: Mit Schottertragschicht wird Ziel-Ev2 erreicht
+        final_ev2_expected = 120.0
+
+        # Zuverlässigkeitsbewertung
+        reliability_rating = self._assess_reliability(
+            soil_type=soil_type,
+            current_ev2=current_ev2,
+            water_content=water_content,
+            lime_treatment=lime_treatment
+        )
+
+        # Zusätzliche Qualitätshinweise
+        if gravel_layer.thickness_m > 0.30:
+            quality_notes.append(_NOTE_THICK_GRAVEL)
+
+        if soil_type in _COHESIVE_SOILS:
+            quality_notes.append(_NOTE_COHESIVE)
+
+        if current_ev2 < 25.0:
+            quality_notes.append(_NOTE_VERY_SOFT)
+            reliability_rating = 'low'
+
+        return StabilizationResult(
+            area_m2=platform_area_m2,
+            initial_ev2=current_ev2,
+            soil_type=soil_type,
+            lime_treatment=lime_treatment,
+            ev2_after_lime=ev2_after_lime,
+            gravel_layer=gravel_layer,
+            final_ev2_expected=final_ev2_expected,
+            total_lime_tons=total_lime_tons,
+            total_gravel_tons=total_gravel_tons,
+            quality_notes=tuple(quality_notes),
+            reliability_rating=reliability_rating
+        )
 
     def _assess_reliability(
         self,
         soil_type: str,
         current_ev2: float,
         water_content: float,
-        lime_treatment: Optional[Dict]
+        lime_treatment: Optional[LimeResult]
     ) -> str:
         """
         Bewertet Zuverlässigkeit der Berechnung.
@@ -494,10 +1057,10 @@ class SoilStabilizationCalculator:
         if current_ev2 < 25.0:
             return 'low'
 
-        if lime_treatment and lime_treatment.get('percentage', 0) > 6.0:
+        if lime_treatment is not None and lime_treatment.percentage > 6.0:
             return 'low'
 
-        if soil_type in ['Sand', 'Kies'] and current_ev2 < 45.0:
+        if soil_type in _NONCOHESIVE_SOILS and current_ev2 < 45.0:
             return 'low'
 
         # Ansonsten: Mittlere Zuverlässigkeit
@@ -516,17 +1079,9 @@ class SoilStabilizationCalculator:
         Raises:
             ValueError: Wenn Bodenklasse unbekannt
         """
-        din_class_upper = din_class.upper().strip()
-
-        if din_class_upper in DIN_SOIL_CLASSIFICATION:
-            soil_type = DIN_SOIL_CLASSIFICATION[din_class_upper]
-            self.logger.info(f"DIN-Klasse {din_class} → {soil_type}")
-            return soil_type
-        else:
-            raise ValueError(
-                f"Unbekannte DIN-Bodenklasse: {din_class}. "
-                f"Bekannte Klassen: {', '.join(DIN_SOIL_CLASSIFICATION.keys())}"
-            )
+        soil_type = _din_to_soil_type(din_class)
+        self.logger.info("DIN-Klasse %s → %s", din_class, soil_type)
+        return soil_type
 
     def query_soil_data_from_bgr(
         self,
@@ -549,49 +1104,30 @@ class SoilStabilizationCalculator:
                 - description: Bodenbeschreibung
                 - error: Fehlermeldung (optional)
         """
+        if not BGR_API_AVAILABLE:
+            self.logger.error("BGR-API-Modul konnte nicht geladen werden")
+            return dict(_BGR_UNAVAILABLE)
+
         try:
-            from .bgr_soil_api import get_soil_data_from_bgr
+            key = BGRResultCache.make_key(coordinates, crs)
+            cached = self._bgr_cache_get(key)
+            if cached is not None:
+                self.logger.info("BGR-Bodendaten aus Cache: %s", cached.get('soil_type'))
+                return cached
 
             self.logger.info("Starte BGR-Bodendaten-Abfrage...")
 
-            result = get_soil_data_from_bgr(coordinates, crs, buffer_m=100.0)
-
-            if result.get('success'):
-                self.logger.info(
-                    f"BGR-Daten erfolgreich: {result.get('soil_type')} "
-                    f"(Code: {result.get('soil_code')})"
-                )
-
-                return {
-                    'soil_type': result.get('soil_type'),
-                    'soil_code': result.get('soil_code'),
-                    'source': result.get('source', 'BGR WFS'),
-                    'available': True,
-                    'description': result.get('description', ''),
-                    'legend': result.get('legend', '')
-                }
+            if self._bgr_api is not None:
+                result = self._bgr_api.query_soil_at_point(coordinates, crs, buffer_m=100.0)
             else:
-                self.logger.warning(
-                    f"BGR-Abfrage fehlgeschlagen: {result.get('error')}"
-                )
+                result = get_soil_data_from_bgr(coordinates, crs, buffer_m=100.0)
 
-                return {
-                    'soil_type': None,
-                    'soil_code': None,
-                    'source': 'BGR WFS (Fehler)',
-                    'available': False,
-                    'error': result.get('error', 'Unbekannter Fehler')
-                }
+            soil_data = self._bgr_result_to_soil_data(result)
+            if soil_data['available']:
+                self._bgr_cache_put(key, soil_data)
+
+            return soil_data
 
-        except ImportError as e:
-            self.logger.error(f"BGR-API-Modul konnte nicht geladen werden: {e}")
-            return {
-                'soil_type': None,
-                'soil_code': None,
-                'source': 'BGR WFS (nicht verfügbar)',
-                'available': False,
-                'error': 'BGR-API-Modul fehlt'
-            }
         except Exception as e:
             self.logger.error(f"BGR-Abfrage fehlgeschlagen: {e}", exc_info=True)
             return {
@@ -601,3 +1137,96 @@ class SoilStabilizationCalculator:
                 'available': False,
                 'error': str(e)
             }
+
+    def query_soil_data_from_bgr_batch(
+        self,
+        points: Sequence[QgsPointXY],
+        crs: 'QgsCoordinateReferenceSystem'
+    ) -> List[Dict]:
+        """
+        Fragt Bodendaten mehrerer WEA-Standorte mit einer WFS-Abfrage ab.
+
+        Der BGR-Client (und damit seine HTTP-Session) wird am Rechner
+        gespeichert und bei weiteren Abfragen wiederverwendet.
+
+        Args:
+            points: WEA-Standorte
+            crs: Koordinatenreferenzsystem
+
+        Returns:
+            Liste von Dicts wie bei query_soil_data_from_bgr(), in Reihenfolge der Punkte
+        """
+        points = list(points)
+
+        if not BGR_API_AVAILABLE:
+            self.logger.error("BGR-API-Modul konnte nicht geladen werden")
+            return [dict(_BGR_UNAVAILABLE) for _ in points]
+
+        keys = [BGRResultCache.make_key(point, crs) for point in points]
+        soil_data = [self._bgr_cache_get(key) for key in keys]
+
+        # Nur Standorte ohne Cache-Treffer abfragen
+        missing = [i for i, data in enumerate(soil_data) if data is None]
+        if not missing:
+            self.logger.info("BGR-Bodendaten für %d Standorte aus Cache", len(points))
+            return soil_data
+
+        self.logger.info("Starte BGR-Sammelabfrage für %d Standorte...", len(missing))
+
+        if self._bgr_api is None:
+            self._bgr_api = BGRSoilAPI()
+
+        results = get_soil_data_batch(
+            [points[i] for i in missing], crs, buffer_m=100.0, api=self._bgr_api
+        )
+
+        for i, result in zip(missing, results):
+            soil_data[i] = self._bgr_result_to_soil_data(result)
+            if soil_data[i]['available']:
+                self._bgr_cache_put(keys[i], soil_data[i])
+
+        return soil_data
+
+    def _bgr_cache_get(self, key: str) -> Optional[Dict]:
+        """Liest aus dem BGR-Cache; Cache-Fehler werden nur protokolliert."""
+        try:
+            return get_bgr_cache().get(key)
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"BGR-Cache nicht lesbar: {e}")
+            return None
+
+    def _bgr_cache_put(self, key: str, soil_data: Dict):
+        """Schreibt in den BGR-Cache; Cache-Fehler werden nur protokolliert."""
+        try:
+            get_bgr_cache().put(key, soil_data)
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"BGR-Cache nicht beschreibbar: {e}")
+
+    def _bgr_result_to_soil_data(self, result: Dict) -> Dict:
+        """Wandelt ein BGR-API-Ergebnis in das Rückgabeformat der Abfragemethoden um."""
+        if result.get('success'):
+            self.logger.info(
+                f"BGR-Daten erfolgreich: {result.get('soil_type')} "
+                f"(Code: {result.get('soil_code')})"
+            )
+
+            return {
+                'soil_type': result.get('soil_type'),
+                'soil_code': result.get('soil_code'),
+                'source': result.get('source', 'BGR WFS'),
+                'available': True,
+                'description': result.get('description', ''),
+                'legend': result.get('legend', '')
+            }
+
+        self.logger.warning(
+            f"BGR-Abfrage fehlgeschlagen: {result.get('error')}"
+        )
+
+        return {
+            'soil_type': None,
+            'soil_code': None,
+            'source': 'BGR WFS (Fehler)',
+            'available': False,
+            'error': result.get('error', 'Unbekannter Fehler')
+        }
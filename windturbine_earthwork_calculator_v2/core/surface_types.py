@@ -12,10 +12,13 @@ Version: 2.0.0 - Multi-Surface Extension
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
-from qgis.core import QgsGeometry
+from qgis.core import QgsGeometry, QgsGeometryEngine
+
+from ..utils.geometry_utils import prepared_engine
 
 
 class SurfaceType(Enum):
@@ -107,6 +110,51 @@ class SurfaceConfig:
                     f"[±{self.slope_min}%, ±{self.slope_max}%]"
                 )
 
+    @cached_property
+    def area(self) -> float:
+        """
+        Surface area in m² (computed once; geometries are not modified after import).
+
+        Reuses the area measured by the DXF importer when the metadata has it.
+        """
+        area = self.metadata.get('area')
+        if area is not None:
+            return float(area)
+        return self.geometry.area()
+
+    @cached_property
+    def engine(self) -> QgsGeometryEngine:
+        """
+        Prepared GEOS engine for the surface geometry.
+
+        Built once and shared by the validator and the calculator, so
+        repeated predicates (contains, intersects, ...) use the prepared
+        edge index instead of rescanning all vertices.
+        """
+        return prepared_engine(self.geometry)
+
+    def repair_geometry(self) -> bool:
+        """
+        Replace an invalid geometry with its makeValid() repair.
+
+        Drops the cached area and prepared engine so they are rebuilt
+        from the repaired geometry.
+
+        Returns:
+            True if the geometry was invalid and has been repaired
+        """
+        if self.geometry.isGeosValid():
+            return False
+        repaired = self.geometry.makeValid()
+        if repaired is None or repaired.isEmpty():
+            return False
+        self.geometry = repaired
+        self.metadata.pop('area', None)
+        self.metadata.pop('is_valid', None)
+        self.__dict__.pop('area', None)
+        self.__dict__.pop('engine', None)
+        return True
+
 
 @dataclass
 class MultiSurfaceProject:
@@ -199,10 +247,15 @@ class MultiSurfaceProject:
         """Elevation of foundation bottom."""
         return self.fok - self.foundation_depth
 
-    def validate(self) -> tuple[bool, str]:
+    def validate(self, check_geometry_validity: bool = True) -> tuple[bool, str]:
         """
         Validate project configuration.
 
+        Args:
+            check_geometry_validity: Run the GEOS validity check on every
+                surface geometry. Can be disabled when the geometries were
+                already validated on import.
+
         Returns:
             Tuple of (is_valid, error_message)
         """
@@ -237,7 +290,7 @@ class MultiSurfaceProject:
             surface = getattr(self, surface_name)
             if surface.geometry.isEmpty():
                 errors.append(f"{surface.surface_type.display_name} geometry is empty")
-            if not surface.geometry.isGeosValid():
+            if check_geometry_validity and not surface.geometry.isGeosValid():
                 errors.append(f"{surface.surface_type.display_name} geometry is invalid")
 
         # Check geometries are valid (optional surfaces)
@@ -246,7 +299,7 @@ class MultiSurfaceProject:
             if surface is not None:
                 if surface.geometry.isEmpty():
                     errors.append(f"{surface.surface_type.display_name} geometry is empty")
-                if not surface.geometry.isGeosValid():
+                if check_geometry_validity and not surface.geometry.isGeosValid():
                     errors.append(f"{surface.surface_type.display_name} geometry is invalid")
 
         # Check road access specific parameters
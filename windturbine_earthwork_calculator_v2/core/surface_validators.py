@@ -11,10 +11,10 @@ Author: Wind Energy Site Planning
 Version: 2.0.0 - Multi-Surface Extension
 """
 
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional, FrozenSet
 import math
 
-from qgis.core import QgsGeometry, QgsPointXY, QgsWkbTypes
+from qgis.core import QgsGeometry, QgsGeometryEngine, QgsPointXY, QgsRectangle, QgsWkbTypes
 
 from .surface_types import MultiSurfaceProject, SurfaceType, SurfaceConfig
 from ..utils.logging_utils import get_plugin_logger
@@ -40,9 +40,121 @@ def _format_error(error_key, **params):
     return f"{error_msg}\n{fix_msg}"
 
 
+def _polygon_edges(geometry: QgsGeometry) -> FrozenSet[FrozenSet[Tuple[float, float]]]:
+    """
+    Collect the ring edges of a polygon as an orientation-free set.
+
+    Coordinates are rounded to millimetres so that snapped vertices of
+    neighbouring surfaces compare equal.
+
+    Args:
+        geometry: Polygon or multipolygon geometry
+
+    Returns:
+        Set of edges, each edge a frozenset of its two end points
+    """
+    if geometry.isMultipart():
+        polygons = geometry.asMultiPolygon()
+    else:
+        polygons = [geometry.asPolygon()]
+
+    edges = set()
+    for polygon in polygons:
+        for ring in polygon:
+            points = [(round(p.x(), 3), round(p.y(), 3)) for p in ring]
+            for p1, p2 in zip(points, points[1:]):
+                if p1 != p2:
+                    edges.add(frozenset((p1, p2)))
+    return frozenset(edges)
+
+
+# Bucket sizes of _supporting_lines(). Coarse on purpose: a false match only
+# costs a GEOS intersection, a missed one would undercount a shared border.
+_LINE_ANGLE_STEP = 0.01   # rad
+_LINE_OFFSET_STEP = 1.0   # m
+_LINE_ANGLE_BINS = round(math.pi / _LINE_ANGLE_STEP)
+
+
+def _supporting_lines(edges, origin: Tuple[float, float],
+                      widen: bool = False) -> Dict[Tuple[int, int], List[Tuple[float, float]]]:
+    """
+    Group edges by their quantised supporting line (direction mod pi, offset).
+
+    Two edges can only share a stretch of border if they lie on the same
+    line and their extents along it overlap.
+
+    Args:
+        edges: Edges as returned by _polygon_edges()
+        origin: Local origin for offsets and positions (keeps them small
+            for UTM coordinates)
+        widen: Also file each edge under the neighbouring buckets, so
+            values close to a bucket border still match
+
+    Returns:
+        Dict (angle bucket, offset bucket) -> list of (start, end) positions
+        of the edges along the line direction
+    """
+    ox, oy = origin
+    lines = {}
+    for edge in edges:
+        (x1, y1), (x2, y2) = tuple(edge)
+        theta = math.atan2(y2 - y1, x2 - x1) % math.pi
+        cos_t, sin_t = math.cos(theta), math.sin(theta)
+        offset = (y1 - oy) * cos_t - (x1 - ox) * sin_t
+        t1 = (x1 - ox) * cos_t + (y1 - oy) * sin_t
+        t2 = (x2 - ox) * cos_t + (y2 - oy) * sin_t
+        extent = (min(t1, t2), max(t1, t2))
+        a = round(theta / _LINE_ANGLE_STEP)
+        c = round(offset / _LINE_OFFSET_STEP)
+        if not widen:
+            lines.setdefault((a, c), []).append(extent)
+            continue
+        # Directions near 0 and near pi are the same line with direction
+        # and normal flipped, so offset and positions change sign
+        flipped = (-extent[1], -extent[0])
+        for da in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                lines.setdefault((a + da, c + dc), []).append(extent)
+                lines.setdefault((a + da - _LINE_ANGLE_BINS, -(c + dc)), []).append(flipped)
+                lines.setdefault((a + da + _LINE_ANGLE_BINS, -(c + dc)), []).append(flipped)
+    return lines
+
+
+def _edges_may_overlap(edges1, edges2, origin: Tuple[float, float],
+                       tolerance: float = 0.01) -> bool:
+    """
+    Check whether any edge of edges1 may run along an edge of edges2.
+
+    Conservative: near-collinear edges whose extents overlap by more than
+    tolerance count as overlapping.
+    """
+    lines2 = _supporting_lines(edges2, origin, widen=True)
+    for key, extents1 in _supporting_lines(edges1, origin).items():
+        for start1, end1 in extents1:
+            for start2, end2 in lines2.get(key, ()):
+                if min(end1, end2) - max(start1, start2) > tolerance:
+                    return True
+    return False
+
+
 class SurfaceValidator:
     """Validates spatial relationships between surfaces in a multi-surface project."""
 
+    # Reasonable size ranges (m²)
+    SIZE_LIMITS: Dict[SurfaceType, Tuple[int, int]] = {
+        SurfaceType.CRANE_PAD: (100, 20000),     # 10×10m to ~140×140m
+        SurfaceType.FOUNDATION: (50, 5000),      # Ø8m to Ø80m
+        SurfaceType.BOOM: (50, 10000),           # Various sizes up to 100×100m
+        SurfaceType.ROTOR_STORAGE: (50, 5000),   # Various sizes up to ~70×70m
+    }
+
+    # Douglas-Peucker tolerance (m) for geometries used in distance checks;
+    # far below the 0.5-5 m distance tolerances of the validators
+    DISTANCE_SIMPLIFY_TOLERANCE = 0.01
+
+    # Intersection area (m²) above which boom and rotor count as overlapping
+    OVERLAP_AREA_TOLERANCE = 1e-6
+
     def __init__(self, project: MultiSurfaceProject):
         """
         Initialize validator.
@@ -53,19 +165,124 @@ class SurfaceValidator:
         self.project = project
         self.logger = get_plugin_logger()
 
-    def validate_all(self) -> Tuple[bool, List[str]]:
+        # Required surfaces first, then optional surfaces (may be None)
+        self._surfaces: Tuple[SurfaceConfig, ...] = (
+            project.crane_pad,
+            project.foundation,
+            project.boom,
+            project.rotor_storage,
+        )
+        self._surface_map: Dict[SurfaceType, SurfaceConfig] = {
+            SurfaceType.CRANE_PAD: project.crane_pad,
+            SurfaceType.FOUNDATION: project.foundation,
+            SurfaceType.BOOM: project.boom,
+            SurfaceType.ROTOR_STORAGE: project.rotor_storage,
+        }
+
+        # Polygon boundaries per surface, computed on first use
+        self._boundaries: Dict[SurfaceType, Optional[QgsGeometry]] = {}
+
+        # Bounding boxes per surface for cheap rejection before GEOS predicates
+        self._bboxes: Dict[SurfaceType, QgsRectangle] = {}
+
+        # Simplified geometries per surface for distance checks
+        self._simplified: Dict[SurfaceType, QgsGeometry] = {}
+
+    def invalidate_cache(self):
+        """Drop cached boundaries, bounding boxes and simplified geometries (call after changing project geometries)."""
+        self._boundaries.clear()
+        self._bboxes.clear()
+        self._simplified.clear()
+
+    def _bbox(self, surface_type: SurfaceType) -> QgsRectangle:
+        """Get the (cached) bounding box of a surface."""
+        bbox = self._bboxes.get(surface_type)
+        if bbox is None:
+            bbox = self._get_surface_geometry(surface_type).boundingBox()
+            self._bboxes[surface_type] = bbox
+        return bbox
+
+    def _simplified_geometry(self, surface_type: SurfaceType) -> QgsGeometry:
+        """
+        Get the (cached) simplified geometry of a surface.
+
+        DXF imports often contain many near-collinear vertices. Distance
+        checks are not prepared, so they run on a copy simplified by
+        DISTANCE_SIMPLIFY_TOLERANCE. Exact predicates, areas and edge
+        lengths keep using the original geometry.
+
+        Args:
+            surface_type: Surface to get the simplified geometry for
+
+        Returns:
+            Simplified geometry (original geometry if simplification fails)
+        """
+        simplified = self._simplified.get(surface_type)
+        if simplified is None:
+            geometry = self._get_surface_geometry(surface_type)
+            simplified = geometry.simplify(self.DISTANCE_SIMPLIFY_TOLERANCE)
+            if simplified.isNull() or simplified.isEmpty():
+                simplified = geometry
+            self._simplified[surface_type] = simplified
+        return simplified
+
+    def _engine(self, surface_type: SurfaceType) -> QgsGeometryEngine:
+        """
+        Get the prepared geometry engine of a surface.
+
+        The engine is owned by the SurfaceConfig and shared with the
+        calculator, so it is only prepared once per workflow.
+
+        Args:
+            surface_type: Surface to get the engine for
+
+        Returns:
+            Prepared QgsGeometryEngine for the surface geometry
+        """
+        return self._get_surface(surface_type).engine
+
+    def _boundary(self, surface_type: SurfaceType) -> Optional[QgsGeometry]:
+        """
+        Get the (cached) boundary of a surface.
+
+        Args:
+            surface_type: Surface to get the boundary for
+
+        Returns:
+            Boundary as LineString geometry, or None if it cannot be built
+        """
+        if surface_type not in self._boundaries:
+            self._boundaries[surface_type] = get_polygon_boundary(
+                self._get_surface_geometry(surface_type)
+            )
+        return self._boundaries[surface_type]
+
+    def validate_all(self, skip_validity: bool = False) -> Tuple[bool, List[str]]:
         """
         Run all validation checks.
 
+        Args:
+            skip_validity: Skip the GEOS validity check of the surface
+                geometries (e.g. when the DXF importer already validated them)
+
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
         errors = []
 
-        # 1. Validate project configuration
-        config_valid, config_error = self.project.validate()
+        # 1. Validate project configuration; spatial checks on empty or
+        # invalid geometries are meaningless, so stop here on failure
+        config_valid, config_error = self.project.validate(
+            check_geometry_validity=not skip_validity
+        )
         if not config_valid:
             errors.append(_format_error('config_error', error=config_error))
+            return False, errors
+
+        # Prepare the geometries shared by the predicate checks below
+        self._engine(SurfaceType.CRANE_PAD)
+        if self.project.boom is not None:
+            self._engine(SurfaceType.BOOM)
 
         # 2. Foundation within crane pad
         valid, error = self.validate_foundation_in_crane_pad()
@@ -108,13 +325,24 @@ class SurfaceValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        crane_geom = self.project.crane_pad.geometry
-        foundation_geom = self.project.foundation.geometry
-
-        # Check if foundation touches or intersects crane pad
-        if not crane_geom.touches(foundation_geom) and not crane_geom.intersects(foundation_geom):
+        # Bounding boxes further apart than the tolerance cannot touch
+        crane_bbox = self._bbox(SurfaceType.CRANE_PAD).buffered(tolerance)
+        if not crane_bbox.intersects(self._bbox(SurfaceType.FOUNDATION)):
             return False, _format_error('foundation_not_touching_crane_pad')
 
+        crane_engine = self._engine(SurfaceType.CRANE_PAD)
+        foundation = self.project.foundation.geometry.constGet()
+
+        # Check if foundation touches or intersects crane pad (touching implies
+        # intersecting); small gaps up to the tolerance are measured directly
+        # instead of buffering the crane pad
+        if not crane_engine.intersects(foundation):
+            distance = self._simplified_geometry(SurfaceType.CRANE_PAD).distance(
+                self._simplified_geometry(SurfaceType.FOUNDATION)
+            )
+            if distance > tolerance:
+                return False, _format_error('foundation_not_touching_crane_pad')
+
         self.logger.info("✓ Foundation touches or is within crane pad")
         return True, ""
 
@@ -145,7 +373,9 @@ class SurfaceValidator:
             return False, _format_error('boom_connection_edge_not_found')
 
         # Check distance between boom and crane pad
-        distance = crane_geom.distance(boom_geom)
+        distance = self._simplified_geometry(SurfaceType.CRANE_PAD).distance(
+            self._simplified_geometry(SurfaceType.BOOM)
+        )
 
         if distance > max_distance:
             return False, _format_error('boom_too_far_from_crane_pad',
@@ -170,11 +400,10 @@ class SurfaceValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        crane_geom = self.project.crane_pad.geometry
-        rotor_geom = self.project.rotor_storage.geometry
-
         # Calculate distance between rotor storage and crane pad
-        distance = crane_geom.distance(rotor_geom)
+        distance = self._simplified_geometry(SurfaceType.CRANE_PAD).distance(
+            self._simplified_geometry(SurfaceType.ROTOR_STORAGE)
+        )
 
         if distance > max_distance:
             return False, _format_error('rotor_too_far_from_crane_pad',
@@ -193,19 +422,26 @@ class SurfaceValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        # Disjoint bounding boxes cannot overlap
+        if not self._bbox(SurfaceType.BOOM).intersects(self._bbox(SurfaceType.ROTOR_STORAGE)):
+            self.logger.info("✓ Boom and rotor storage do not overlap")
+            return True, ""
+
         boom_geom = self.project.boom.geometry
         rotor_geom = self.project.rotor_storage.geometry
+        boom_engine = self._engine(SurfaceType.BOOM)
+        rotor = rotor_geom.constGet()
+
+        if boom_engine.intersects(rotor):
+            # Compute the intersection (and its area) once for both checks
+            overlap_area = boom_geom.intersection(rotor_geom).area()
 
-        if boom_geom.overlaps(rotor_geom):
-            intersection = boom_geom.intersection(rotor_geom)
-            overlap_area = intersection.area()
-            return False, _format_error('boom_rotor_overlap', overlap_area=overlap_area)
+            if boom_engine.overlaps(rotor):
+                return False, _format_error('boom_rotor_overlap', overlap_area=overlap_area)
 
-        # Also check if they're just touching (which is ok) vs. overlapping
-        if boom_geom.intersects(rotor_geom):
-            intersection = boom_geom.intersection(rotor_geom)
-            if intersection.type() == QgsWkbTypes.PolygonGeometry:
-                # It's a polygon intersection, not just a line/point - this is overlap
+            # Also check if they're just touching (which is ok) vs. overlapping:
+            # line/point intersections have zero area
+            if overlap_area > self.OVERLAP_AREA_TOLERANCE:
                 return False, _format_error('boom_rotor_intersection')
 
         self.logger.info("✓ Boom and rotor storage do not overlap")
@@ -220,39 +456,12 @@ class SurfaceValidator:
         """
         errors = []
 
-        # Define reasonable size ranges (m²)
-        size_limits = {
-            SurfaceType.CRANE_PAD: (100, 20000),     # 10×10m to ~140×140m
-            SurfaceType.FOUNDATION: (50, 5000),      # Ø8m to Ø80m
-            SurfaceType.BOOM: (50, 10000),           # Various sizes up to 100×100m
-            SurfaceType.ROTOR_STORAGE: (50, 5000),   # Various sizes up to ~70×70m
-        }
-
-        # Required surfaces
-        for surface_name in ['crane_pad', 'foundation']:
-            surface: SurfaceConfig = getattr(self.project, surface_name)
-            area = surface.geometry.area()
-            min_area, max_area = size_limits[surface.surface_type]
-
-            if area < min_area:
-                errors.append(_format_error('geometry_too_small',
-                                           area=area, min_area=min_area))
-            elif area > max_area:
-                errors.append(_format_error('geometry_too_large',
-                                           area=area, max_area=max_area))
-            else:
-                self.logger.info(
-                    f"✓ {surface.surface_type.display_name} size OK: {area:.1f}m²"
-                )
-
-        # Optional surfaces
-        for surface_name in ['boom', 'rotor_storage']:
-            surface: SurfaceConfig = getattr(self.project, surface_name)
+        for surface in self._surfaces:
             if surface is None:
                 continue
 
-            area = surface.geometry.area()
-            min_area, max_area = size_limits[surface.surface_type]
+            area = surface.area
+            min_area, max_area = self.SIZE_LIMITS[surface.surface_type]
 
             if area < min_area:
                 errors.append(_format_error('geometry_too_small',
@@ -345,42 +554,54 @@ class SurfaceValidator:
 
         return closest_edge, closest_edge_length
 
-    def _calculate_shared_edge_length(self, geom1: QgsGeometry, geom2: QgsGeometry,
+    def _calculate_shared_edge_length(self, surface1: SurfaceType, surface2: SurfaceType,
                                      tolerance: float = 0.1) -> float:
         """
-        Calculate the total length of shared edges between two polygons.
+        Calculate the total length of shared edges between two surfaces.
 
         Args:
-            geom1: First polygon
-            geom2: Second polygon
+            surface1: First surface type
+            surface2: Second surface type
             tolerance: Distance tolerance for considering edges as shared
 
         Returns:
             Total length of shared edges in meters
         """
+        # Surfaces drawn with snapping share identical vertices, so their
+        # common edges can be matched by hashing instead of a GEOS intersection
+        edges1 = _polygon_edges(self._get_surface_geometry(surface1))
+        edges2 = _polygon_edges(self._get_surface_geometry(surface2))
+        shared = edges1 & edges2
+        hashed_length = sum(
+            math.hypot(x1 - x2, y1 - y2)
+            for (x1, y1), (x2, y2) in (tuple(edge) for edge in shared)
+        )
+        if shared:
+            # The hashed length is the whole border only if no unmatched
+            # edges of both surfaces lie on a common line; otherwise the
+            # border is just partly snapped and GEOS has to measure it
+            origin = next(iter(next(iter(shared))))
+            if not _edges_may_overlap(edges1 - shared, edges2 - shared, origin):
+                return hashed_length
+
         # Get boundaries
-        boundary1 = get_polygon_boundary(geom1)
-        boundary2 = get_polygon_boundary(geom2)
+        boundary1 = self._boundary(surface1)
+        boundary2 = self._boundary(surface2)
 
         if boundary1 is None or boundary2 is None:
-            return 0.0
+            return hashed_length
 
         # Find intersection of boundaries
         intersection = boundary1.intersection(boundary2)
 
         if intersection.isEmpty():
-            return 0.0
+            return hashed_length
 
         # Calculate total length
         if intersection.type() == QgsWkbTypes.LineGeometry:
-            if intersection.isMultipart():
-                lines = intersection.asMultiPolyline()
-                total_length = sum(
-                    QgsGeometry.fromPolylineXY(line).length()
-                    for line in lines
-                )
-            else:
-                total_length = intersection.length()
+            # length() sums all parts of a MultiLineString in C++, so no
+            # per-part geometries need to be built in Python
+            total_length = intersection.length()
         elif intersection.type() == QgsWkbTypes.PointGeometry:
             # Just touching at points, no shared edge
             total_length = 0.0
@@ -388,7 +609,7 @@ class SurfaceValidator:
             # Shouldn't happen, but handle gracefully
             total_length = 0.0
 
-        return total_length
+        return max(hashed_length, total_length)
 
     def get_connection_edge(self, surface1: SurfaceType, surface2: SurfaceType) -> QgsGeometry:
         """
@@ -401,13 +622,9 @@ class SurfaceValidator:
         Returns:
             QgsGeometry of the connection edge (LineString or MultiLineString)
         """
-        # Get geometries
-        geom1 = self._get_surface_geometry(surface1)
-        geom2 = self._get_surface_geometry(surface2)
-
         # Get boundaries
-        boundary1 = get_polygon_boundary(geom1)
-        boundary2 = get_polygon_boundary(geom2)
+        boundary1 = self._boundary(surface1)
+        boundary2 = self._boundary(surface2)
 
         if boundary1 is None or boundary2 is None:
             return QgsGeometry()
@@ -417,26 +634,26 @@ class SurfaceValidator:
 
         return connection
 
+    def _get_surface(self, surface_type: SurfaceType) -> SurfaceConfig:
+        """Get the surface configuration for a surface type."""
+        return self._surface_map[surface_type]
+
     def _get_surface_geometry(self, surface_type: SurfaceType) -> QgsGeometry:
         """Get geometry for a surface type."""
-        surface_map = {
-            SurfaceType.CRANE_PAD: self.project.crane_pad,
-            SurfaceType.FOUNDATION: self.project.foundation,
-            SurfaceType.BOOM: self.project.boom,
-            SurfaceType.ROTOR_STORAGE: self.project.rotor_storage,
-        }
-        return surface_map[surface_type].geometry
+        return self._get_surface(surface_type).geometry
 
 
-def validate_project(project: MultiSurfaceProject) -> Tuple[bool, List[str]]:
+def validate_project(project: MultiSurfaceProject,
+                     skip_validity: bool = False) -> Tuple[bool, List[str]]:
     """
     Convenience function to validate a project.
 
     Args:
         project: Project to validate
+        skip_validity: Skip the GEOS validity check of the surface geometries
 
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
     validator = SurfaceValidator(project)
-    return validator.validate_all()
+    return validator.validate_all(skip_validity=skip_validity)
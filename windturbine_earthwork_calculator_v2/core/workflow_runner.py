@@ -8,11 +8,16 @@ Version: 2.0.0 - Multi-Surface Extension
 """
 
 import os
+import platform
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 from datetime import datetime
-import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from itertools import chain
 
-from qgis.PyQt.QtCore import QObject, QThread, pyqtSignal
+from qgis.PyQt.QtCore import QObject, QThread, Qt, pyqtSignal
 from qgis.core import (
     QgsVectorLayer,
     QgsRasterLayer,
@@ -20,12 +25,8 @@ from qgis.core import (
     QgsFields,
     QgsField,
     QgsWkbTypes,
-    QgsCoordinateReferenceSystem,
-    QgsCoordinateTransformContext,
     QgsProject,
-    QgsFillSymbol,
     QgsLineSymbol,
-    QgsVectorFileWriter,
     QgsPalLayerSettings,
     QgsTextFormat,
     QgsTextBufferSettings,
@@ -33,12 +34,42 @@ from qgis.core import (
     QgsLayerTreeGroup,
     QgsGeometry,
     QgsMultiLineString,
-    QgsProcessingFeedback
+    QgsRectangle,
+    QgsProcessingFeedback,
+    QgsSingleBandPseudoColorRenderer,
+    QgsColorRampShader,
+    QgsRasterShader
 )
-import shutil
 from qgis.PyQt.QtGui import QColor, QFont
 from qgis.PyQt.QtCore import QVariant
 
+try:
+    from osgeo import ogr, osr
+    OGR_AVAILABLE = True
+except ImportError:
+    OGR_AVAILABLE = False
+
+if OGR_AVAILABLE:
+    _OGR_GEOMETRY_TYPES = {
+        QgsWkbTypes.Point: ogr.wkbPoint,
+        QgsWkbTypes.PointZ: ogr.wkbPoint25D,
+        QgsWkbTypes.LineString: ogr.wkbLineString,
+        QgsWkbTypes.LineStringZ: ogr.wkbLineString25D,
+        QgsWkbTypes.MultiLineString: ogr.wkbMultiLineString,
+        QgsWkbTypes.MultiLineStringZ: ogr.wkbMultiLineString25D,
+        QgsWkbTypes.Polygon: ogr.wkbPolygon,
+        QgsWkbTypes.PolygonZ: ogr.wkbPolygon25D,
+        QgsWkbTypes.MultiPolygon: ogr.wkbMultiPolygon,
+        QgsWkbTypes.MultiPolygonZ: ogr.wkbMultiPolygon25D,
+    }
+    _OGR_FIELD_TYPES = {
+        QVariant.Int: ogr.OFTInteger,
+        QVariant.LongLong: ogr.OFTInteger64,
+        QVariant.Bool: ogr.OFTInteger,
+        QVariant.Double: ogr.OFTReal,
+        QVariant.String: ogr.OFTString,
+    }
+
 from .dxf_importer import DXFImporter
 from .dem_downloader import DEMDownloader
 from .multi_surface_calculator import MultiSurfaceCalculator
@@ -57,6 +88,320 @@ from ..utils.logging_utils import get_plugin_logger
 from ..utils.central_logging import log_event
 
 
+@dataclass(frozen=True)
+class RunParams:
+    """
+    Parameters of one workflow run, collected by the main dialog.
+
+    Frozen so the worker thread cannot modify what the dialog emitted.
+    Fields with defaults are optional in the dialog (or not exposed there).
+    """
+    # Input / output
+    dxf_crane: str
+    dxf_foundation: str
+    workspace: str
+    dxf_tolerance: float
+    force_refresh: bool
+
+    # Heights and dimensions
+    fok: float
+    foundation_depth: float
+    gravel_thickness: float
+    rotor_height_offset: float
+    slope_angle: float
+    search_range_below_fok: float
+    search_range_above_fok: float
+    height_step: float
+    boom_slope: float
+    boom_auto_slope: bool
+    vertical_exaggeration: float
+
+    # Optional DXF files
+    dxf_boom: Optional[str] = None
+    dxf_rotor: Optional[str] = None
+    dxf_road: Optional[str] = None
+    holm_dxf_path: Optional[str] = None
+    crs_epsg: int = 25832
+
+    # Optimization
+    foundation_diameter: Optional[float] = None
+    rotor_height_offset_max: float = 0.5
+    boom_slope_max: float = 4.0
+    boom_slope_optimize: bool = True
+    boom_slope_step_coarse: float = 0.5
+    boom_slope_step_fine: float = 0.1
+    rotor_height_optimize: bool = True
+    rotor_height_step_coarse: float = 0.2
+    rotor_height_step_fine: float = 0.05
+    optimize_for_net_earthwork: bool = True
+
+    # Road access
+    road_slope_percent: float = 8.0
+    road_gravel_enabled: bool = True
+    road_gravel_thickness: float = 0.3
+    road_slope_optimize: bool = False
+    road_slope_min: float = 4.0
+    road_slope_max: float = 12.0
+
+    # Uncertainty analysis
+    uncertainty_enabled: bool = False
+    terrain_type_index: int = 0
+    mc_samples: int = 1000
+    foundation_depth_std: float = 0.1
+    slope_angle_std: float = 3.0
+
+    # Profiles
+    bbox_buffer: float = 10.0
+    generate_cross_profiles: bool = True
+    cross_profile_spacing: float = 10.0
+    generate_long_profiles: bool = True
+    long_profile_spacing: float = 10.0
+
+    # Soil stabilization
+    enable_stabilization: bool = True
+    soil_type: str = 'Schluff'
+    ev2_bestand: float = 45.0
+    water_content: float = 0.0
+    optimum_water: float = 0.0
+
+
+def _make_fields(spec) -> QgsFields:
+    """Build a QgsFields schema from (name, QVariant type) pairs."""
+    fields = QgsFields()
+    for name, field_type in spec:
+        fields.append(QgsField(name, field_type))
+    return fields
+
+
+# GeoPackage layer schemas, built once at import and shared by all runs
+_SCHEMA_CRANE = _make_fields([
+    ('id', QVariant.Int),
+    ('optimal_height', QVariant.Double),
+    ('fok', QVariant.Double),
+    ('area_m2', QVariant.Double),
+    ('total_cut', QVariant.Double),
+    ('total_fill', QVariant.Double),
+])
+_SCHEMA_FOUNDATION = _make_fields([
+    ('id', QVariant.Int),
+    ('fok', QVariant.Double),
+    ('depth', QVariant.Double),
+    ('area_m2', QVariant.Double),
+])
+_SCHEMA_BOOM = _make_fields([
+    ('id', QVariant.Int),
+    ('slope_percent', QVariant.Double),
+    ('area_m2', QVariant.Double),
+])
+_SCHEMA_ROTOR = _make_fields([
+    ('id', QVariant.Int),
+    ('height_offset', QVariant.Double),
+    ('area_m2', QVariant.Double),
+])
+_SCHEMA_ROAD = _make_fields([
+    ('id', QVariant.Int),
+    ('slope_percent', QVariant.Double),
+    ('gravel_thickness', QVariant.Double),
+    ('area_m2', QVariant.Double),
+])
+_SCHEMA_PROFILE_LINES = _make_fields([
+    ('id', QVariant.Int),
+    ('type', QVariant.String),
+    ('length_m', QVariant.Double),
+])
+_SCHEMA_SURFACE_3D = _make_fields([
+    ('id', QVariant.Int),
+    ('height', QVariant.Double),
+    ('surface_type', QVariant.String),
+])
+_SCHEMA_BOOM_3D = _make_fields([
+    ('id', QVariant.Int),
+    ('height', QVariant.Double),
+    ('slope_percent', QVariant.Double),
+    ('surface_type', QVariant.String),
+])
+_SCHEMA_ROTOR_3D = _make_fields([
+    ('id', QVariant.Int),
+    ('height', QVariant.Double),
+    ('height_offset', QVariant.Double),
+    ('surface_type', QVariant.String),
+])
+_SCHEMA_ROAD_3D = _make_fields([
+    ('id', QVariant.Int),
+    ('height', QVariant.Double),
+    ('slope_percent', QVariant.Double),
+    ('gravel_thickness', QVariant.Double),
+    ('surface_type', QVariant.String),
+])
+_SCHEMA_SLOPE_3D = _make_fields([('id', QVariant.Int), ('surface_type', QVariant.String)])
+_SCHEMA_INTERSECTION_LINE = _make_fields([
+    ('id', QVariant.Int),
+    ('length_m', QVariant.Double),
+    ('description', QVariant.String),
+    ('color', QVariant.String),
+])
+
+
+class _GeoPackageWriter:
+    """
+    Writes the result layers into one GeoPackage.
+
+    With the GDAL bindings available, a single OGR data source is opened and
+    all layers are written in one transaction, without per-layer writer
+    setup. Spatial indexes are built once for all layers on close().
+    Without GDAL it falls back to one QgsVectorFileWriter per layer.
+    """
+
+    def __init__(self, gpkg_path, crs, logger):
+        """
+        Args:
+            gpkg_path: Output GeoPackage path (overwritten if it exists)
+            crs: QgsCoordinateReferenceSystem of all layers
+            logger: Logger for write errors
+        """
+        self.gpkg_path = str(gpkg_path)
+        self.crs = crs
+        self.logger = logger
+        self._dataset = None
+        self._layer_count = 0
+
+        if OGR_AVAILABLE:
+            driver = ogr.GetDriverByName('GPKG')
+            if os.path.exists(self.gpkg_path):
+                driver.DeleteDataSource(self.gpkg_path)
+            self._dataset = driver.CreateDataSource(self.gpkg_path)
+            if self._dataset is None:
+                raise IOError(f"GeoPackage konnte nicht erstellt werden: {self.gpkg_path}")
+            self._srs = osr.SpatialReference()
+            self._srs.ImportFromWkt(crs.toWkt())
+            self._srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+            self._dataset.StartTransaction()
+        else:
+            from qgis.core import QgsCoordinateTransformContext
+            # One transform context shared by all fallback writers
+            self._transform_context = QgsCoordinateTransformContext()
+
+    def write_layer(self, layer_name: str, fields: QgsFields, wkb_type, features):
+        """
+        Write one layer with its features.
+
+        Args:
+            layer_name: GeoPackage table name
+            fields: Layer schema
+            wkb_type: QgsWkbTypes geometry type of the layer
+            features: QgsFeatures matching the schema
+        """
+        if self._dataset is not None:
+            self._write_layer_ogr(layer_name, fields, wkb_type, features)
+        else:
+            self._write_layer_qgis(layer_name, fields, wkb_type, features)
+        self._layer_count += 1
+
+    def _write_layer_ogr(self, layer_name, fields, wkb_type, features):
+        ogr_type = _OGR_GEOMETRY_TYPES.get(wkb_type)
+        if ogr_type is None:
+            raise ValueError(
+                f"Unsupported geometry type for {layer_name}: {QgsWkbTypes.displayString(wkb_type)}"
+            )
+        layer = self._dataset.CreateLayer(
+            layer_name, self._srs, ogr_type, options=['SPATIAL_INDEX=NO']
+        )
+        if layer is None:
+            self.logger.error(f"Error creating layer {layer_name}")
+            return
+        for field in fields:
+            layer.CreateField(ogr.FieldDefn(
+                field.name(), _OGR_FIELD_TYPES.get(field.type(), ogr.OFTString)
+            ))
+
+        layer_defn = layer.GetLayerDefn()
+        for feature in features:
+            for geometry in self._coerce(feature.geometry(), wkb_type):
+                ogr_feature = ogr.Feature(layer_defn)
+                ogr_feature.SetGeometry(ogr.CreateGeometryFromWkb(bytes(geometry.asWkb())))
+                for i, value in enumerate(feature.attributes()):
+                    if value is not None:
+                        ogr_feature.SetField(i, value)
+                if layer.CreateFeature(ogr_feature) != 0:
+                    self.logger.error(f"Error adding feature to {layer_name}")
+
+    @staticmethod
+    def _coerce(geometry: QgsGeometry, wkb_type):
+        """
+        Convert a geometry to the layer type, as QgsVectorFileWriter does.
+
+        Single parts become multi (and vice versa), Z is added or dropped.
+        A multi geometry written to a single-part layer yields one geometry
+        per part.
+        """
+        if geometry.isNull() or geometry.wkbType() == wkb_type:
+            return [geometry]
+        return geometry.coerceToType(wkb_type)
+
+    def _write_layer_qgis(self, layer_name, fields, wkb_type, features):
+        from qgis.core import QgsVectorFileWriter
+
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = 'GPKG'
+        options.fileEncoding = 'UTF-8'
+        options.layerName = layer_name
+        if self._layer_count:
+            options.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteLayer
+
+        writer = QgsVectorFileWriter.create(
+            self.gpkg_path, fields, wkb_type, self.crs,
+            self._transform_context, options
+        )
+        if writer.hasError() != QgsVectorFileWriter.NoError:
+            self.logger.error(f"Error creating layer {layer_name}: {writer.errorMessage()}")
+        else:
+            writer.addFeatures(list(features))
+            if writer.hasError() != QgsVectorFileWriter.NoError:
+                self.logger.error(f"Error adding features to {layer_name}: {writer.errorMessage()}")
+        del writer
+
+    def abort(self):
+        """Roll back everything written so far and release the data source."""
+        if self._dataset is None:
+            return
+        try:
+            self._dataset.RollbackTransaction()
+        finally:
+            self._dataset = None
+        self.logger.warning(f"GeoPackage write aborted, changes rolled back: {self.gpkg_path}")
+
+    def close(self):
+        """Commit all layers and build their spatial indexes."""
+        if self._dataset is None:
+            return
+        try:
+            for i in range(self._dataset.GetLayerCount()):
+                layer = self._dataset.GetLayerByIndex(i)
+                geom_column = layer.GetGeometryColumn()
+                if geom_column:
+                    self._dataset.ExecuteSQL(
+                        f"SELECT CreateSpatialIndex('{layer.GetName()}', '{geom_column}')"
+                    )
+        except Exception as e:
+            # Layers stay fully usable without an index
+            self.logger.warning(f"Could not create GeoPackage spatial indexes: {e}")
+        finally:
+            self._dataset.CommitTransaction()
+            self._dataset = None
+
+
+def _profile_line_feature(profile) -> QgsFeature:
+    """Create a profile line feature with the profile name/type as attribute."""
+    feat = QgsFeature()
+    feat.setGeometry(profile['geometry'])
+    feat.setAttributes([profile.get('type', '')])
+    return feat
+
+
+class WorkflowCancelled(Exception):
+    """Raised inside the worker when the user cancelled the workflow."""
+
+
 class WorkflowProgressFeedback(QgsProcessingFeedback):
     """
     Custom feedback class that forwards progress updates to the workflow worker.
@@ -97,7 +442,11 @@ class WorkflowProgressFeedback(QgsProcessingFeedback):
             self._last_progress = mapped_progress
             # Emit with base message to show progress
             status = f"{self.base_message} ({mapped_progress - self.progress_start}/{self.progress_range}%)"
-            self.worker.progress_updated.emit(mapped_progress, status)
+            self.worker.emit_progress_throttled(mapped_progress, status)
+
+    def isCanceled(self) -> bool:
+        """Also report a cancel requested on the worker to the calculator loops."""
+        return self.worker.is_cancelled or super().isCanceled()
 
     def pushInfo(self, info: str):
         """
@@ -108,8 +457,8 @@ class WorkflowProgressFeedback(QgsProcessingFeedback):
         """
         # Only forward important messages (not every single scenario)
         if any(keyword in info for keyword in ['STAGE', 'Best', 'complete', 'Optimal']):
-            current_progress = getattr(self, '_last_progress', self.progress_start)
-            self.worker.progress_updated.emit(current_progress, info)
+            # Never throttled: the dialog coalesces queued messages itself
+            self.worker.progress_updated.emit(self._last_progress, info)
 
 
 class WorkflowWorker(QObject):
@@ -126,6 +475,9 @@ class WorkflowWorker(QObject):
     layers_ready = pyqtSignal(dict)  # NEW: Signal for thread-safe layer addition
     finished = pyqtSignal(bool, str)
 
+    # Minimum interval (seconds) between fine-grained progress updates
+    PROGRESS_MIN_INTERVAL = 0.1
+
     def __init__(self, iface, params):
         """Initialize worker."""
         super().__init__()
@@ -133,10 +485,32 @@ class WorkflowWorker(QObject):
         self.params = params
         self.logger = get_plugin_logger()
         self.is_cancelled = False
+        self._last_progress_emit = 0.0
+        # (future, feedback) of the DEM download started in step 1
+        self._dem_prefetch = None
+
+    def emit_progress_throttled(self, percent: int, message: str):
+        """
+        Emit a fine-grained percentage update, dropping bursts.
+
+        Updates arriving less than PROGRESS_MIN_INTERVAL after the previous
+        one are skipped (except 0% and 100%), so high-frequency inner loops
+        do not flood the GUI event loop with queued cross-thread signals.
+        Only use this for bare percentage ticks whose text may be lost;
+        step milestones and status messages use progress_updated.emit()
+        directly.
+
+        Args:
+            percent: Progress percentage
+            message: Status message
+        """
+        now = time.monotonic()
+        if percent in (0, 100) or now - self._last_progress_emit > self.PROGRESS_MIN_INTERVAL:
+            self._last_progress_emit = now
+            self.progress_updated.emit(percent, message)
 
     def run(self):
         """Run the workflow (called in thread)."""
-        import time
         workflow_start = time.time()
 
         try:
@@ -147,11 +521,11 @@ class WorkflowWorker(QObject):
 
             # Opt-in telemetry: signal start. No-op if no API key in log.config.
             log_event("calculation_started", {
-                "uncertainty_enabled": bool(self.params.get('uncertainty_enabled', False)),
-                "boom_enabled": bool(self.params.get('dxf_boom')),
-                "rotor_enabled": bool(self.params.get('dxf_rotor')),
-                "road_enabled": bool(self.params.get('dxf_road')),
-                "stabilization_enabled": bool(self.params.get('enable_stabilization', True)),
+                "uncertainty_enabled": bool(self.params.uncertainty_enabled),
+                "boom_enabled": bool(self.params.dxf_boom),
+                "rotor_enabled": bool(self.params.dxf_rotor),
+                "road_enabled": bool(self.params.dxf_road),
+                "stabilization_enabled": bool(self.params.enable_stabilization),
             })
 
             self._run_workflow()
@@ -168,6 +542,11 @@ class WorkflowWorker(QObject):
                 "duration_seconds": round(elapsed, 1),
             })
 
+        except WorkflowCancelled:
+            elapsed = time.time() - workflow_start
+            self.logger.info(f"Workflow abgebrochen nach {elapsed:.1f} Sekunden")
+            self.finished.emit(False, "Berechnung abgebrochen")
+
         except Exception as e:
             # Failure - log error with duration
             elapsed = time.time() - workflow_start
@@ -185,14 +564,40 @@ class WorkflowWorker(QObject):
 
             self.finished.emit(False, f"Fehler: {str(e)}")
 
+        finally:
+            self._abort_dem_prefetch()
+
+    def _abort_dem_prefetch(self):
+        """
+        Stop the background DEM download if the workflow ended before step 4.
+
+        A queued download is cancelled outright; a running one is told to stop
+        through its feedback and awaited, so nothing keeps writing into the
+        results directory after the worker has finished.
+        """
+        if self._dem_prefetch is None:
+            return
+        future, feedback = self._dem_prefetch
+        self._dem_prefetch = None
+        if future.done():
+            return
+        future.cancel()
+        feedback.cancel()
+        wait([future])
+
     def cancel(self):
         """Cancel workflow."""
         self.is_cancelled = True
 
+    def _check_cancelled(self):
+        """Abort the workflow at a step boundary if cancel() was called."""
+        if self.is_cancelled:
+            raise WorkflowCancelled()
+
     def _run_workflow(self):
         """Run the complete multi-surface workflow."""
         self.logger.info("Starting multi-surface workflow execution...")
-        workspace = Path(self.params['workspace'])
+        workspace = Path(self.params.workspace)
 
         # Create workspace structure
         self.progress_updated.emit(5, "📁 Workspace-Struktur wird erstellt...")
@@ -228,23 +633,31 @@ class WorkflowWorker(QObject):
         progress_per_dxf = 5
         current_progress = 10
 
-        # Import required DXF files
+        dxf_jobs = []
         for key, param_key, surface_type, display_name in required_dxf_files:
-            dxf_path = self.params[param_key]
-            self.progress_updated.emit(
-                current_progress,
-                f"  📄 Importiere {display_name}..."
-            )
+            dxf_jobs.append((key, getattr(self.params, param_key), display_name))
 
-            try:
-                importer = DXFImporter(
-                    dxf_path,
-                    tolerance=self.params['dxf_tolerance']
-                )
-                polygon, metadata = importer.import_as_polygon()
+        for key, param_key, surface_type, display_name in optional_dxf_files:
+            dxf_path = getattr(self.params, param_key)
+            if dxf_path:
+                dxf_jobs.append((key, dxf_path, display_name))
+            else:
+                self.logger.info(f"{display_name}: nicht angegeben (optional)")
+                surfaces[key] = None
 
-                if not polygon or polygon.isEmpty():
-                    raise Exception(f"Keine gültige Geometrie in {display_name} DXF gefunden")
+        # Import all DXF files concurrently; each importer only reads its own file
+        with ThreadPoolExecutor(max_workers=len(dxf_jobs)) as executor:
+            futures = {
+                executor.submit(self._import_surface_dxf, dxf_path, display_name): (key, dxf_path)
+                for key, dxf_path, display_name in dxf_jobs
+            }
+            for future in as_completed(futures):
+                key, dxf_path = futures[future]
+                if self.is_cancelled:
+                    for pending in futures:
+                        pending.cancel()
+                    raise WorkflowCancelled()
+                polygon, metadata, display_name = future.result()
 
                 surfaces[key] = {
                     'geometry': polygon,
@@ -252,58 +665,67 @@ class WorkflowWorker(QObject):
                     'dxf_path': dxf_path
                 }
 
-                self.logger.info(
-                    f"{display_name}: {metadata['num_vertices']} Punkte, "
-                    f"{metadata['area']:.2f} m²"
-                )
-
-            except Exception as e:
-                self.logger.error(f"DXF Import failed for {display_name}: {e}", exc_info=True)
-                raise Exception(f"Fehler beim Import von {display_name}: {e}")
-
-            current_progress += progress_per_dxf
-
-        # Import optional DXF files
-        for key, param_key, surface_type, display_name in optional_dxf_files:
-            dxf_path = self.params.get(param_key)
-
-            if dxf_path:
                 self.progress_updated.emit(
                     current_progress,
-                    f"  📄 Importiere {display_name}..."
+                    f"  📄 {display_name} importiert"
                 )
+                current_progress += progress_per_dxf
 
-                try:
-                    importer = DXFImporter(
-                        dxf_path,
-                        tolerance=self.params['dxf_tolerance']
-                    )
-                    polygon, metadata = importer.import_as_polygon()
-
-                    if not polygon or polygon.isEmpty():
-                        raise Exception(f"Keine gültige Geometrie in {display_name} DXF gefunden")
-
-                    surfaces[key] = {
-                        'geometry': polygon,
-                        'metadata': metadata,
-                        'dxf_path': dxf_path
-                    }
+        self.progress_updated.emit(30, "✓ DXF-Dateien importiert")
 
-                    self.logger.info(
-                        f"{display_name}: {metadata['num_vertices']} Punkte, "
-                        f"{metadata['area']:.2f} m²"
-                    )
+        # Start the (network-bound) DEM download in the background as soon as
+        # all surface geometries are known; project setup and validation run
+        # meanwhile, the result is collected in step 4
+        self.logger.info("Starting DEM download in background...")
+
+        # Use crane pad as reference for DEM extent (it should cover all surfaces)
+        # But we buffer generously to cover all surfaces
+        # Only include geometries that exist (boom and rotor are optional)
+        all_geoms = [
+            surfaces['crane']['geometry'],
+            surfaces['foundation']['geometry'],
+        ]
 
-                except Exception as e:
-                    self.logger.error(f"DXF Import failed for {display_name}: {e}", exc_info=True)
-                    raise Exception(f"Fehler beim Import von {display_name}: {e}")
-            else:
-                self.logger.info(f"{display_name}: nicht angegeben (optional)")
-                surfaces[key] = None
+        # Add optional surfaces if they exist
+        if surfaces['boom'] is not None:
+            all_geoms.append(surfaces['boom']['geometry'])
+        if surfaces['rotor'] is not None:
+            all_geoms.append(surfaces['rotor']['geometry'])
+        if surfaces['road'] is not None:
+            all_geoms.append(surfaces['road']['geometry'])
+
+        # The downloader only uses the bounding box of the geometry, so the
+        # combined envelope is enough (no polygon union needed)
+        combined_extent = QgsRectangle(all_geoms[0].boundingBox())
+        for geom in all_geoms[1:]:
+            combined_extent.combineExtentWith(geom.boundingBox())
+        combined_geom = QgsGeometry.fromRect(combined_extent)
+
+        # Write the DEM mosaic straight into the results directory
+        crane_centroid = get_centroid(surfaces['crane']['geometry'])
+        dem_result_name = f"WKA_{int(crane_centroid.x())}_{int(crane_centroid.y())}_DEM.tif"
+        dem_result_path = results_dir / dem_result_name
+        self.logger.info(f"DEM mosaic path: {dem_result_path}")
+
+        downloader = DEMDownloader(
+            cache_dir=str(cache_dir),
+            force_refresh=self.params.force_refresh
+        )
 
-            current_progress += progress_per_dxf
+        dem_feedback = QgsProcessingFeedback()
+        dem_executor = ThreadPoolExecutor(max_workers=1)
+        dem_future = dem_executor.submit(
+            downloader.download_for_geometry,
+            combined_geom,
+            str(dem_result_path),
+            buffer_m=250,
+            feedback=dem_feedback
+        )
+        # No further tasks are accepted; run() stops the download on failure
+        dem_executor.shutdown(wait=False)
+        self._dem_prefetch = (dem_future, dem_feedback)
 
-        self.progress_updated.emit(30, "✓ DXF-Dateien importiert")
+        self._check_cancelled()
 
         # === STEP 2: Create MultiSurfaceProject ===
         self.progress_updated.emit(32, "🔧 Erstelle Multi-Surface Projekt...")
@@ -324,7 +746,7 @@ class WorkflowWorker(QObject):
                 geometry=surfaces['foundation']['geometry'],
                 dxf_path=surfaces['foundation']['dxf_path'],
                 height_mode=HeightMode.FIXED,
-                height_value=self.params['fok'],
+                height_value=self.params.fok,
                 metadata=surfaces['foundation']['metadata']
             )
 
@@ -336,8 +758,8 @@ class WorkflowWorker(QObject):
                     geometry=surfaces['boom']['geometry'],
                     dxf_path=surfaces['boom']['dxf_path'],
                     height_mode=HeightMode.SLOPED,
-                    slope_longitudinal=self.params['boom_slope'],
-                    auto_slope=self.params['boom_auto_slope'],
+                    slope_longitudinal=self.params.boom_slope,
+                    auto_slope=self.params.boom_auto_slope,
                     slope_min=2.0,
                     slope_max=8.0,
                     metadata=surfaces['boom']['metadata']
@@ -362,7 +784,7 @@ class WorkflowWorker(QObject):
                     geometry=surfaces['road']['geometry'],
                     dxf_path=surfaces['road']['dxf_path'],
                     height_mode=HeightMode.SLOPED,
-                    slope_longitudinal=self.params.get('road_slope_percent', 8.0),
+                    slope_longitudinal=self.params.road_slope_percent,
                     auto_slope=True,  # Auto-detect slope direction from terrain
                     slope_min=1.0,
                     slope_max=15.0,
@@ -371,13 +793,13 @@ class WorkflowWorker(QObject):
 
             # Import holms if holm DXF path is provided
             rotor_holms = None
-            if self.params.get('holm_dxf_path'):
+            if self.params.holm_dxf_path:
                 try:
-                    self.logger.info(f"Importing holms from: {self.params['holm_dxf_path']}")
+                    self.logger.info(f"Importing holms from: {self.params.holm_dxf_path}")
                     holm_importer = DXFImporter(
-                        self.params['holm_dxf_path'],
+                        self.params.holm_dxf_path,
                         tolerance=0.1,
-                        crs_epsg=self.params.get('crs_epsg', 25832)
+                        crs_epsg=self.params.crs_epsg
                     )
                     rotor_holms, holm_metadata = holm_importer.import_holms()
                     self.logger.info(
@@ -396,31 +818,31 @@ class WorkflowWorker(QObject):
                 rotor_storage=rotor_config,
                 road_access=road_config,
                 rotor_holms=rotor_holms,
-                fok=self.params['fok'],
-                foundation_depth=self.params['foundation_depth'],
-                foundation_diameter=self.params.get('foundation_diameter'),
-                gravel_thickness=self.params['gravel_thickness'],
-                rotor_height_offset=self.params['rotor_height_offset'],
-                rotor_height_offset_max=self.params.get('rotor_height_offset_max', 0.5),
-                slope_angle=self.params['slope_angle'],
-                search_range_below_fok=self.params['search_range_below_fok'],
-                search_range_above_fok=self.params['search_range_above_fok'],
-                search_step=self.params['height_step'],
-                boom_slope_max=self.params.get('boom_slope_max', 4.0),
-                boom_slope_optimize=self.params.get('boom_slope_optimize', True),
-                boom_slope_step_coarse=self.params.get('boom_slope_step_coarse', 0.5),
-                boom_slope_step_fine=self.params.get('boom_slope_step_fine', 0.1),
-                rotor_height_optimize=self.params.get('rotor_height_optimize', True),
-                rotor_height_step_coarse=self.params.get('rotor_height_step_coarse', 0.2),
-                rotor_height_step_fine=self.params.get('rotor_height_step_fine', 0.05),
-                optimize_for_net_earthwork=self.params.get('optimize_for_net_earthwork', True),
+                fok=self.params.fok,
+                foundation_depth=self.params.foundation_depth,
+                foundation_diameter=self.params.foundation_diameter,
+                gravel_thickness=self.params.gravel_thickness,
+                rotor_height_offset=self.params.rotor_height_offset,
+                rotor_height_offset_max=self.params.rotor_height_offset_max,
+                slope_angle=self.params.slope_angle,
+                search_range_below_fok=self.params.search_range_below_fok,
+                search_range_above_fok=self.params.search_range_above_fok,
+                search_step=self.params.height_step,
+                boom_slope_max=self.params.boom_slope_max,
+                boom_slope_optimize=self.params.boom_slope_optimize,
+                boom_slope_step_coarse=self.params.boom_slope_step_coarse,
+                boom_slope_step_fine=self.params.boom_slope_step_fine,
+                rotor_height_optimize=self.params.rotor_height_optimize,
+                rotor_height_step_coarse=self.params.rotor_height_step_coarse,
+                rotor_height_step_fine=self.params.rotor_height_step_fine,
+                optimize_for_net_earthwork=self.params.optimize_for_net_earthwork,
                 # Road access parameters
-                road_slope_percent=self.params.get('road_slope_percent', 8.0),
-                road_gravel_enabled=self.params.get('road_gravel_enabled', True),
-                road_gravel_thickness=self.params.get('road_gravel_thickness', 0.3),
-                road_slope_optimize=self.params.get('road_slope_optimize', False),
-                road_slope_min=self.params.get('road_slope_min', 4.0),
-                road_slope_max=self.params.get('road_slope_max', 12.0)
+                road_slope_percent=self.params.road_slope_percent,
+                road_gravel_enabled=self.params.road_gravel_enabled,
+                road_gravel_thickness=self.params.road_gravel_thickness,
+                road_slope_optimize=self.params.road_slope_optimize,
+                road_slope_min=self.params.road_slope_min,
+                road_slope_max=self.params.road_slope_max
             )
 
             self.logger.info("MultiSurfaceProject created successfully")
@@ -429,11 +851,31 @@ class WorkflowWorker(QObject):
             self.logger.error(f"Failed to create project: {e}", exc_info=True)
             raise Exception(f"Fehler beim Erstellen des Projekts: {e}")
 
+        self._check_cancelled()
+
         # === STEP 3: Validate project ===
         self.progress_updated.emit(35, "✅ Validiere Flächenbeziehungen...")
         self.logger.info("Validating project spatial relationships...")
 
-        is_valid, errors = validate_project(project)
+        # The DXF importer already ran the GEOS validity check on each polygon
+        imported_valid = all(
+            surface.metadata.get('is_valid', False)
+            for surface in (project.crane_pad, project.foundation, project.boom,
+                            project.rotor_storage, project.road_access)
+            if surface is not None
+        )
+        is_valid, errors = validate_project(project, skip_validity=imported_valid)
+        if not is_valid:
+            # Only repair on the failure path; valid projects never pay for makeValid()
+            repaired = [
+                surface.surface_type.display_name
+                for surface in (project.crane_pad, project.foundation, project.boom,
+                                project.rotor_storage, project.road_access)
+                if surface is not None and surface.repair_geometry()
+            ]
+            if repaired:
+                self.logger.warning(f"Repaired invalid geometries: {', '.join(repaired)}")
+                is_valid, errors = validate_project(project)
         if not is_valid:
             error_msg = "Validierungsfehler:\n" + "\n".join(errors)
             self.logger.error(error_msg)
@@ -441,46 +883,14 @@ class WorkflowWorker(QObject):
 
         self.progress_updated.emit(38, "✓ Alle Validierungen bestanden")
 
+        self._check_cancelled()
+
         # === STEP 4: DEM Download ===
         self.progress_updated.emit(40, "🌍 DEM-Daten werden heruntergeladen...")
-        self.logger.info("Starting DEM download...")
 
         try:
-            # Use crane pad as reference for DEM extent (it should cover all surfaces)
-            # But we buffer generously to cover all surfaces
-            # Only include geometries that exist (boom and rotor are optional)
-            all_geoms = [
-                surfaces['crane']['geometry'],
-                surfaces['foundation']['geometry'],
-            ]
-
-            # Add optional surfaces if they exist
-            if surfaces['boom'] is not None:
-                all_geoms.append(surfaces['boom']['geometry'])
-            if surfaces['rotor'] is not None:
-                all_geoms.append(surfaces['rotor']['geometry'])
-            if surfaces['road'] is not None:
-                all_geoms.append(surfaces['road']['geometry'])
-
-            # Create union of all geometries
-            combined_geom = all_geoms[0]
-            for geom in all_geoms[1:]:
-                combined_geom = combined_geom.combine(geom)
-
-            temp_dem_path = tempfile.mktemp(suffix='.tif', prefix='dem_mosaic_')
-            self.logger.info(f"Temp DEM path: {temp_dem_path}")
-
-            downloader = DEMDownloader(
-                cache_dir=str(cache_dir),
-                force_refresh=self.params['force_refresh']
-            )
-
             self.progress_updated.emit(42, "⬇️ Lade DEM-Kacheln...")
-            dem_path = downloader.download_for_geometry(
-                combined_geom,
-                temp_dem_path,
-                buffer_m=250
-            )
+            dem_path = dem_future.result()
 
             self.logger.info(f"DEM downloaded: {dem_path}")
 
@@ -488,11 +898,12 @@ class WorkflowWorker(QObject):
             if not dem_layer.isValid():
                 raise Exception(f"DEM konnte nicht geladen werden: {dem_path}")
 
-            # Save DEM mosaic to results directory
-            dem_result_name = f"WKA_{int(get_centroid(surfaces['crane']['geometry']).x())}_{int(get_centroid(surfaces['crane']['geometry']).y())}_DEM.tif"
-            dem_result_path = results_dir / dem_result_name
-            shutil.copy2(dem_path, dem_result_path)
-            self.logger.info(f"DEM mosaic saved to results: {dem_result_path}")
+            # Single CRS source for map layers and GeoPackage output
+            dem_crs = dem_layer.crs()
+
+            # The import-stage containers are no longer needed; the surface
+            # geometries stay reachable through project.* for later steps
+            del surfaces, all_geoms, combined_geom
 
             self.progress_updated.emit(50, "✓ DGM-Mosaik erstellt")
 
@@ -500,6 +911,8 @@ class WorkflowWorker(QObject):
             self.logger.error(f"DEM Download failed: {e}", exc_info=True)
             raise
 
+        self._check_cancelled()
+
         # === STEP 5: Multi-Surface Optimization ===
         self.progress_updated.emit(52, "⚙️ Optimiere Kranstellflächen-Höhe...")
         self.logger.info(
@@ -513,7 +926,7 @@ class WorkflowWorker(QObject):
             calculator = MultiSurfaceCalculator(dem_layer, project)
 
             # Check if uncertainty analysis is enabled
-            uncertainty_enabled = self.params.get('uncertainty_enabled', False)
+            uncertainty_enabled = self.params.uncertainty_enabled
             self.logger.info(f"Uncertainty analysis: {'ENABLED' if uncertainty_enabled else 'DISABLED'}")
 
             if uncertainty_enabled:
@@ -527,16 +940,16 @@ class WorkflowWorker(QObject):
                     2: TerrainType.STEEP
                 }
                 terrain_type = terrain_type_map.get(
-                    self.params.get('terrain_type_index', 0),
+                    self.params.terrain_type_index,
                     TerrainType.FLAT
                 )
 
                 # Create uncertainty configuration
                 uncertainty_config = UncertaintyConfig(
-                    num_samples=self.params.get('mc_samples', 1000),
+                    num_samples=self.params.mc_samples,
                     terrain_type=terrain_type,
-                    foundation_depth_std=self.params.get('foundation_depth_std', 0.1),
-                    slope_angle_std=self.params.get('slope_angle_std', 3.0),
+                    foundation_depth_std=self.params.foundation_depth_std,
+                    slope_angle_std=self.params.slope_angle_std,
                     use_latin_hypercube=True
                 )
 
@@ -582,7 +995,6 @@ class WorkflowWorker(QObject):
             else:
                 # Standard optimization without uncertainty
                 # On Windows: Disable parallel processing to avoid multiple QGIS instances
-                import platform
                 use_parallel = platform.system() != 'Windows'
 
                 if not use_parallel:
@@ -616,6 +1028,11 @@ class WorkflowWorker(QObject):
             self.logger.error(f"Optimization failed: {e}", exc_info=True)
             raise
 
+        # Serialized once and shared by the profile plots and the report
+        results_dict = results.to_dict()
+
+        self._check_cancelled()
+
         # === STEP 6: Profile Generation ===
         self.progress_updated.emit(72, "📊 Geländeschnitte werden erstellt...")
         self.logger.info(f"Generating profiles in: {profiles_dir}")
@@ -670,64 +1087,73 @@ class WorkflowWorker(QObject):
                 all_geometries.append(project.rotor_storage.geometry)
 
             # Get buffer parameter
-            bbox_buffer = self.params.get('bbox_buffer', 10.0)
-
-            all_profiles = []
+            bbox_buffer = self.params.bbox_buffer
+
+            cross_profiles = []
+            long_profiles = []
+
+            # One process pool renders both profile batches, so the second
+            # batch reuses the already started (matplotlib-loaded) workers
+            with ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1)) as render_pool:
+                # Generate cross-section profiles over bounding box
+                if self.params.generate_cross_profiles:
+                    self.logger.info("Generating cross-section profiles over bounding box...")
+                    self.progress_updated.emit(74, "📊 Querprofile werden erstellt...")
+
+                    cross_profiles_raw = profile_gen.generate_cross_sections_bbox(
+                        all_geometries=all_geometries,
+                        buffer_percent=bbox_buffer,
+                        spacing=self.params.cross_profile_spacing
+                    )
 
-            # Generate cross-section profiles over bounding box
-            if self.params.get('generate_cross_profiles', True):
-                self.logger.info("Generating cross-section profiles over bounding box...")
-                self.progress_updated.emit(74, "📊 Querprofile werden erstellt...")
+                    # Generate visualizations for each profile
+                    cross_profiles = profile_gen.visualize_multiple_profiles(
+                        cross_profiles_raw,
+                        output_dir=str(profiles_dir),
+                        vertical_exaggeration=self.params.vertical_exaggeration,
+                        volume_info=results_dict,
+                        executor=render_pool
+                    )
+                    self.logger.info(f"Generated {len(cross_profiles)} cross-section profiles")
 
-                cross_profiles_raw = profile_gen.generate_cross_sections_bbox(
-                    all_geometries=all_geometries,
-                    buffer_percent=bbox_buffer,
-                    spacing=self.params.get('cross_profile_spacing', 10.0)
-                )
+                # Generate longitudinal profiles over bounding box
+                if self.params.generate_long_profiles:
+                    self.logger.info("Generating longitudinal profiles over bounding box...")
+                    self.progress_updated.emit(78, "📊 Längsprofile werden erstellt...")
 
-                # Generate visualizations for each profile
-                cross_profiles = profile_gen.visualize_multiple_profiles(
-                    cross_profiles_raw,
-                    output_dir=str(profiles_dir),
-                    vertical_exaggeration=self.params['vertical_exaggeration'],
-                    volume_info=results.to_dict()
-                )
-                all_profiles.extend(cross_profiles)
-                self.logger.info(f"Generated {len(cross_profiles)} cross-section profiles")
-
-            # Generate longitudinal profiles over bounding box
-            if self.params.get('generate_long_profiles', True):
-                self.logger.info("Generating longitudinal profiles over bounding box...")
-                self.progress_updated.emit(78, "📊 Längsprofile werden erstellt...")
-
-                long_profiles_raw = profile_gen.generate_longitudinal_sections_bbox(
-                    all_geometries=all_geometries,
-                    buffer_percent=bbox_buffer,
-                    spacing=self.params.get('long_profile_spacing', 10.0)
-                )
+                    long_profiles_raw = profile_gen.generate_longitudinal_sections_bbox(
+                        all_geometries=all_geometries,
+                        buffer_percent=bbox_buffer,
+                        spacing=self.params.long_profile_spacing
+                    )
 
-                # Generate visualizations for each profile
-                long_profiles = profile_gen.visualize_multiple_profiles(
-                    long_profiles_raw,
-                    output_dir=str(profiles_dir),
-                    vertical_exaggeration=self.params['vertical_exaggeration'],
-                    volume_info=results.to_dict()
-                )
-                all_profiles.extend(long_profiles)
-                self.logger.info(f"Generated {len(long_profiles)} longitudinal profiles")
+                    # Generate visualizations for each profile
+                    long_profiles = profile_gen.visualize_multiple_profiles(
+                        long_profiles_raw,
+                        output_dir=str(profiles_dir),
+                        vertical_exaggeration=self.params.vertical_exaggeration,
+                        volume_info=results_dict,
+                        executor=render_pool
+                    )
+                    self.logger.info(f"Generated {len(long_profiles)} longitudinal profiles")
 
-            profiles = all_profiles
-            profile_pngs = [p['png_path'] for p in profiles if 'png_path' in p]
+            profile_pngs = [
+                p['png_path'] for p in chain(cross_profiles, long_profiles) if 'png_path' in p
+            ]
             self.logger.info(f"Total: Generated {len(profile_pngs)} profile images")
-            self.progress_updated.emit(82, f"✓ {len(profiles)} Geländeschnitte erstellt")
+            self.progress_updated.emit(
+                82, f"✓ {len(cross_profiles) + len(long_profiles)} Geländeschnitte erstellt"
+            )
 
         except Exception as e:
             self.logger.error(f"Profile generation failed: {e}", exc_info=True)
             raise
 
+        self._check_cancelled()
+
         # === STEP 6.5: Bodenstabilisierung ===
         stabilization_data = None
-        if self.params.get('enable_stabilization', True):
+        if self.params.enable_stabilization:
             self.progress_updated.emit(83, "🏗️ Bodenstabilisierung wird berechnet...")
             self.logger.info("")
             self.logger.info("=" * 60)
@@ -740,26 +1166,26 @@ class WorkflowWorker(QObject):
                 stabilization_calc = SoilStabilizationCalculator()
 
                 stabilization_data = stabilization_calc.calculate_full_requirements(
-                    platform_area_m2=project.crane_pad.geometry.area(),
-                    soil_type=self.params.get('soil_type', 'Schluff'),
-                    current_ev2=self.params.get('ev2_bestand', 45.0),
-                    water_content=self.params.get('water_content', 0),
-                    optimum_water=self.params.get('optimum_water', 0)
+                    platform_area_m2=project.crane_pad.area,
+                    soil_type=self.params.soil_type,
+                    current_ev2=self.params.ev2_bestand,
+                    water_content=self.params.water_content,
+                    optimum_water=self.params.optimum_water
                 )
 
                 self.logger.info("")
                 self.logger.info("Bodenstabilisierung berechnet:")
-                if stabilization_data.get('total_lime_tons', 0) > 0:
-                    self.logger.info(f"  Kalkbedarf: {stabilization_data['total_lime_tons']:.1f} Tonnen")
+                if stabilization_data.total_lime_tons > 0:
+                    self.logger.info(f"  Kalkbedarf: {stabilization_data.total_lime_tons:.1f} Tonnen")
 
-                self.logger.info(f"  Schotterbedarf: {stabilization_data['total_gravel_tons']:.0f} Tonnen")
+                self.logger.info(f"  Schotterbedarf: {stabilization_data.total_gravel_tons:.0f} Tonnen")
                 self.logger.info(
-                    f"  Schichtdicke: {stabilization_data['gravel_layer']['thickness_m']*100:.0f} cm"
+                    f"  Schichtdicke: {stabilization_data.gravel_layer.thickness_m*100:.0f} cm"
                 )
 
                 self.progress_updated.emit(
                     84,
-                    f"✓ Bodenstabilisierung: {stabilization_data['total_gravel_tons']:.0f} t Schotter"
+                    f"✓ Bodenstabilisierung: {stabilization_data.total_gravel_tons:.0f} t Schotter"
                 )
 
             except Exception as e:
@@ -770,6 +1196,8 @@ class WorkflowWorker(QObject):
         else:
             self.logger.info("Bodenstabilisierung deaktiviert (übersprungen)")
 
+        self._check_cancelled()
+
         # === STEP 7: Report Generation ===
         self.progress_updated.emit(85, "📝 HTML-Bericht wird erstellt...")
         self.logger.info("Generating HTML report")
@@ -782,8 +1210,8 @@ class WorkflowWorker(QObject):
         # Create memory layers for overview map (all surfaces)
         surface_layers = self._create_memory_layers(
             project,
-            profiles,
-            dem_layer.crs()
+            chain(cross_profiles, long_profiles),
+            dem_crs
         )
 
         # Generate filenames
@@ -793,21 +1221,23 @@ class WorkflowWorker(QObject):
 
         # Generate report
         report_config = {
-            'slope_angle': self.params['slope_angle'],
-            'fok': self.params['fok'],
-            'foundation_depth': self.params['foundation_depth'],
-            'gravel_thickness': self.params['gravel_thickness'],
-            'boom_slope': self.params['boom_slope'],
-            'boom_auto_slope': self.params['boom_auto_slope'],
-            'rotor_height_offset': self.params['rotor_height_offset'],
-            'generate_cross_profiles': self.params.get('generate_cross_profiles', True),
-            'cross_profile_spacing': self.params.get('cross_profile_spacing', 10.0),
-            'generate_long_profiles': self.params.get('generate_long_profiles', True),
-            'long_profile_spacing': self.params.get('long_profile_spacing', 10.0)
+            'slope_angle': self.params.slope_angle,
+            'fok': self.params.fok,
+            'foundation_depth': self.params.foundation_depth,
+            'gravel_thickness': self.params.gravel_thickness,
+            'boom_slope': self.params.boom_slope,
+            'boom_auto_slope': self.params.boom_auto_slope,
+            'rotor_height_offset': self.params.rotor_height_offset,
+            'generate_cross_profiles': self.params.generate_cross_profiles,
+            'cross_profile_spacing': self.params.cross_profile_spacing,
+            'generate_long_profiles': self.params.generate_long_profiles,
+            'long_profile_spacing': self.params.long_profile_spacing
         }
 
-        results_for_report = results.to_dict()
-        results_for_report['stabilization'] = stabilization_data
+        results_for_report = {
+            **results_dict,
+            'stabilization': stabilization_data.to_dict() if stabilization_data else None,
+        }
         report_gen = ReportGenerator(
             results_for_report,
             project.crane_pad.geometry,
@@ -829,6 +1259,8 @@ class WorkflowWorker(QObject):
 
         log_event("report_generated")
 
+        self._check_cancelled()
+
         # === STEP 7.5: Calculate Terrain Intersection Lines ===
         self.progress_updated.emit(88, "🔍 Berechne Geländeschnittkanten...")
         self.logger.info("Calculating terrain intersection lines and difference rasters")
@@ -836,6 +1268,8 @@ class WorkflowWorker(QObject):
         output_dir = os.path.dirname(str(gpkg_path))
         calculator.calculate_terrain_intersection_lines(results, output_dir)
 
+        self._check_cancelled()
+
         # === STEP 8: Save to GeoPackage ===
         self.progress_updated.emit(90, "💾 Daten werden in GeoPackage gespeichert...")
         self.logger.info(f"Saving to GeoPackage: {gpkg_path}")
@@ -843,12 +1277,15 @@ class WorkflowWorker(QObject):
         self._save_to_geopackage(
             str(gpkg_path),
             project,
-            profiles,
+            chain(cross_profiles, long_profiles),
             dem_path,
             optimal_crane_height,
-            results
+            results,
+            crs=dem_crs
         )
 
+        self._check_cancelled()
+
         # === STEP 9: Add to QGIS ===
         self.progress_updated.emit(95, "🗺️ Layer werden zu QGIS hinzugefügt...")
         self.logger.info("Adding layers to QGIS project")
@@ -856,13 +1293,13 @@ class WorkflowWorker(QObject):
         try:
             # Collect DXF paths for loading
             dxf_paths = {
-                'crane': surfaces['crane']['dxf_path'],
-                'foundation': surfaces['foundation']['dxf_path'],
+                'crane': project.crane_pad.dxf_path,
+                'foundation': project.foundation.dxf_path,
             }
-            if surfaces.get('boom'):
-                dxf_paths['boom'] = surfaces['boom']['dxf_path']
-            if surfaces.get('rotor'):
-                dxf_paths['rotor'] = surfaces['rotor']['dxf_path']
+            if project.boom:
+                dxf_paths['boom'] = project.boom.dxf_path
+            if project.rotor_storage:
+                dxf_paths['rotor'] = project.rotor_storage.dxf_path
 
             # Instead of adding layers directly (not thread-safe),
             # emit signal to main thread with layer information
@@ -892,17 +1329,49 @@ class WorkflowWorker(QObject):
             f"Alle Dateien in: {workspace}"
         )
 
+    def _import_surface_dxf(self, dxf_path, display_name):
+        """Import one surface DXF file (runs in a worker thread).
+
+        Args:
+            dxf_path: Path to the DXF file
+            display_name: Surface name for messages
+
+        Returns:
+            Tuple of (polygon, metadata, display_name)
+        """
+        try:
+            importer = DXFImporter(
+                dxf_path,
+                tolerance=self.params.dxf_tolerance
+            )
+            polygon, metadata = importer.import_as_polygon()
+
+            if not polygon or polygon.isEmpty():
+                raise Exception(f"Keine gültige Geometrie in {display_name} DXF gefunden")
+
+            self.logger.info(
+                f"{display_name}: {metadata['num_vertices']} Punkte, "
+                f"{metadata['area']:.2f} m²"
+            )
+            return polygon, metadata, display_name
+
+        except Exception as e:
+            self.logger.error(f"DXF Import failed for {display_name}: {e}", exc_info=True)
+            raise Exception(f"Fehler beim Import von {display_name}: {e}")
+
     def _create_memory_layers(self, project, profiles, crs):
         """Create memory layers for all surfaces for map rendering.
 
         Args:
             project: MultiSurfaceProject with all surface geometries
-            profiles: List of profile dictionaries with geometry
+            profiles: Iterable of profile dictionaries with geometry
             crs: Coordinate reference system
 
         Returns:
             Dict with layer names as keys and QgsVectorLayer as values
         """
+        from qgis.core import QgsFillSymbol
+
         layers = {}
 
         # Crane pad layer (Kranstellfläche) - Black outline, no fill
@@ -1011,14 +1480,20 @@ class WorkflowWorker(QObject):
         )
         profile_lines_prov = profile_lines_layer.dataProvider()
         profile_features = []
+        profile_extent = None
         for profile in profiles:
-            feat = QgsFeature()
-            feat.setGeometry(profile['geometry'])
-            # Set the profile name/type as attribute
-            feat.setAttributes([profile.get('type', '')])
-            profile_features.append(feat)
+            profile_features.append(_profile_line_feature(profile))
+            # Combine the known line extents instead of rescanning all features
+            if profile_extent is None:
+                profile_extent = QgsRectangle(profile['geometry'].boundingBox())
+            else:
+                profile_extent.combineExtentWith(profile['geometry'].boundingBox())
         profile_lines_prov.addFeatures(profile_features)
-        profile_lines_layer.updateExtents()
+
+        if profile_extent is not None:
+            profile_lines_layer.setExtent(profile_extent)
+        else:
+            profile_lines_layer.updateExtents()
 
         # Thin gray lines for better visibility on aerial/OSM
         line_symbol = QgsLineSymbol.createSimple({
@@ -1071,158 +1546,107 @@ class WorkflowWorker(QObject):
         return layers
 
     def _save_to_geopackage(self, gpkg_path, project: MultiSurfaceProject,
-                           profiles, dem_path, optimal_crane_height, results):
-        """Save all data to single GeoPackage."""
-        crs = QgsCoordinateReferenceSystem('EPSG:25832')
-        options = QgsVectorFileWriter.SaveVectorOptions()
-        options.driverName = 'GPKG'
-        options.fileEncoding = 'UTF-8'
+                           profiles, dem_path, optimal_crane_height, results, crs=None):
+        """Save all data to single GeoPackage (in crs, EPSG:25832 if not given)."""
+        from qgis.core import QgsCoordinateReferenceSystem
 
+        if crs is None or not crs.isValid():
+            crs = QgsCoordinateReferenceSystem('EPSG:25832')
+        gpkg = _GeoPackageWriter(gpkg_path, crs, self.logger)
+        try:
+            self._write_geopackage_layers(gpkg, project, profiles, optimal_crane_height, results)
+        except Exception:
+            gpkg.abort()
+            raise
+        gpkg.close()
+
+        self.logger.info(f"GeoPackage saved with 2D layers, 3D layers, and profiles: {gpkg_path}")
+
+    def _write_geopackage_layers(self, gpkg, project: MultiSurfaceProject,
+                                 profiles, optimal_crane_height, results):
+        """Write all result layers through an open _GeoPackageWriter."""
         # Layer 1: kranstellflaechen (Polygon)
-        fields_crane = QgsFields()
-        fields_crane.append(QgsField('id', QVariant.Int))
-        fields_crane.append(QgsField('optimal_height', QVariant.Double))
-        fields_crane.append(QgsField('fok', QVariant.Double))
-        fields_crane.append(QgsField('area_m2', QVariant.Double))
-        fields_crane.append(QgsField('total_cut', QVariant.Double))
-        fields_crane.append(QgsField('total_fill', QVariant.Double))
+        fields_crane = _SCHEMA_CRANE
 
         feat_crane = QgsFeature(fields_crane)
         feat_crane.setGeometry(project.crane_pad.geometry)
         feat_crane.setAttribute('id', 1)
         feat_crane.setAttribute('optimal_height', float(optimal_crane_height))
         feat_crane.setAttribute('fok', float(project.fok))
-        feat_crane.setAttribute('area_m2', float(project.crane_pad.geometry.area()))
+        feat_crane.setAttribute('area_m2', float(project.crane_pad.area))
         feat_crane.setAttribute('total_cut', float(results.total_cut))
         feat_crane.setAttribute('total_fill', float(results.total_fill))
 
-        options.layerName = 'kranstellflaechen'
-        writer = QgsVectorFileWriter.create(
-            gpkg_path, fields_crane, QgsWkbTypes.Polygon, crs,
-            QgsCoordinateTransformContext(), options
-        )
-        writer.addFeature(feat_crane)
-        del writer
+        gpkg.write_layer('kranstellflaechen', fields_crane, QgsWkbTypes.Polygon, [feat_crane])
 
         # Layer 2: fundamentflaechen (Polygon)
-        fields_foundation = QgsFields()
-        fields_foundation.append(QgsField('id', QVariant.Int))
-        fields_foundation.append(QgsField('fok', QVariant.Double))
-        fields_foundation.append(QgsField('depth', QVariant.Double))
-        fields_foundation.append(QgsField('area_m2', QVariant.Double))
+        fields_foundation = _SCHEMA_FOUNDATION
 
         feat_foundation = QgsFeature(fields_foundation)
         feat_foundation.setGeometry(project.foundation.geometry)
         feat_foundation.setAttribute('id', 1)
         feat_foundation.setAttribute('fok', float(project.fok))
         feat_foundation.setAttribute('depth', float(project.foundation_depth))
-        feat_foundation.setAttribute('area_m2', float(project.foundation.geometry.area()))
+        feat_foundation.setAttribute('area_m2', float(project.foundation.area))
 
-        options.layerName = 'fundamentflaechen'
-        options.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteLayer
-        writer = QgsVectorFileWriter.create(
-            gpkg_path, fields_foundation, QgsWkbTypes.Polygon, crs,
-            QgsCoordinateTransformContext(), options
-        )
-        writer.addFeature(feat_foundation)
-        del writer
+        gpkg.write_layer('fundamentflaechen', fields_foundation, QgsWkbTypes.Polygon, [feat_foundation])
 
         # Layer 3: auslegerflaechen (Polygon) - optional
         if project.boom:
-            fields_boom = QgsFields()
-            fields_boom.append(QgsField('id', QVariant.Int))
-            fields_boom.append(QgsField('slope_percent', QVariant.Double))
-            fields_boom.append(QgsField('area_m2', QVariant.Double))
+            fields_boom = _SCHEMA_BOOM
 
             feat_boom = QgsFeature(fields_boom)
             feat_boom.setGeometry(project.boom.geometry)
             feat_boom.setAttribute('id', 1)
             feat_boom.setAttribute('slope_percent', float(project.boom.slope_longitudinal))
-            feat_boom.setAttribute('area_m2', float(project.boom.geometry.area()))
+            feat_boom.setAttribute('area_m2', float(project.boom.area))
 
-            options.layerName = 'auslegerflaechen'
-            writer = QgsVectorFileWriter.create(
-                gpkg_path, fields_boom, QgsWkbTypes.Polygon, crs,
-                QgsCoordinateTransformContext(), options
-            )
-            writer.addFeature(feat_boom)
-            del writer
+            gpkg.write_layer('auslegerflaechen', fields_boom, QgsWkbTypes.Polygon, [feat_boom])
 
         # Layer 4: rotorflaechen (Polygon) - optional
         if project.rotor_storage:
-            fields_rotor = QgsFields()
-            fields_rotor.append(QgsField('id', QVariant.Int))
-            fields_rotor.append(QgsField('height_offset', QVariant.Double))
-            fields_rotor.append(QgsField('area_m2', QVariant.Double))
+            fields_rotor = _SCHEMA_ROTOR
 
             feat_rotor = QgsFeature(fields_rotor)
             feat_rotor.setGeometry(project.rotor_storage.geometry)
             feat_rotor.setAttribute('id', 1)
             feat_rotor.setAttribute('height_offset', float(project.rotor_height_offset))
-            feat_rotor.setAttribute('area_m2', float(project.rotor_storage.geometry.area()))
+            feat_rotor.setAttribute('area_m2', float(project.rotor_storage.area))
 
-            options.layerName = 'rotorflaechen'
-            writer = QgsVectorFileWriter.create(
-                gpkg_path, fields_rotor, QgsWkbTypes.Polygon, crs,
-                QgsCoordinateTransformContext(), options
-            )
-            writer.addFeature(feat_rotor)
-            del writer
+            gpkg.write_layer('rotorflaechen', fields_rotor, QgsWkbTypes.Polygon, [feat_rotor])
 
         # Layer 5: zufahrtflaechen (Polygon) - optional
         if project.road_access:
-            fields_road = QgsFields()
-            fields_road.append(QgsField('id', QVariant.Int))
-            fields_road.append(QgsField('slope_percent', QVariant.Double))
-            fields_road.append(QgsField('gravel_thickness', QVariant.Double))
-            fields_road.append(QgsField('area_m2', QVariant.Double))
+            fields_road = _SCHEMA_ROAD
 
             feat_road = QgsFeature(fields_road)
             feat_road.setGeometry(project.road_access.geometry)
             feat_road.setAttribute('id', 1)
             feat_road.setAttribute('slope_percent', float(project.road_slope_percent))
             feat_road.setAttribute('gravel_thickness', float(project.road_gravel_thickness) if project.road_gravel_enabled else 0.0)
-            feat_road.setAttribute('area_m2', float(project.road_access.geometry.area()))
+            feat_road.setAttribute('area_m2', float(project.road_access.area))
 
-            options.layerName = 'zufahrtflaechen'
-            writer = QgsVectorFileWriter.create(
-                gpkg_path, fields_road, QgsWkbTypes.Polygon, crs,
-                QgsCoordinateTransformContext(), options
-            )
-            writer.addFeature(feat_road)
-            del writer
+            gpkg.write_layer('zufahrtflaechen', fields_road, QgsWkbTypes.Polygon, [feat_road])
 
         # Layer 6: schnitte (LineString)
-        fields_lines = QgsFields()
-        fields_lines.append(QgsField('id', QVariant.Int))
-        fields_lines.append(QgsField('type', QVariant.String))
-        fields_lines.append(QgsField('length_m', QVariant.Double))
-
-        options.layerName = 'schnitte'
-        writer = QgsVectorFileWriter.create(
-            gpkg_path, fields_lines, QgsWkbTypes.LineString, crs,
-            QgsCoordinateTransformContext(), options
-        )
+        fields_lines = _SCHEMA_PROFILE_LINES
 
+        line_features = []
         for i, profile in enumerate(profiles):
             feat_line = QgsFeature(fields_lines)
             feat_line.setGeometry(profile['geometry'])
             feat_line.setAttribute('id', i + 1)
             feat_line.setAttribute('type', profile['type'])
             feat_line.setAttribute('length_m', float(profile['length']))
-            writer.addFeature(feat_line)
-
-        del writer
+            line_features.append(feat_line)
+        gpkg.write_layer('schnitte', fields_lines, QgsWkbTypes.LineString, line_features)
 
         # === 3D LAYERS ===
         # Layer 6: kranstellflaechen_3d (PolygonZ)
         if SurfaceType.CRANE_PAD in results.surface_results:
             crane_result = results.surface_results[SurfaceType.CRANE_PAD]
             if crane_result.geometry_3d and not crane_result.geometry_3d.isEmpty():
-                fields_crane_3d = QgsFields()
-                fields_crane_3d.append(QgsField('id', QVariant.Int))
-                fields_crane_3d.append(QgsField('height', QVariant.Double))
-                fields_crane_3d.append(QgsField('surface_type', QVariant.String))
+                fields_crane_3d = _SCHEMA_SURFACE_3D
 
                 feat_crane_3d = QgsFeature(fields_crane_3d)
                 feat_crane_3d.setGeometry(crane_result.geometry_3d)
@@ -1230,22 +1654,13 @@ class WorkflowWorker(QObject):
                 feat_crane_3d.setAttribute('height', float(crane_result.target_height))
                 feat_crane_3d.setAttribute('surface_type', 'kranstellflaeche')
 
-                options.layerName = 'kranstellflaechen_3d'
-                writer = QgsVectorFileWriter.create(
-                    gpkg_path, fields_crane_3d, QgsWkbTypes.PolygonZ, crs,
-                    QgsCoordinateTransformContext(), options
-                )
-                writer.addFeature(feat_crane_3d)
-                del writer
+                gpkg.write_layer('kranstellflaechen_3d', fields_crane_3d, QgsWkbTypes.PolygonZ, [feat_crane_3d])
 
         # Layer 7: fundamentflaechen_3d (PolygonZ)
         if SurfaceType.FOUNDATION in results.surface_results:
             foundation_result = results.surface_results[SurfaceType.FOUNDATION]
             if foundation_result.geometry_3d and not foundation_result.geometry_3d.isEmpty():
-                fields_foundation_3d = QgsFields()
-                fields_foundation_3d.append(QgsField('id', QVariant.Int))
-                fields_foundation_3d.append(QgsField('height', QVariant.Double))
-                fields_foundation_3d.append(QgsField('surface_type', QVariant.String))
+                fields_foundation_3d = _SCHEMA_SURFACE_3D
 
                 feat_foundation_3d = QgsFeature(fields_foundation_3d)
                 feat_foundation_3d.setGeometry(foundation_result.geometry_3d)
@@ -1253,23 +1668,13 @@ class WorkflowWorker(QObject):
                 feat_foundation_3d.setAttribute('height', float(foundation_result.target_height))
                 feat_foundation_3d.setAttribute('surface_type', 'fundamentflaeche')
 
-                options.layerName = 'fundamentflaechen_3d'
-                writer = QgsVectorFileWriter.create(
-                    gpkg_path, fields_foundation_3d, QgsWkbTypes.PolygonZ, crs,
-                    QgsCoordinateTransformContext(), options
-                )
-                writer.addFeature(feat_foundation_3d)
-                del writer
+                gpkg.write_layer('fundamentflaechen_3d', fields_foundation_3d, QgsWkbTypes.PolygonZ, [feat_foundation_3d])
 
         # Layer 8: auslegerflaechen_3d (PolygonZ) - optional
         if project.boom and SurfaceType.BOOM in results.surface_results:
             boom_result = results.surface_results[SurfaceType.BOOM]
             if boom_result.geometry_3d and not boom_result.geometry_3d.isEmpty():
-                fields_boom_3d = QgsFields()
-                fields_boom_3d.append(QgsField('id', QVariant.Int))
-                fields_boom_3d.append(QgsField('height', QVariant.Double))
-                fields_boom_3d.append(QgsField('slope_percent', QVariant.Double))
-                fields_boom_3d.append(QgsField('surface_type', QVariant.String))
+                fields_boom_3d = _SCHEMA_BOOM_3D
 
                 feat_boom_3d = QgsFeature(fields_boom_3d)
                 feat_boom_3d.setGeometry(boom_result.geometry_3d)
@@ -1278,23 +1683,13 @@ class WorkflowWorker(QObject):
                 feat_boom_3d.setAttribute('slope_percent', float(results.boom_slope_percent))
                 feat_boom_3d.setAttribute('surface_type', 'auslegerflaeche')
 
-                options.layerName = 'auslegerflaechen_3d'
-                writer = QgsVectorFileWriter.create(
-                    gpkg_path, fields_boom_3d, QgsWkbTypes.PolygonZ, crs,
-                    QgsCoordinateTransformContext(), options
-                )
-                writer.addFeature(feat_boom_3d)
-                del writer
+                gpkg.write_layer('auslegerflaechen_3d', fields_boom_3d, QgsWkbTypes.PolygonZ, [feat_boom_3d])
 
         # Layer 9: rotorflaechen_3d (PolygonZ) - optional
         if project.rotor_storage and SurfaceType.ROTOR_STORAGE in results.surface_results:
             rotor_result = results.surface_results[SurfaceType.ROTOR_STORAGE]
             if rotor_result.geometry_3d and not rotor_result.geometry_3d.isEmpty():
-                fields_rotor_3d = QgsFields()
-                fields_rotor_3d.append(QgsField('id', QVariant.Int))
-                fields_rotor_3d.append(QgsField('height', QVariant.Double))
-                fields_rotor_3d.append(QgsField('height_offset', QVariant.Double))
-                fields_rotor_3d.append(QgsField('surface_type', QVariant.String))
+                fields_rotor_3d = _SCHEMA_ROTOR_3D
 
                 feat_rotor_3d = QgsFeature(fields_rotor_3d)
                 feat_rotor_3d.setGeometry(rotor_result.geometry_3d)
@@ -1303,24 +1698,13 @@ class WorkflowWorker(QObject):
                 feat_rotor_3d.setAttribute('height_offset', float(results.rotor_height_offset_optimized))
                 feat_rotor_3d.setAttribute('surface_type', 'rotorflaeche')
 
-                options.layerName = 'rotorflaechen_3d'
-                writer = QgsVectorFileWriter.create(
-                    gpkg_path, fields_rotor_3d, QgsWkbTypes.PolygonZ, crs,
-                    QgsCoordinateTransformContext(), options
-                )
-                writer.addFeature(feat_rotor_3d)
-                del writer
+                gpkg.write_layer('rotorflaechen_3d', fields_rotor_3d, QgsWkbTypes.PolygonZ, [feat_rotor_3d])
 
         # Layer 10: zufahrtflaechen_3d (PolygonZ) - optional
         if project.road_access and SurfaceType.ROAD_ACCESS in results.surface_results:
             road_result = results.surface_results[SurfaceType.ROAD_ACCESS]
             if road_result.geometry_3d and not road_result.geometry_3d.isEmpty():
-                fields_road_3d = QgsFields()
-                fields_road_3d.append(QgsField('id', QVariant.Int))
-                fields_road_3d.append(QgsField('height', QVariant.Double))
-                fields_road_3d.append(QgsField('slope_percent', QVariant.Double))
-                fields_road_3d.append(QgsField('gravel_thickness', QVariant.Double))
-                fields_road_3d.append(QgsField('surface_type', QVariant.String))
+                fields_road_3d = _SCHEMA_ROAD_3D
 
                 feat_road_3d = QgsFeature(fields_road_3d)
                 feat_road_3d.setGeometry(road_result.geometry_3d)
@@ -1330,13 +1714,7 @@ class WorkflowWorker(QObject):
                 feat_road_3d.setAttribute('gravel_thickness', float(project.road_gravel_thickness) if project.road_gravel_enabled else 0.0)
                 feat_road_3d.setAttribute('surface_type', 'zufahrtflaeche')
 
-                options.layerName = 'zufahrtflaechen_3d'
-                writer = QgsVectorFileWriter.create(
-                    gpkg_path, fields_road_3d, QgsWkbTypes.PolygonZ, crs,
-                    QgsCoordinateTransformContext(), options
-                )
-                writer.addFeature(feat_road_3d)
-                del writer
+                gpkg.write_layer('zufahrtflaechen_3d', fields_road_3d, QgsWkbTypes.PolygonZ, [feat_road_3d])
 
         # Layer 11: boeschungen_3d (MultiPolygonZ) - slope surfaces
         # Collect all slope geometries
@@ -1346,24 +1724,17 @@ class WorkflowWorker(QObject):
                 slope_geometries.append((surface_type.value, surface_result.slope_geometry_3d))
 
         if slope_geometries:
-            fields_slope_3d = QgsFields()
-            fields_slope_3d.append(QgsField('id', QVariant.Int))
-            fields_slope_3d.append(QgsField('surface_type', QVariant.String))
-
-            options.layerName = 'boeschungen_3d'
-            writer = QgsVectorFileWriter.create(
-                gpkg_path, fields_slope_3d, QgsWkbTypes.MultiPolygonZ, crs,
-                QgsCoordinateTransformContext(), options
-            )
+            fields_slope_3d = _SCHEMA_SLOPE_3D
 
+            slope_features = []
             for i, (surface_name, slope_geom) in enumerate(slope_geometries):
                 feat_slope = QgsFeature(fields_slope_3d)
                 feat_slope.setGeometry(slope_geom)
                 feat_slope.setAttribute('id', i + 1)
                 feat_slope.setAttribute('surface_type', surface_name)
-                writer.addFeature(feat_slope)
-
-            del writer
+                slope_features.append(feat_slope)
+            gpkg.write_layer('boeschungen_3d', fields_slope_3d, QgsWkbTypes.MultiPolygonZ,
+                             slope_features)
 
         # === GELÄNDESCHNITTKANTEN (2D und 3D) ===
         # Helper-Funktion zum Speichern einer Schnittkante
@@ -1399,11 +1770,7 @@ class WorkflowWorker(QObject):
             processed_2d = process_geometry(geometry_2d, is_3d=False)
             
             if processed_2d and not processed_2d.isEmpty():
-                fields_2d = QgsFields()
-                fields_2d.append(QgsField('id', QVariant.Int))
-                fields_2d.append(QgsField('length_m', QVariant.Double))
-                fields_2d.append(QgsField('description', QVariant.String))
-                fields_2d.append(QgsField('color', QVariant.String))
+                fields_2d = _SCHEMA_INTERSECTION_LINE
 
                 feat_2d = QgsFeature(fields_2d)
                 feat_2d.setGeometry(processed_2d)
@@ -1412,31 +1779,14 @@ class WorkflowWorker(QObject):
                 feat_2d.setAttribute('description', description)
                 feat_2d.setAttribute('color', color)
 
-                options.layerName = layer_name
                 # Use MultiLineString for robustness
-                writer = QgsVectorFileWriter.create(
-                    gpkg_path, fields_2d, QgsWkbTypes.MultiLineString, crs,
-                    QgsCoordinateTransformContext(), options
-                )
-                
-                if writer.hasError() != QgsVectorFileWriter.NoError:
-                    self.logger.error(f"Error creating layer {layer_name}: {writer.errorMessage()}")
-                else:
-                    writer.addFeature(feat_2d)
-                    if writer.hasError() != QgsVectorFileWriter.NoError:
-                        self.logger.error(f"Error adding feature to {layer_name}: {writer.errorMessage()}")
-                
-                del writer
+                gpkg.write_layer(layer_name, fields_2d, QgsWkbTypes.MultiLineString, [feat_2d])
 
             # 3D Layer
             processed_3d = process_geometry(geometry_3d, is_3d=True)
             
             if processed_3d and not processed_3d.isEmpty():
-                fields_3d = QgsFields()
-                fields_3d.append(QgsField('id', QVariant.Int))
-                fields_3d.append(QgsField('length_m', QVariant.Double))
-                fields_3d.append(QgsField('description', QVariant.String))
-                fields_3d.append(QgsField('color', QVariant.String))
+                fields_3d = _SCHEMA_INTERSECTION_LINE
 
                 feat_3d = QgsFeature(fields_3d)
                 feat_3d.setGeometry(processed_3d)
@@ -1445,21 +1795,9 @@ class WorkflowWorker(QObject):
                 feat_3d.setAttribute('description', description)
                 feat_3d.setAttribute('color', color)
 
-                options.layerName = f"{layer_name}_3d"
                 # Use MultiLineStringZ for robustness
-                writer = QgsVectorFileWriter.create(
-                    gpkg_path, fields_3d, QgsWkbTypes.MultiLineStringZ, crs,
-                    QgsCoordinateTransformContext(), options
-                )
-                
-                if writer.hasError() != QgsVectorFileWriter.NoError:
-                    self.logger.error(f"Error creating layer {layer_name}_3d: {writer.errorMessage()}")
-                else:
-                    writer.addFeature(feat_3d)
-                    if writer.hasError() != QgsVectorFileWriter.NoError:
-                        self.logger.error(f"Error adding feature to {layer_name}_3d: {writer.errorMessage()}")
-                
-                del writer
+                gpkg.write_layer(f"{layer_name}_3d", fields_3d, QgsWkbTypes.MultiLineStringZ,
+                                 [feat_3d])
 
         # Speichere alle Schnittkanten
         if SurfaceType.FOUNDATION in results.surface_results:
@@ -1527,8 +1865,6 @@ class WorkflowWorker(QObject):
 
         self.logger.info("Terrain intersection lines saved to GeoPackage")
 
-        self.logger.info(f"GeoPackage saved with 2D layers, 3D layers, and profiles: {gpkg_path}")
-
     @staticmethod
     def _add_layers_to_qgis_main_thread(gpkg_path, report_path, dem_path=None, dxf_paths=None, group_name=None):
         """
@@ -1555,6 +1891,17 @@ class WorkflowWorker(QObject):
         else:
             group = root
 
+        # Layers are collected first and registered with a single
+        # addMapLayers() call at the end, so the canvas refreshes once
+        # instead of once per layer. tree_items keeps the legend order as
+        # (parent node, layer or subgroup) pairs.
+        layers = []
+        tree_items = []
+
+        def add_layer(layer, parent=group):
+            layers.append(layer)
+            tree_items.append((parent, layer))
+
         # Layer order in QGIS: first added = top in layer panel (rendered on top)
         # Desired order from bottom to top: DEM -> Polygons -> Lines
         # So we add: Lines first, then Polygons, then DEM last
@@ -1567,11 +1914,7 @@ class WorkflowWorker(QObject):
             "ogr"
         )
         if profile_layer.isValid():
-            project.addMapLayer(profile_layer, False)
-            if group_name:
-                group.addLayer(profile_layer)
-            else:
-                root.addLayer(profile_layer)
+            add_layer(profile_layer)
             logger.info("Added layer: Geländeschnitte")
 
         # Add DXF layers
@@ -1597,11 +1940,7 @@ class WorkflowWorker(QObject):
                             "ogr"
                         )
                         if dxf_layer.isValid():
-                            project.addMapLayer(dxf_layer, False)
-                            if group_name:
-                                group.addLayer(dxf_layer)
-                            else:
-                                root.addLayer(dxf_layer)
+                            add_layer(dxf_layer)
                             logger.info(f"Added DXF layer: {display_name}")
                         else:
                             logger.warning(f"Could not load DXF layer: {dxf_path}")
@@ -1627,21 +1966,12 @@ class WorkflowWorker(QObject):
                 "ogr"
             )
             if layer.isValid():
-                project.addMapLayer(layer, False)  # Don't add to legend yet
-                if group_name:
-                    group.addLayer(layer)
-                else:
-                    root.addLayer(layer)
+                add_layer(layer)
                 logger.info(f"Added layer: {display_name}")
 
         # === GELÄNDESCHNITTKANTEN ===
-        from qgis.core import QgsLineSymbol
-
-        if group_name:
-            subgroup_intersections = QgsLayerTreeGroup('Geländeschnittkanten')
-            group.addChildNode(subgroup_intersections)
-        else:
-            subgroup_intersections = root.addGroup('Geländeschnittkanten')
+        subgroup_intersections = QgsLayerTreeGroup('Geländeschnittkanten')
+        tree_items.append((group, subgroup_intersections))
 
         intersection_layers = [
             ('gelaendeschnittkante_fundamentsohle', '#8B4513', 0.4),
@@ -1666,8 +1996,7 @@ class WorkflowWorker(QObject):
                     'capstyle': 'round'
                 })
                 layer_2d.renderer().setSymbol(symbol)
-                project.addMapLayer(layer_2d, False)
-                subgroup_intersections.addLayer(layer_2d)
+                add_layer(layer_2d, subgroup_intersections)
 
             # 3D Layer
             layer_3d = QgsVectorLayer(f"{gpkg_path}|layername={layer_name}_3d",
@@ -1681,18 +2010,10 @@ class WorkflowWorker(QObject):
                     'capstyle': 'round'
                 })
                 layer_3d.renderer().setSymbol(symbol)
-                project.addMapLayer(layer_3d, False)
-                subgroup_intersections.addLayer(layer_3d)
+                add_layer(layer_3d, subgroup_intersections)
 
 
         # === DIFFERENZ-RASTER (Cut/Fill) ===
-        from qgis.core import (
-            QgsSingleBandPseudoColorRenderer,
-            QgsColorRampShader,
-            QgsRasterShader
-        )
-        from qgis.PyQt.QtGui import QColor
-
         def apply_cutfill_styling(raster_layer: QgsRasterLayer):
             """
             Wendet Cut/Fill-Farbschema auf Differenz-Raster an.
@@ -1752,11 +2073,8 @@ class WorkflowWorker(QObject):
             raster_layer.triggerRepaint()
 
 
-        if group_name:
-            subgroup_diff_rasters = QgsLayerTreeGroup('Differenz-Raster (Cut/Fill)')
-            group.addChildNode(subgroup_diff_rasters)
-        else:
-            subgroup_diff_rasters = root.addGroup('Differenz-Raster (Cut/Fill)')
+        subgroup_diff_rasters = QgsLayerTreeGroup('Differenz-Raster (Cut/Fill)')
+        tree_items.append((group, subgroup_diff_rasters))
 
         diff_raster_configs = [
             ('differenz_fundamentsohle.tif', 'Differenz Fundamentsohle'),
@@ -1780,24 +2098,27 @@ class WorkflowWorker(QObject):
                     # Styling: Cut/Fill-Farbschema
                     apply_cutfill_styling(diff_layer)
 
-                    project.addMapLayer(diff_layer, False)
-                    subgroup_diff_rasters.addLayer(diff_layer)
+                    add_layer(diff_layer, subgroup_diff_rasters)
 
-        logger.info("Terrain intersection lines and difference rasters added to QGIS")
+        logger.info("Terrain intersection lines and difference rasters prepared")
 
         # === BOTTOM: Add DEM mosaic layer last (will be at bottom) ===
         if dem_path:
             dem_layer = QgsRasterLayer(dem_path, "DGM Mosaik")
             if dem_layer.isValid():
-                project.addMapLayer(dem_layer, False)
-                if group_name:
-                    group.addLayer(dem_layer)
-                else:
-                    root.addLayer(dem_layer)
+                add_layer(dem_layer)
                 logger.info(f"Added DEM layer: {dem_path}")
             else:
                 logger.warning(f"Could not load DEM layer: {dem_path}")
 
+        # Register all layers at once, then build the legend in order
+        project.addMapLayers(layers, False)
+        for parent, item in tree_items:
+            if isinstance(item, QgsLayerTreeGroup):
+                parent.addChildNode(item)
+            else:
+                parent.addLayer(item)
+
         logger.info("All layers added to QGIS project")
 
 
@@ -1812,7 +2133,7 @@ class WorkflowRunner(QObject):
 
         Args:
             iface: QGIS interface
-            params (dict): Parameters from dialog
+            params (RunParams): Parameters from dialog
             dialog: Main dialog for progress updates
         """
         super().__init__()
@@ -1834,7 +2155,8 @@ class WorkflowRunner(QObject):
         self.worker.moveToThread(self.thread)
 
         # Connect signals
-        self.worker.progress_updated.connect(self.dialog.update_progress)
+        # Explicitly queued: progress is emitted from the worker thread
+        self.worker.progress_updated.connect(self.dialog.update_progress, Qt.QueuedConnection)
         self.worker.layers_ready.connect(self._on_layers_ready)  # NEW: Thread-safe layer addition
         self.worker.finished.connect(self._on_finished)
         self.thread.started.connect(self.worker.run)
@@ -1842,6 +2164,11 @@ class WorkflowRunner(QObject):
         # Start thread
         self.thread.start()
 
+    def cancel(self):
+        """Request cancellation; the worker stops at the next step boundary."""
+        if self.worker:
+            self.worker.cancel()
+
     def _on_layers_ready(self, layer_info):
         """
         Handle layers_ready signal from worker thread.
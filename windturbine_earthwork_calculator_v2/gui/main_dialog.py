@@ -12,27 +12,105 @@ Version: 2.0.0 - Multi-Surface Extension
 """
 
 import os
+from functools import partial
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 from qgis.PyQt.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QLabel, QLineEdit, QPushButton, QFileDialog,
     QDoubleSpinBox, QSpinBox, QGroupBox, QFormLayout,
-    QCheckBox, QMessageBox, QProgressBar, QTextEdit, QScrollArea, QComboBox
+    QCheckBox, QMessageBox, QProgressBar, QPlainTextEdit, QScrollArea, QComboBox
 )
-from qgis.PyQt.QtCore import Qt, pyqtSignal, QUrl
-from qgis.PyQt.QtGui import QIcon, QDesktopServices
+from qgis.PyQt.QtCore import Qt, pyqtSignal, QTimer, QUrl
+from qgis.PyQt.QtGui import QDesktopServices
 
 from ..utils.logging_utils import get_plugin_logger
 from ..utils.validation import (
     ValidationError,
     validate_file_exists,
-    validate_height_range,
-    validate_crs
+    validate_height_range
 )
 from ..utils.i18n import get_message, get_language
 from ..utils.error_messages import ERROR_MESSAGES
 from ..core.dxf_importer import DXFImporter
+from ..core.workflow_runner import RunParams
+
+
+class _SpinSpec(NamedTuple):
+    """Declarative description of a QDoubleSpinBox input field."""
+    param: Optional[str]  # key in the processing parameters, None if not passed on
+    minimum: float
+    maximum: float
+    default: float
+    decimals: int
+    suffix: str
+    tooltip: Optional[str] = None
+
+
+# Numeric input fields, keyed by widget name (without the "input_" prefix).
+# MainDialog._make_spin() builds the widgets and mirrors their values in _spin_state.
+_SPINBOX_SPECS = {
+    'dxf_tolerance': _SpinSpec('dxf_tolerance', 0.001, 10.0, 0.01, 3, " m",
+                               "Toleranz für Punktverbindungen beim DXF-Import"),
+    'fok': _SpinSpec('fok', 0, 9999, 305.50, 2, " m ü.NN",
+                     "Behördlich vorgegebene Fundamentoberkante"),
+    'foundation_depth': _SpinSpec('foundation_depth', 0.5, 10.0, 3.5, 2, " m",
+                                  "Tiefe unter FOK bis Fundamentsohle"),
+    'foundation_diameter': _SpinSpec('foundation_diameter', 0, 50.0, 20.0, 1, " m",
+                                     "Optional: Durchmesser falls nicht aus DXF ersichtlich"),
+    'search_below_fok': _SpinSpec('search_range_below_fok', 0, 5.0, 0.5, 2, " m",
+                                  "Minimaler Abstand unter FOK für Optimierungssuche"),
+    'search_above_fok': _SpinSpec('search_range_above_fok', 0, 5.0, 0.5, 2, " m",
+                                  "Maximaler Abstand über FOK für Optimierungssuche"),
+    'gravel_thickness': _SpinSpec('gravel_thickness', 0, 2.0, 0.5, 2, " m",
+                                  "Dicke der Schotterschicht auf Kranstellfläche"),
+    'boom_slope': _SpinSpec('boom_slope', 2.0, 8.0, 5.0, 1, " %",
+                            "Längsneigung der Auslegerfläche (2-8%)"),
+    'rotor_height_offset': _SpinSpec('rotor_height_offset', -5.0, 5.0, 0.0, 2, " m",
+                                     "Höhendifferenz zur Kranstellfläche (positiv = höher, negativ = tiefer)"),
+    'road_slope': _SpinSpec('road_slope_percent', 1.0, 15.0, 8.0, 1, " %",
+                            "Maximale Längsneigung der Zufahrtsstraße (Richtung wird automatisch erkannt)"),
+    'road_gravel_thickness': _SpinSpec('road_gravel_thickness', 0.1, 1.0, 0.3, 2, " m",
+                                       "Dicke der Schotterschicht auf Zufahrtsstraße"),
+    'height_step': _SpinSpec('height_step', 0.01, 1.0, 0.1, 2, " m",
+                             "Schrittweite für Höhenoptimierung"),
+    'slope_angle': _SpinSpec('slope_angle', 15.0, 60.0, 45.0, 1, " °",
+                             "Böschungswinkel (45° = 1:1)"),
+    'foundation_depth_std': _SpinSpec('foundation_depth_std', 0, 0.5, 0.1, 2, " m (σ)",
+                                      "Standardabweichung der Fundamenttiefe"),
+    'slope_angle_std': _SpinSpec('slope_angle_std', 0, 10.0, 3.0, 1, " ° (σ)",
+                                 "Standardabweichung des Böschungswinkels"),
+    'bbox_buffer': _SpinSpec('bbox_buffer', 0.0, 50.0, 10.0, 1, " %",
+                             "Zusätzlicher Puffer um alle Flächen herum als Prozent der Bauplatzgröße"),
+    'cross_profile_spacing': _SpinSpec('cross_profile_spacing', 1.0, 50.0, 10.0, 1, " m"),
+    'long_profile_spacing': _SpinSpec('long_profile_spacing', 1.0, 50.0, 10.0, 1, " m"),
+    'vertical_exaggeration': _SpinSpec('vertical_exaggeration', 1.0, 10.0, 2.0, 1, " x"),
+    'ev2_bestand': _SpinSpec('ev2_bestand', 0, 200, 45.0, 1, " MN/m²",
+                             "Verformungsmodul des anstehenden Bodens (Plattendruckversuch DIN 18134)\n"
+                             "Typische Bereiche werden basierend auf gewählter Bodenart angezeigt"),
+    'water_content': _SpinSpec('water_content', 0, 50, 0, 1, " %",
+                               "Aktueller Wassergehalt (optional, für genauere Kalkdosierung)"),
+    'optimum_water': _SpinSpec('optimum_water', 0, 50, 18.0, 1, " %",
+                               "Optimaler Wassergehalt nach Proctor (DIN 18127)\n"
+                               "Wird automatisch für gewählte Bodenart vorgeschlagen\n"
+                               "Kann manuell überschrieben werden"),
+    'cost_cut': _SpinSpec(None, 0, 100, 8.0, 2, " €/m³", "Kosten pro Kubikmeter Abtrag"),
+    'cost_fill': _SpinSpec(None, 0, 100, 12.0, 2, " €/m³", "Kosten pro Kubikmeter Auftrag"),
+    'cost_gravel': _SpinSpec(None, 0, 200, 45.0, 2, " €/m³", "Kosten pro Kubikmeter Schotter"),
+}
+
+# Static UI strings shared by several widgets
+_BROWSE_TEXT = "Durchsuchen..."
+_HINT_STYLE = "color: gray; font-size: 10px;"
+_NOTE_STYLE = "QLabel { color: #666; font-size: 10pt; }"
+_ERROR_STYLE = "QLabel { color: #cc0000; }"
+_WORKSPACE_INFO_TEXT = (
+    "Struktur wird automatisch erstellt:\n"
+    "• ergebnisse/ - GeoPackage & HTML-Bericht\n"
+    "• gelaendeschnitte/ - PNG-Bilder\n"
+    "• cache/ - DEM-Kacheln"
+)
 
 
 class MainDialog(QDialog):
@@ -48,7 +126,9 @@ class MainDialog(QDialog):
     """
 
     # Signal emitted when user clicks "Start"
-    processing_requested = pyqtSignal(dict)
+    processing_requested = pyqtSignal(object)  # RunParams
+    # Signal emitted when user cancels a running calculation
+    cancel_requested = pyqtSignal()
 
     def __init__(self, parent=None):
         """Initialize dialog."""
@@ -62,9 +142,18 @@ class MainDialog(QDialog):
         self.processed_sites = []  # List of SiteData objects
         self.site_checkboxes = {}  # Dict mapping site_id -> QCheckBox
 
+        # Parameter key -> current spin box value, kept in sync by valueChanged
+        self._spin_state = {}
+        # (path, mtime_ns, size) of DXF files that already passed the file check
+        self._validated_dxf_paths = set()
+        # File dialogs are created on first use and reused afterwards
+        self._dxf_dialog = None
+        self._ws_dialog = None
+        # True between processing_requested and processing_finished
+        self._processing = False
+
         self._init_ui()
         self._connect_signals()
-        self._setup_validators()
 
         # Initialize button visibility for first tab
         self._on_tab_changed(0)
@@ -76,20 +165,23 @@ class MainDialog(QDialog):
         # Tab widget
         self.tabs = QTabWidget()
 
-        # Create tabs
+        # Only the input tab is built up front; the other tabs start as
+        # placeholders and are built on first activation (_ensure_tab_built)
         self.tab_input = self._create_input_tab()
-        self.tab_optimization = self._create_optimization_tab()
-        self.tab_profiles = self._create_profiles_tab()
-        self.tab_stabilization = self._create_soil_stabilization_tab()
-        self.tab_output = self._create_output_tab()
-        self.tab_multisite = self._create_multisite_report_tab()
-
         self.tabs.addTab(self.tab_input, "📂 Eingabe")
-        self.tabs.addTab(self.tab_optimization, "⚙️ Optimierung")
-        self.tabs.addTab(self.tab_profiles, "📊 Geländeschnitte")
-        self.tabs.addTab(self.tab_stabilization, "🏗️ Bodenstabilisierung")
-        self.tabs.addTab(self.tab_output, "💾 Ausgabe")
-        self.tabs.addTab(self.tab_multisite, "📈 Standortvergleich")
+
+        # index -> (attribute name, builder, title)
+        self._tab_builders = {
+            1: ('tab_optimization', self._create_optimization_tab, "⚙️ Optimierung"),
+            2: ('tab_profiles', self._create_profiles_tab, "📊 Geländeschnitte"),
+            3: ('tab_stabilization', self._create_soil_stabilization_tab, "🏗️ Bodenstabilisierung"),
+            4: ('tab_output', self._create_output_tab, "💾 Ausgabe"),
+            5: ('tab_multisite', self._create_multisite_report_tab, "📈 Standortvergleich"),
+        }
+        self._tab_built = {0}
+        for index in sorted(self._tab_builders):
+            _, _, title = self._tab_builders[index]
+            self.tabs.addTab(QWidget(), title)
 
         layout.addWidget(self.tabs)
 
@@ -99,12 +191,22 @@ class MainDialog(QDialog):
         layout.addWidget(self.progress_bar)
 
         # Status text
-        self.status_text = QTextEdit()
+        # Plain-text log: cheap appends, bounded to the most recent messages
+        self.status_text = QPlainTextEdit()
         self.status_text.setMaximumHeight(100)
         self.status_text.setReadOnly(True)
+        self.status_text.setMaximumBlockCount(500)
         self.status_text.setVisible(False)
         layout.addWidget(self.status_text)
 
+        # Progress updates are coalesced and painted at most ~30 times/s
+        self._pending_progress = None
+        self._pending_messages = []
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         # Buttons (dynamically shown based on current tab)
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -142,76 +244,65 @@ class MainDialog(QDialog):
         # Crane pad DXF
         self.input_dxf_crane = QLineEdit()
         self.input_dxf_crane.setPlaceholderText("Pfad zur DXF-Datei mit Kranstellflächen-Umriss...")
-        btn_browse_crane = QPushButton("Durchsuchen...")
-        btn_browse_crane.clicked.connect(lambda: self._browse_dxf(self.input_dxf_crane, "Kranstellfläche"))
+        self.btn_browse_crane = QPushButton(_BROWSE_TEXT)
 
         crane_layout = QHBoxLayout()
         crane_layout.addWidget(self.input_dxf_crane)
-        crane_layout.addWidget(btn_browse_crane)
+        crane_layout.addWidget(self.btn_browse_crane)
         form_dxf.addRow("Kranstellfläche:", crane_layout)
 
         # Foundation DXF
         self.input_dxf_foundation = QLineEdit()
         self.input_dxf_foundation.setPlaceholderText("Pfad zur DXF-Datei mit Fundamentflächen-Umriss...")
-        btn_browse_foundation = QPushButton("Durchsuchen...")
-        btn_browse_foundation.clicked.connect(lambda: self._browse_dxf(self.input_dxf_foundation, "Fundamentfläche"))
+        self.btn_browse_foundation = QPushButton(_BROWSE_TEXT)
 
         foundation_layout = QHBoxLayout()
         foundation_layout.addWidget(self.input_dxf_foundation)
-        foundation_layout.addWidget(btn_browse_foundation)
+        foundation_layout.addWidget(self.btn_browse_foundation)
         form_dxf.addRow("Fundamentfläche:", foundation_layout)
 
         # Boom surface DXF (optional)
         self.input_dxf_boom = QLineEdit()
         self.input_dxf_boom.setPlaceholderText("Optional: DXF-Datei mit Auslegerflächen-Umriss...")
-        btn_browse_boom = QPushButton("Durchsuchen...")
-        btn_browse_boom.clicked.connect(lambda: self._browse_dxf(self.input_dxf_boom, "Auslegerfläche"))
+        self.btn_browse_boom = QPushButton(_BROWSE_TEXT)
 
         boom_layout = QHBoxLayout()
         boom_layout.addWidget(self.input_dxf_boom)
-        boom_layout.addWidget(btn_browse_boom)
+        boom_layout.addWidget(self.btn_browse_boom)
         form_dxf.addRow("Auslegerfläche (optional):", boom_layout)
 
         # Blade storage DXF (optional)
         self.input_dxf_rotor = QLineEdit()
         self.input_dxf_rotor.setPlaceholderText("Optional: DXF-Datei mit Blattlagerflächen-Umriss...")
-        btn_browse_rotor = QPushButton("Durchsuchen...")
-        btn_browse_rotor.clicked.connect(lambda: self._browse_dxf(self.input_dxf_rotor, "Blattlagerfläche"))
+        self.btn_browse_rotor = QPushButton(_BROWSE_TEXT)
 
         rotor_layout = QHBoxLayout()
         rotor_layout.addWidget(self.input_dxf_rotor)
-        rotor_layout.addWidget(btn_browse_rotor)
+        rotor_layout.addWidget(self.btn_browse_rotor)
         form_dxf.addRow("Blattlagerfläche (optional):", rotor_layout)
 
         # Holms DXF (optional)
         self.input_dxf_holms = QLineEdit()
         self.input_dxf_holms.setPlaceholderText("Optional: DXF-Datei mit Holmen (Rotorblatt-Auflagepunkten)...")
-        btn_browse_holms = QPushButton("Durchsuchen...")
-        btn_browse_holms.clicked.connect(lambda: self._browse_dxf(self.input_dxf_holms, "Holme"))
+        self.btn_browse_holms = QPushButton(_BROWSE_TEXT)
 
         holms_layout = QHBoxLayout()
         holms_layout.addWidget(self.input_dxf_holms)
-        holms_layout.addWidget(btn_browse_holms)
+        holms_layout.addWidget(self.btn_browse_holms)
         form_dxf.addRow("Holme (optional):", holms_layout)
 
         # Road access DXF (optional)
         self.input_dxf_road = QLineEdit()
         self.input_dxf_road.setPlaceholderText("Optional: DXF-Datei mit Zufahrtsstraßen-Umriss...")
-        btn_browse_road = QPushButton("Durchsuchen...")
-        btn_browse_road.clicked.connect(lambda: self._browse_dxf(self.input_dxf_road, "Zufahrtsstraße"))
+        self.btn_browse_road = QPushButton(_BROWSE_TEXT)
 
         road_layout = QHBoxLayout()
         road_layout.addWidget(self.input_dxf_road)
-        road_layout.addWidget(btn_browse_road)
+        road_layout.addWidget(self.btn_browse_road)
         form_dxf.addRow("Zufahrtsstraße (optional):", road_layout)
 
         # DXF tolerance
-        self.input_dxf_tolerance = QDoubleSpinBox()
-        self.input_dxf_tolerance.setRange(0.001, 10.0)
-        self.input_dxf_tolerance.setValue(0.01)
-        self.input_dxf_tolerance.setDecimals(3)
-        self.input_dxf_tolerance.setSuffix(" m")
-        self.input_dxf_tolerance.setToolTip("Toleranz für Punktverbindungen beim DXF-Import")
+        self.input_dxf_tolerance = self._make_spin('dxf_tolerance')
         form_dxf.addRow("Punkt-Toleranz:", self.input_dxf_tolerance)
 
         group_dxf.setLayout(form_dxf)
@@ -222,34 +313,19 @@ class MainDialog(QDialog):
         form_foundation = QFormLayout()
 
         # FOK (Fundamentoberkante)
-        self.input_fok = QDoubleSpinBox()
-        self.input_fok.setRange(0, 9999)
-        self.input_fok.setValue(305.50)
-        self.input_fok.setDecimals(2)
-        self.input_fok.setSuffix(" m ü.NN")
-        self.input_fok.setToolTip("Behördlich vorgegebene Fundamentoberkante")
+        self.input_fok = self._make_spin('fok')
         form_foundation.addRow("Fundamentoberkante (FOK):", self.input_fok)
 
         fok_info = QLabel("<i>Behördlich vorgegebene Höhe</i>")
-        fok_info.setStyleSheet("color: gray; font-size: 10px;")
+        fok_info.setStyleSheet(_HINT_STYLE)
         form_foundation.addRow("", fok_info)
 
         # Foundation depth
-        self.input_foundation_depth = QDoubleSpinBox()
-        self.input_foundation_depth.setRange(0.5, 10.0)
-        self.input_foundation_depth.setValue(3.5)
-        self.input_foundation_depth.setDecimals(2)
-        self.input_foundation_depth.setSuffix(" m")
-        self.input_foundation_depth.setToolTip("Tiefe unter FOK bis Fundamentsohle")
+        self.input_foundation_depth = self._make_spin('foundation_depth')
         form_foundation.addRow("Fundamenttiefe:", self.input_foundation_depth)
 
         # Foundation diameter (optional)
-        self.input_foundation_diameter = QDoubleSpinBox()
-        self.input_foundation_diameter.setRange(0, 50.0)
-        self.input_foundation_diameter.setValue(20.0)
-        self.input_foundation_diameter.setDecimals(1)
-        self.input_foundation_diameter.setSuffix(" m")
-        self.input_foundation_diameter.setToolTip("Optional: Durchmesser falls nicht aus DXF ersichtlich")
+        self.input_foundation_diameter = self._make_spin('foundation_diameter')
         form_foundation.addRow("Fundamentdurchmesser:", self.input_foundation_diameter)
 
         group_foundation.setLayout(form_foundation)
@@ -260,23 +336,11 @@ class MainDialog(QDialog):
         form_crane = QFormLayout()
 
         # Search range below FOK
-        self.input_search_below_fok = QDoubleSpinBox()
-        self.input_search_below_fok.setRange(0, 5.0)
-        self.input_search_below_fok.setValue(0.5)
-        self.input_search_below_fok.setDecimals(2)
-        self.input_search_below_fok.setSuffix(" m")
-        self.input_search_below_fok.setToolTip("Minimaler Abstand unter FOK für Optimierungssuche")
-        self.input_search_below_fok.valueChanged.connect(self._update_search_range_display)
+        self.input_search_below_fok = self._make_spin('search_below_fok')
         form_crane.addRow("Suchbereich unter FOK:", self.input_search_below_fok)
 
         # Search range above FOK
-        self.input_search_above_fok = QDoubleSpinBox()
-        self.input_search_above_fok.setRange(0, 5.0)
-        self.input_search_above_fok.setValue(0.5)
-        self.input_search_above_fok.setDecimals(2)
-        self.input_search_above_fok.setSuffix(" m")
-        self.input_search_above_fok.setToolTip("Maximaler Abstand über FOK für Optimierungssuche")
-        self.input_search_above_fok.valueChanged.connect(self._update_search_range_display)
+        self.input_search_above_fok = self._make_spin('search_above_fok')
         form_crane.addRow("Suchbereich über FOK:", self.input_search_above_fok)
 
         # Display calculated search range
@@ -285,16 +349,11 @@ class MainDialog(QDialog):
         form_crane.addRow("→ Suchbereich:", self.label_search_range)
 
         # Gravel thickness
-        self.input_gravel_thickness = QDoubleSpinBox()
-        self.input_gravel_thickness.setRange(0, 2.0)
-        self.input_gravel_thickness.setValue(0.5)
-        self.input_gravel_thickness.setDecimals(2)
-        self.input_gravel_thickness.setSuffix(" m")
-        self.input_gravel_thickness.setToolTip("Dicke der Schotterschicht auf Kranstellfläche")
+        self.input_gravel_thickness = self._make_spin('gravel_thickness')
         form_crane.addRow("Schotterschichtdicke:", self.input_gravel_thickness)
 
         gravel_info = QLabel("<i>Wird von Kranstellfläche abgezogen</i>")
-        gravel_info.setStyleSheet("color: gray; font-size: 10px;")
+        gravel_info.setStyleSheet(_HINT_STYLE)
         form_crane.addRow("", gravel_info)
 
         group_crane.setLayout(form_crane)
@@ -305,12 +364,7 @@ class MainDialog(QDialog):
         form_boom = QFormLayout()
 
         # Longitudinal slope
-        self.input_boom_slope = QDoubleSpinBox()
-        self.input_boom_slope.setRange(2.0, 8.0)
-        self.input_boom_slope.setValue(5.0)
-        self.input_boom_slope.setDecimals(1)
-        self.input_boom_slope.setSuffix(" %")
-        self.input_boom_slope.setToolTip("Längsneigung der Auslegerfläche (2-8%)")
+        self.input_boom_slope = self._make_spin('boom_slope')
         form_boom.addRow("Längsneigung:", self.input_boom_slope)
 
         # Auto-adjust slope
@@ -329,18 +383,11 @@ class MainDialog(QDialog):
         form_rotor = QFormLayout()
 
         # Height offset from crane pad
-        self.input_rotor_height_offset = QDoubleSpinBox()
-        self.input_rotor_height_offset.setRange(-5.0, 5.0)
-        self.input_rotor_height_offset.setValue(0.0)
-        self.input_rotor_height_offset.setDecimals(2)
-        self.input_rotor_height_offset.setSuffix(" m")
-        self.input_rotor_height_offset.setToolTip(
-            "Höhendifferenz zur Kranstellfläche (positiv = höher, negativ = tiefer)"
-        )
+        self.input_rotor_height_offset = self._make_spin('rotor_height_offset')
         form_rotor.addRow("Höhendifferenz zu Kranstellfläche:", self.input_rotor_height_offset)
 
         rotor_info = QLabel("<i>Positiv = höher, Negativ = tiefer</i>")
-        rotor_info.setStyleSheet("color: gray; font-size: 10px;")
+        rotor_info.setStyleSheet(_HINT_STYLE)
         form_rotor.addRow("", rotor_info)
 
         group_rotor.setLayout(form_rotor)
@@ -351,36 +398,25 @@ class MainDialog(QDialog):
         form_road = QFormLayout()
 
         # Longitudinal slope
-        self.input_road_slope = QDoubleSpinBox()
-        self.input_road_slope.setRange(1.0, 15.0)
-        self.input_road_slope.setValue(8.0)
-        self.input_road_slope.setDecimals(1)
-        self.input_road_slope.setSuffix(" %")
-        self.input_road_slope.setToolTip("Maximale Längsneigung der Zufahrtsstraße (Richtung wird automatisch erkannt)")
+        self.input_road_slope = self._make_spin('road_slope')
         form_road.addRow("Maximale Längsneigung:", self.input_road_slope)
 
         road_slope_info = QLabel("<i>Richtung (ansteigend/abfallend) wird automatisch vom Gelände erkannt</i>")
-        road_slope_info.setStyleSheet("color: gray; font-size: 10px;")
+        road_slope_info.setStyleSheet(_HINT_STYLE)
         form_road.addRow("", road_slope_info)
 
         # Enable gravel
         self.input_road_gravel_enabled = QCheckBox("Zufahrt schottern")
         self.input_road_gravel_enabled.setChecked(True)
         self.input_road_gravel_enabled.setToolTip("Aktivieren um Schotterschicht auf Zufahrt aufzubringen")
-        self.input_road_gravel_enabled.stateChanged.connect(self._toggle_road_gravel)
         form_road.addRow(self.input_road_gravel_enabled)
 
         # Gravel thickness
-        self.input_road_gravel_thickness = QDoubleSpinBox()
-        self.input_road_gravel_thickness.setRange(0.1, 1.0)
-        self.input_road_gravel_thickness.setValue(0.3)
-        self.input_road_gravel_thickness.setDecimals(2)
-        self.input_road_gravel_thickness.setSuffix(" m")
-        self.input_road_gravel_thickness.setToolTip("Dicke der Schotterschicht auf Zufahrtsstraße")
+        self.input_road_gravel_thickness = self._make_spin('road_gravel_thickness')
         form_road.addRow("Schotterdicke Zufahrt:", self.input_road_gravel_thickness)
 
         road_gravel_info = QLabel("<i>Wird von Oberkante Zufahrt abgezogen für Planum</i>")
-        road_gravel_info.setStyleSheet("color: gray; font-size: 10px;")
+        road_gravel_info.setStyleSheet(_HINT_STYLE)
         form_road.addRow("", road_gravel_info)
 
         # Connection info
@@ -411,12 +447,7 @@ class MainDialog(QDialog):
         group_opt = QGroupBox("Optimierungseinstellungen")
         form_opt = QFormLayout()
 
-        self.input_height_step = QDoubleSpinBox()
-        self.input_height_step.setRange(0.01, 1.0)
-        self.input_height_step.setValue(0.1)
-        self.input_height_step.setDecimals(2)
-        self.input_height_step.setSuffix(" m")
-        self.input_height_step.setToolTip("Schrittweite für Höhenoptimierung")
+        self.input_height_step = self._make_spin('height_step')
         form_opt.addRow("Höhen-Schritt:", self.input_height_step)
 
         group_opt.setLayout(form_opt)
@@ -426,12 +457,7 @@ class MainDialog(QDialog):
         group_slope = QGroupBox("Böschung")
         form_slope = QFormLayout()
 
-        self.input_slope_angle = QDoubleSpinBox()
-        self.input_slope_angle.setRange(15.0, 60.0)
-        self.input_slope_angle.setValue(45.0)
-        self.input_slope_angle.setDecimals(1)
-        self.input_slope_angle.setSuffix(" °")
-        self.input_slope_angle.setToolTip("Böschungswinkel (45° = 1:1)")
+        self.input_slope_angle = self._make_spin('slope_angle')
         form_slope.addRow("Böschungswinkel:", self.input_slope_angle)
 
         group_slope.setLayout(form_slope)
@@ -460,7 +486,6 @@ class MainDialog(QDialog):
         form_uncertainty.addRow("Monte Carlo Samples:", self.input_mc_samples)
 
         # Terrain type for DEM uncertainty
-        from qgis.PyQt.QtWidgets import QComboBox
         self.input_terrain_type = QComboBox()
         self.input_terrain_type.addItems([
             "Flach (σ = 7.5 cm)",
@@ -480,26 +505,16 @@ class MainDialog(QDialog):
             "(hoehendaten.de: ±15-30cm bei 95% Konfidenz)</i>"
         )
         dem_info.setWordWrap(True)
-        dem_info.setStyleSheet("color: gray; font-size: 10px;")
+        dem_info.setStyleSheet(_HINT_STYLE)
         form_uncertainty.addRow("", dem_info)
 
         # Foundation depth uncertainty
-        self.input_foundation_depth_std = QDoubleSpinBox()
-        self.input_foundation_depth_std.setRange(0, 0.5)
-        self.input_foundation_depth_std.setValue(0.1)
-        self.input_foundation_depth_std.setDecimals(2)
-        self.input_foundation_depth_std.setSuffix(" m (σ)")
-        self.input_foundation_depth_std.setToolTip("Standardabweichung der Fundamenttiefe")
+        self.input_foundation_depth_std = self._make_spin('foundation_depth_std')
         self.input_foundation_depth_std.setEnabled(False)
         form_uncertainty.addRow("Fundamenttiefe-Unsicherheit:", self.input_foundation_depth_std)
 
         # Slope angle uncertainty
-        self.input_slope_angle_std = QDoubleSpinBox()
-        self.input_slope_angle_std.setRange(0, 10.0)
-        self.input_slope_angle_std.setValue(3.0)
-        self.input_slope_angle_std.setDecimals(1)
-        self.input_slope_angle_std.setSuffix(" ° (σ)")
-        self.input_slope_angle_std.setToolTip("Standardabweichung des Böschungswinkels")
+        self.input_slope_angle_std = self._make_spin('slope_angle_std')
         self.input_slope_angle_std.setEnabled(False)
         form_uncertainty.addRow("Böschungswinkel-Unsicherheit:", self.input_slope_angle_std)
 
@@ -540,17 +555,10 @@ class MainDialog(QDialog):
             "Hauptachse (längste Kante) der Kranfläche ausgerichtet.</i>"
         )
         info_bbox.setWordWrap(True)
-        info_bbox.setStyleSheet("color: gray; font-size: 10px;")
+        info_bbox.setStyleSheet(_HINT_STYLE)
         form_bbox.addRow("", info_bbox)
 
-        self.input_bbox_buffer = QDoubleSpinBox()
-        self.input_bbox_buffer.setRange(0.0, 50.0)
-        self.input_bbox_buffer.setValue(10.0)
-        self.input_bbox_buffer.setDecimals(1)
-        self.input_bbox_buffer.setSuffix(" %")
-        self.input_bbox_buffer.setToolTip(
-            "Zusätzlicher Puffer um alle Flächen herum als Prozent der Bauplatzgröße"
-        )
+        self.input_bbox_buffer = self._make_spin('bbox_buffer')
         form_bbox.addRow("Buffer-Zone:", self.input_bbox_buffer)
 
         group_bbox.setLayout(form_bbox)
@@ -564,11 +572,8 @@ class MainDialog(QDialog):
         self.input_generate_cross_profiles.setChecked(True)
         form_cross.addRow(self.input_generate_cross_profiles)
 
-        self.input_cross_profile_spacing = QDoubleSpinBox()
-        self.input_cross_profile_spacing.setRange(1.0, 50.0)
-        self.input_cross_profile_spacing.setValue(10.0)
-        self.input_cross_profile_spacing.setDecimals(1)
-        self.input_cross_profile_spacing.setSuffix(" m")
+        self.input_cross_profile_spacing = self._make_spin('cross_profile_spacing')
+        self.input_generate_cross_profiles.toggled.connect(self.input_cross_profile_spacing.setEnabled)
         form_cross.addRow("Schnitt-Abstand:", self.input_cross_profile_spacing)
 
         group_cross.setLayout(form_cross)
@@ -582,11 +587,8 @@ class MainDialog(QDialog):
         self.input_generate_long_profiles.setChecked(True)
         form_long.addRow(self.input_generate_long_profiles)
 
-        self.input_long_profile_spacing = QDoubleSpinBox()
-        self.input_long_profile_spacing.setRange(1.0, 50.0)
-        self.input_long_profile_spacing.setValue(10.0)
-        self.input_long_profile_spacing.setDecimals(1)
-        self.input_long_profile_spacing.setSuffix(" m")
+        self.input_long_profile_spacing = self._make_spin('long_profile_spacing')
+        self.input_generate_long_profiles.toggled.connect(self.input_long_profile_spacing.setEnabled)
         form_long.addRow("Schnitt-Abstand:", self.input_long_profile_spacing)
 
         group_long.setLayout(form_long)
@@ -596,11 +598,7 @@ class MainDialog(QDialog):
         group_viz = QGroupBox("Visualisierung")
         form_viz = QFormLayout()
 
-        self.input_vertical_exaggeration = QDoubleSpinBox()
-        self.input_vertical_exaggeration.setRange(1.0, 10.0)
-        self.input_vertical_exaggeration.setValue(2.0)
-        self.input_vertical_exaggeration.setDecimals(1)
-        self.input_vertical_exaggeration.setSuffix(" x")
+        self.input_vertical_exaggeration = self._make_spin('vertical_exaggeration')
         form_viz.addRow("Vert. Überhöhung:", self.input_vertical_exaggeration)
 
         group_viz.setLayout(form_viz)
@@ -643,49 +641,25 @@ class MainDialog(QDialog):
         form_soil.addRow("Bodenart:", self.input_soil_type)
 
         # Ev2-Bestand
-        self.input_ev2_bestand = QDoubleSpinBox()
-        self.input_ev2_bestand.setRange(0, 200)
-        self.input_ev2_bestand.setValue(45.0)
-        self.input_ev2_bestand.setDecimals(1)
-        self.input_ev2_bestand.setSuffix(" MN/m²")
-        self.input_ev2_bestand.setToolTip(
-            "Verformungsmodul des anstehenden Bodens (Plattendruckversuch DIN 18134)\n"
-            "Typische Bereiche werden basierend auf gewählter Bodenart angezeigt"
-        )
+        self.input_ev2_bestand = self._make_spin('ev2_bestand')
 
         form_soil.addRow("Ev2 Bestand:", self.input_ev2_bestand)
 
         # Info-Label für typische Ev2-Bereiche (wird dynamisch aktualisiert)
         self.label_ev2_range = QLabel("<i>Typisch für Schluff (weich): 20-35 MN/m²</i>")
         self.label_ev2_range.setWordWrap(True)
-        self.label_ev2_range.setStyleSheet("QLabel { color: #666; font-size: 10pt; }")
+        self.label_ev2_range.setStyleSheet(_NOTE_STYLE)
         form_soil.addRow("", self.label_ev2_range)
 
         # Wassergehalt (optional)
-        self.input_water_content = QDoubleSpinBox()
-        self.input_water_content.setRange(0, 50)
-        self.input_water_content.setValue(0)
-        self.input_water_content.setDecimals(1)
-        self.input_water_content.setSuffix(" %")
+        self.input_water_content = self._make_spin('water_content')
         self.input_water_content.setSpecialValueText("Unbekannt")
-        self.input_water_content.setToolTip(
-            "Aktueller Wassergehalt (optional, für genauere Kalkdosierung)"
-        )
 
         form_soil.addRow("Wassergehalt:", self.input_water_content)
 
         # Optimaler Wassergehalt (optional)
-        self.input_optimum_water = QDoubleSpinBox()
-        self.input_optimum_water.setRange(0, 50)
-        self.input_optimum_water.setValue(18.0)  # Default für Schluff
-        self.input_optimum_water.setDecimals(1)
-        self.input_optimum_water.setSuffix(" %")
+        self.input_optimum_water = self._make_spin('optimum_water')
         self.input_optimum_water.setSpecialValueText("Unbekannt")
-        self.input_optimum_water.setToolTip(
-            "Optimaler Wassergehalt nach Proctor (DIN 18127)\n"
-            "Wird automatisch für gewählte Bodenart vorgeschlagen\n"
-            "Kann manuell überschrieben werden"
-        )
 
         form_soil.addRow("Optimum Wassergehalt:", self.input_optimum_water)
 
@@ -731,7 +705,7 @@ class MainDialog(QDialog):
             "Koordinaten der Kranstellfläche aus DXF-Datei.</i>"
         )
         bgr_info.setWordWrap(True)
-        bgr_info.setStyleSheet("QLabel { color: #666; font-size: 10pt; }")
+        bgr_info.setStyleSheet(_NOTE_STYLE)
 
         self.btn_bgr_query = QPushButton("Bodendaten von BGR abrufen")
         self.btn_bgr_query.setEnabled(True)
@@ -744,7 +718,7 @@ class MainDialog(QDialog):
         # Status-Label für BGR-Abfrage
         self.label_bgr_status = QLabel("")
         self.label_bgr_status.setWordWrap(True)
-        self.label_bgr_status.setStyleSheet("QLabel { color: #666; font-size: 10pt; }")
+        self.label_bgr_status.setStyleSheet(_NOTE_STYLE)
 
         form_bgr.addRow(bgr_info)
         form_bgr.addRow("", self.btn_bgr_query)
@@ -775,7 +749,7 @@ class MainDialog(QDialog):
         self.input_workspace = QLineEdit()
         self.input_workspace.setPlaceholderText("Ordner für alle Ausgabedateien...")
 
-        btn_browse_workspace = QPushButton("Durchsuchen...")
+        btn_browse_workspace = QPushButton(_BROWSE_TEXT)
         btn_browse_workspace.clicked.connect(self._browse_workspace)
 
         workspace_layout = QHBoxLayout()
@@ -784,12 +758,8 @@ class MainDialog(QDialog):
 
         form_workspace.addRow("Workspace-Ordner:", workspace_layout)
 
-        info_label = QLabel(
-            "<i>Struktur wird automatisch erstellt:</i><br>"
-            "• ergebnisse/ - GeoPackage & HTML-Bericht<br>"
-            "• gelaendeschnitte/ - PNG-Bilder<br>"
-            "• cache/ - DEM-Kacheln"
-        )
+        info_label = QLabel(_WORKSPACE_INFO_TEXT)
+        info_label.setTextFormat(Qt.PlainText)  # no rich-text parsing on relayout
         info_label.setWordWrap(True)
         form_workspace.addRow("", info_label)
 
@@ -850,7 +820,7 @@ class MainDialog(QDialog):
             "<i>Wählen Sie die Standorte aus, die in den Vergleichsbericht aufgenommen werden sollen.</i>"
         )
         sites_info.setWordWrap(True)
-        sites_info.setStyleSheet("color: gray; font-size: 10px;")
+        sites_info.setStyleSheet(_HINT_STYLE)
         sites_layout.addWidget(sites_info)
 
         # Create scrollable container for site checkboxes
@@ -899,30 +869,15 @@ class MainDialog(QDialog):
         form_costs = QFormLayout()
 
         # Cost per m³ for cut
-        self.input_cost_cut = QDoubleSpinBox()
-        self.input_cost_cut.setRange(0, 100)
-        self.input_cost_cut.setValue(8.0)
-        self.input_cost_cut.setDecimals(2)
-        self.input_cost_cut.setSuffix(" €/m³")
-        self.input_cost_cut.setToolTip("Kosten pro Kubikmeter Abtrag")
+        self.input_cost_cut = self._make_spin('cost_cut')
         form_costs.addRow("Abtrag-Kosten:", self.input_cost_cut)
 
         # Cost per m³ for fill
-        self.input_cost_fill = QDoubleSpinBox()
-        self.input_cost_fill.setRange(0, 100)
-        self.input_cost_fill.setValue(12.0)
-        self.input_cost_fill.setDecimals(2)
-        self.input_cost_fill.setSuffix(" €/m³")
-        self.input_cost_fill.setToolTip("Kosten pro Kubikmeter Auftrag")
+        self.input_cost_fill = self._make_spin('cost_fill')
         form_costs.addRow("Auftrag-Kosten:", self.input_cost_fill)
 
         # Cost per m³ for gravel
-        self.input_cost_gravel = QDoubleSpinBox()
-        self.input_cost_gravel.setRange(0, 200)
-        self.input_cost_gravel.setValue(45.0)
-        self.input_cost_gravel.setDecimals(2)
-        self.input_cost_gravel.setSuffix(" €/m³")
-        self.input_cost_gravel.setToolTip("Kosten pro Kubikmeter Schotter")
+        self.input_cost_gravel = self._make_spin('cost_gravel')
         form_costs.addRow("Schotter-Kosten:", self.input_cost_gravel)
 
         group_costs.setLayout(form_costs)
@@ -936,11 +891,10 @@ class MainDialog(QDialog):
             "<i>Wählen Sie das gewünschte Export-Format für den Vergleichsbericht.</i>"
         )
         export_info.setWordWrap(True)
-        export_info.setStyleSheet("color: gray; font-size: 10px;")
+        export_info.setStyleSheet(_HINT_STYLE)
         form_export.addRow("", export_info)
 
         # Format selection
-        from qgis.PyQt.QtWidgets import QComboBox
         self.input_multisite_report_format = QComboBox()
         self.input_multisite_report_format.addItems([
             "HTML (Webseite)",
@@ -962,7 +916,7 @@ class MainDialog(QDialog):
         self.input_multisite_report_output.setReadOnly(True)
         self.input_multisite_report_output.setToolTip("Ausgabepfad für den Bericht (wird automatisch basierend auf Workspace erstellt)")
 
-        btn_browse_multisite_output = QPushButton("Durchsuchen...")
+        btn_browse_multisite_output = QPushButton(_BROWSE_TEXT)
         btn_browse_multisite_output.clicked.connect(self._browse_multisite_report_output)
 
         output_layout = QHBoxLayout()
@@ -976,7 +930,7 @@ class MainDialog(QDialog):
             "Generiert einen Vergleichsbericht für alle ausgewählten Standorte"
         )
         self.btn_generate_multisite_report.setEnabled(False)  # Disabled until sites are selected
-        # Signal connection will be added in subtask-4-4
+        self.btn_generate_multisite_report.clicked.connect(self._on_generate_multisite_report)
 
         generate_layout = QHBoxLayout()
         generate_layout.addStretch()
@@ -992,6 +946,55 @@ class MainDialog(QDialog):
         scroll.setWidget(widget)
         return scroll
 
+    def _make_spin(self, name: str) -> QDoubleSpinBox:
+        """Create the QDoubleSpinBox described by _SPINBOX_SPECS[name]."""
+        spec = _SPINBOX_SPECS[name]
+        spin = QDoubleSpinBox()
+        spin.setDecimals(spec.decimals)
+        spin.setRange(spec.minimum, spec.maximum)
+        spin.setValue(spec.default)
+        spin.setSuffix(spec.suffix)
+        if spec.tooltip:
+            spin.setToolTip(spec.tooltip)
+        if spec.param:
+            self._spin_state[spec.param] = spin.value()
+            spin.valueChanged.connect(partial(self._spin_state.__setitem__, spec.param))
+        return spin
+
+    def _spinbox_params(self) -> dict:
+        """Current values of all spin boxes that map to a processing parameter."""
+        return dict(self._spin_state)
+
+    def _ensure_tab_built(self, index):
+        """Replace the placeholder of a tab with its real content on first use."""
+        if index in self._tab_built or index not in self._tab_builders:
+            return
+        self._tab_built.add(index)
+
+        attr_name, builder, title = self._tab_builders[index]
+        tab = builder()
+        setattr(self, attr_name, tab)
+
+        # The dialog is visible here: suppress repaints so the remove/insert
+        # pair is painted once instead of flashing the neighbouring tab
+        current = self.tabs.currentIndex()
+        self.tabs.setUpdatesEnabled(False)
+        self.tabs.blockSignals(True)
+        try:
+            placeholder = self.tabs.widget(index)
+            self.tabs.removeTab(index)
+            placeholder.deleteLater()
+            self.tabs.insertTab(index, tab, title)
+            self.tabs.setCurrentIndex(current)
+        finally:
+            self.tabs.blockSignals(False)
+            self.tabs.setUpdatesEnabled(True)
+
+    def _ensure_all_tabs_built(self):
+        """Build all remaining tabs (needed before reading their widgets)."""
+        for index in sorted(self._tab_builders):
+            self._ensure_tab_built(index)
+
     def _on_tab_changed(self, index):
         """Handle tab change - show/hide appropriate buttons."""
         # Last tab (index 3) shows "Start" button, others show "Next" button
@@ -1013,17 +1016,30 @@ class MainDialog(QDialog):
             self.tabs.setCurrentIndex(current + 1)
 
     def _connect_signals(self):
-        """Connect button signals."""
-        self.btn_start.clicked.connect(self._on_start)
-        self.btn_next.clicked.connect(self._on_next)
-        self.btn_cancel.clicked.connect(self.reject)
-        self.tabs.currentChanged.connect(self._on_tab_changed)
-        self.btn_generate_multisite_report.clicked.connect(self._on_generate_multisite_report)
+        """
+        Connect the signals of the dialog buttons and the input tab.
 
-    def _setup_validators(self):
-        """Setup value validators and constraints."""
-        # Connect FOK change to update search range display
-        self.input_fok.valueChanged.connect(self._update_search_range_display)
+        Lazily built tabs connect their own widgets in their builder.
+        """
+        self._signal_table = [
+            (self.btn_start.clicked, self._on_start),
+            (self.btn_next.clicked, self._on_next),
+            (self.btn_cancel.clicked, self.reject),
+            (self.tabs.currentChanged, self._ensure_tab_built),
+            (self.tabs.currentChanged, self._on_tab_changed),
+            (self.btn_browse_crane.clicked, lambda: self._browse_dxf(self.input_dxf_crane, "Kranstellfläche")),
+            (self.btn_browse_foundation.clicked, lambda: self._browse_dxf(self.input_dxf_foundation, "Fundamentfläche")),
+            (self.btn_browse_boom.clicked, lambda: self._browse_dxf(self.input_dxf_boom, "Auslegerfläche")),
+            (self.btn_browse_rotor.clicked, lambda: self._browse_dxf(self.input_dxf_rotor, "Blattlagerfläche")),
+            (self.btn_browse_holms.clicked, lambda: self._browse_dxf(self.input_dxf_holms, "Holme")),
+            (self.btn_browse_road.clicked, lambda: self._browse_dxf(self.input_dxf_road, "Zufahrtsstraße")),
+            (self.input_fok.valueChanged, self._update_search_range_display),
+            (self.input_search_below_fok.valueChanged, self._update_search_range_display),
+            (self.input_search_above_fok.valueChanged, self._update_search_range_display),
+            (self.input_road_gravel_enabled.stateChanged, self._toggle_road_gravel),
+        ]
+        for signal, slot in self._signal_table:
+            signal.connect(slot)
 
     def _show_validation_error(self, title: str, error: str):
         """
@@ -1130,13 +1146,13 @@ class MainDialog(QDialog):
 
     def _browse_dxf(self, line_edit: QLineEdit, surface_name: str):
         """Browse for DXF file with validation."""
-        filename, _ = QFileDialog.getOpenFileName(
-            self,
-            f"DXF-Datei für {surface_name} auswählen",
-            "",
-            "DXF-Dateien (*.dxf)"
-        )
-        if filename:
+        if self._dxf_dialog is None:
+            self._dxf_dialog = QFileDialog(self)
+            self._dxf_dialog.setNameFilter("DXF-Dateien (*.dxf)")
+            self._dxf_dialog.setFileMode(QFileDialog.ExistingFile)
+        self._dxf_dialog.setWindowTitle(f"DXF-Datei für {surface_name} auswählen")
+        if self._dxf_dialog.exec_():
+            filename = self._dxf_dialog.selectedFiles()[0]
             # Validate the selected DXF file
             if self._validate_dxf_file(filename, surface_name):
                 line_edit.setText(filename)
@@ -1144,16 +1160,16 @@ class MainDialog(QDialog):
 
     def _browse_workspace(self):
         """Browse for workspace directory."""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Workspace-Ordner auswählen",
-            ""
-        )
-        if directory:
-            self.input_workspace.setText(directory)
+        if self._ws_dialog is None:
+            self._ws_dialog = QFileDialog(self, "Workspace-Ordner auswählen")
+            self._ws_dialog.setFileMode(QFileDialog.Directory)
+            self._ws_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        if self._ws_dialog.exec_():
+            self.input_workspace.setText(self._ws_dialog.selectedFiles()[0])
 
     def _browse_multisite_report_output(self):
         """Browse for multi-site report output file."""
+        self._ensure_all_tabs_built()
         # Get current format selection to determine file extension
         format_index = self.input_multisite_report_format.currentIndex()
         file_filter = ""
@@ -1215,6 +1231,7 @@ class MainDialog(QDialog):
         Returns:
             bool: True if all validations pass, False otherwise
         """
+        state = self._spin_state
         lang = get_language()
 
         # === PHASE 1: Basic input validation ===
@@ -1342,10 +1359,10 @@ class MainDialog(QDialog):
         try:
             self.logger.info("Validating height parameters...")
 
-            fok = self.input_fok.value()
-            search_below = self.input_search_below_fok.value()
-            search_above = self.input_search_above_fok.value()
-            height_step = self.input_height_step.value()
+            fok = state['fok']
+            search_below = state['search_range_below_fok']
+            search_above = state['search_range_above_fok']
+            height_step = state['height_step']
 
             min_height = fok - search_below
             max_height = fok + search_above
@@ -1439,7 +1456,7 @@ class MainDialog(QDialog):
             )
             return
 
-        if not os.path.exists(dxf_path):
+        if not os.path.isfile(dxf_path):
             QMessageBox.warning(
                 self,
                 "DXF-Datei nicht gefunden",
@@ -1454,7 +1471,6 @@ class MainDialog(QDialog):
 
         try:
             # Importiere DXF und hole Koordinaten
-            from ..core.dxf_importer import DXFImporter
             from ..core.soil_stabilization_calculator import SoilStabilizationCalculator
             from ..utils.geometry_utils import get_centroid
 
@@ -1515,7 +1531,7 @@ class MainDialog(QDialog):
                 self.label_bgr_status.setText(
                     f"<i>✗ Fehler: {error}</i>"
                 )
-                self.label_bgr_status.setStyleSheet("QLabel { color: #cc0000; }")
+                self.label_bgr_status.setStyleSheet(_ERROR_STYLE)
 
                 QMessageBox.warning(
                     self,
@@ -1533,7 +1549,7 @@ class MainDialog(QDialog):
             self.label_bgr_status.setText(
                 f"<i>✗ Fehler: {str(e)}</i>"
             )
-            self.label_bgr_status.setStyleSheet("QLabel { color: #cc0000; }")
+            self.label_bgr_status.setStyleSheet(_ERROR_STYLE)
 
             QMessageBox.critical(
                 self,
@@ -1603,8 +1619,53 @@ class MainDialog(QDialog):
                 )
 
     def _validate_inputs(self):
-        """Validate user inputs with enhanced bilingual validation."""
-        errors = []
+        """
+        Validate user inputs with enhanced bilingual validation.
+
+        Stops at the first invalid input and shows it inline in the status
+        area instead of a modal message box.
+        """
+        error = next(self._iter_input_errors(), None)
+        if error is None:
+            return True
+
+        lang = get_language()
+        title = "Invalid input" if lang == 'en' else "Ungültige Eingabe"
+        self.status_text.setStyleSheet("color: red;")
+        self.status_text.setPlainText(f"{title}: {error}")
+        self.status_text.setVisible(True)
+        return False
+
+    def _check_dxf_path(self, path: str):
+        """
+        Check that a DXF path is an existing .dxf file.
+
+        Files that passed once are remembered by path, modification time
+        and size, so repeated start clicks need a single stat() instead of
+        the full check, while a deleted, moved or replaced file is checked
+        again.
+
+        Returns:
+            Error message, or None if the path is valid
+        """
+        try:
+            st = os.stat(path)
+            key = (path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        if key is not None and key in self._validated_dxf_paths:
+            return None
+        try:
+            validate_file_exists(path, extension='.dxf')
+        except ValidationError as e:
+            return str(e)
+        if key is not None:
+            self._validated_dxf_paths.add(key)
+        return None
+
+    def _iter_input_errors(self):
+        """Lazily yield a bilingual message for each invalid user input."""
+        state = self._spin_state
         lang = get_language()
 
         # Check required DXF files (Kranstellfläche and Fundament)
@@ -1617,14 +1678,13 @@ class MainDialog(QDialog):
             path = line_edit.text().strip()
             if not path:
                 if lang == 'en':
-                    errors.append(f"Please select DXF file for {display_name}")
+                    yield f"Please select DXF file for {display_name}"
                 else:
-                    errors.append(f"Bitte DXF-Datei für {display_name} auswählen")
+                    yield f"Bitte DXF-Datei für {display_name} auswählen"
             else:
-                try:
-                    validate_file_exists(path, extension='.dxf')
-                except ValidationError as e:
-                    errors.append(f"{display_name}: {str(e)}")
+                error = self._check_dxf_path(path)
+                if error:
+                    yield f"{display_name}: {error}"
 
         # Check optional DXF files (only validate if provided)
         optional_dxf_inputs = [
@@ -1637,93 +1697,81 @@ class MainDialog(QDialog):
         for de_name, line_edit, display_name in optional_dxf_inputs:
             path = line_edit.text().strip()
             if path:
-                try:
-                    validate_file_exists(path, extension='.dxf')
-                except ValidationError as e:
-                    errors.append(f"{display_name}: {str(e)}")
+                error = self._check_dxf_path(path)
+                if error:
+                    yield f"{display_name}: {error}"
 
         # Check workspace
         workspace = self.input_workspace.text().strip()
         if not workspace:
             if lang == 'en':
-                errors.append("Please select workspace folder")
+                yield "Please select workspace folder"
             else:
-                errors.append("Bitte Workspace-Ordner auswählen")
+                yield "Bitte Workspace-Ordner auswählen"
         else:
             # Create workspace if it doesn't exist (this is okay)
             workspace_path = Path(workspace)
             if workspace_path.exists() and not workspace_path.is_dir():
                 if lang == 'en':
-                    errors.append(f"Workspace path exists but is not a directory: {workspace}")
+                    yield f"Workspace path exists but is not a directory: {workspace}"
                 else:
-                    errors.append(f"Workspace-Pfad existiert, ist aber kein Ordner: {workspace}")
+                    yield f"Workspace-Pfad existiert, ist aber kein Ordner: {workspace}"
 
         # Check FOK is reasonable
-        fok = self.input_fok.value()
+        fok = state['fok']
         if fok < 0 or fok > 9999:
             if lang == 'en':
-                errors.append(f"Foundation elevation (FOK) {fok} m seems unrealistic")
+                yield f"Foundation elevation (FOK) {fok} m seems unrealistic"
             else:
-                errors.append(f"FOK {fok} m ü.NN scheint unrealistisch")
+                yield f"FOK {fok} m ü.NN scheint unrealistisch"
 
         # Check search ranges are positive
-        if self.input_search_below_fok.value() < 0:
+        if state['search_range_below_fok'] < 0:
             if lang == 'en':
-                errors.append("Search range below FOK must be positive")
+                yield "Search range below FOK must be positive"
             else:
-                errors.append("Suchbereich unter FOK muss positiv sein")
-        if self.input_search_above_fok.value() < 0:
+                yield "Suchbereich unter FOK muss positiv sein"
+        if state['search_range_above_fok'] < 0:
             if lang == 'en':
-                errors.append("Search range above FOK must be positive")
+                yield "Search range above FOK must be positive"
             else:
-                errors.append("Suchbereich über FOK muss positiv sein")
+                yield "Suchbereich über FOK muss positiv sein"
 
         # Check search range is reasonable
-        total_range = self.input_search_below_fok.value() + self.input_search_above_fok.value()
+        total_range = state['search_range_below_fok'] + state['search_range_above_fok']
         if total_range > 10.0:
             if lang == 'en':
-                errors.append(f"Total search range {total_range:.1f} m is very large. Consider reducing it.")
+                yield f"Total search range {total_range:.1f} m is very large. Consider reducing it."
             else:
-                errors.append(f"Gesamter Suchbereich {total_range:.1f} m ist sehr groß. Erwägen Sie eine Reduzierung.")
+                yield f"Gesamter Suchbereich {total_range:.1f} m ist sehr groß. Erwägen Sie eine Reduzierung."
 
         # Check boom slope is in range
-        boom_slope = self.input_boom_slope.value()
+        boom_slope = state['boom_slope']
         if boom_slope < 2.0 or boom_slope > 8.0:
             if lang == 'en':
-                errors.append(f"Boom surface slope {boom_slope}% outside valid range [2%, 8%]")
+                yield f"Boom surface slope {boom_slope}% outside valid range [2%, 8%]"
             else:
-                errors.append(f"Auslegerflächen-Neigung {boom_slope}% außerhalb zulässigem Bereich [2%, 8%]")
+                yield f"Auslegerflächen-Neigung {boom_slope}% außerhalb zulässigem Bereich [2%, 8%]"
 
         # Check height step is reasonable
-        height_step = self.input_height_step.value()
+        height_step = state['height_step']
         if height_step < 0.01:
             if lang == 'en':
-                errors.append(f"Height step {height_step} m is too small (minimum 0.01 m)")
+                yield f"Height step {height_step} m is too small (minimum 0.01 m)"
             else:
-                errors.append(f"Höhenschritt {height_step} m ist zu klein (minimum 0.01 m)")
+                yield f"Höhenschritt {height_step} m ist zu klein (minimum 0.01 m)"
 
         # Check slope angle is reasonable
-        slope_angle = self.input_slope_angle.value()
+        slope_angle = state['slope_angle']
         if slope_angle < 15.0 or slope_angle > 60.0:
             if lang == 'en':
-                errors.append(f"Slope angle {slope_angle}° outside valid range [15°, 60°]")
+                yield f"Slope angle {slope_angle}° outside valid range [15°, 60°]"
             else:
-                errors.append(f"Böschungswinkel {slope_angle}° außerhalb zulässigem Bereich [15°, 60°]")
-
-        if errors:
-            title = "Invalid Inputs" if lang == 'en' else "Ungültige Eingaben"
-            error_message = "\n\n".join(errors)
-            QMessageBox.warning(
-                self,
-                title,
-                error_message
-            )
-            return False
-
-        return True
+                yield f"Böschungswinkel {slope_angle}° außerhalb zulässigem Bereich [15°, 60°]"
 
     def _on_start(self):
         """Handle start button click with comprehensive pre-flight validation."""
+        self._ensure_all_tabs_built()
         # Run comprehensive pre-flight validation BEFORE processing starts
         # This validates: DXF files, CRS consistency, height parameters, network connectivity
         if not self._run_preflight_validation():
@@ -1736,45 +1784,20 @@ class MainDialog(QDialog):
             'dxf_foundation': self.input_dxf_foundation.text().strip(),
             'dxf_boom': self.input_dxf_boom.text().strip() if self.input_dxf_boom.text().strip() else None,
             'dxf_rotor': self.input_dxf_rotor.text().strip() if self.input_dxf_rotor.text().strip() else None,
-            'dxf_tolerance': self.input_dxf_tolerance.value(),
 
             # Holms DXF (optional)
             'holm_dxf_path': self.input_dxf_holms.text().strip() if self.input_dxf_holms.text().strip() else None,
 
-            # Foundation parameters
-            'fok': self.input_fok.value(),
-            'foundation_depth': self.input_foundation_depth.value(),
-            'foundation_diameter': self.input_foundation_diameter.value(),
-
-            # Crane pad parameters
-            'search_range_below_fok': self.input_search_below_fok.value(),
-            'search_range_above_fok': self.input_search_above_fok.value(),
-            'gravel_thickness': self.input_gravel_thickness.value(),
-
             # Boom surface parameters
-            'boom_slope': self.input_boom_slope.value(),
             'boom_auto_slope': self.input_boom_auto_slope.isChecked(),
 
-            # Rotor storage parameters
-            'rotor_height_offset': self.input_rotor_height_offset.value(),
-
             # Road access parameters
             'dxf_road': self.input_dxf_road.text().strip() if self.input_dxf_road.text().strip() else None,
-            'road_slope_percent': self.input_road_slope.value(),
             'road_gravel_enabled': self.input_road_gravel_enabled.isChecked(),
-            'road_gravel_thickness': self.input_road_gravel_thickness.value(),
-
-            # Optimization parameters
-            'height_step': self.input_height_step.value(),
-            'slope_angle': self.input_slope_angle.value(),
 
             # Profile parameters
-            'bbox_buffer': self.input_bbox_buffer.value(),
             'generate_cross_profiles': self.input_generate_cross_profiles.isChecked(),
-            'cross_profile_spacing': self.input_cross_profile_spacing.value(),
             'generate_long_profiles': self.input_generate_long_profiles.isChecked(),
-            'long_profile_spacing': self.input_long_profile_spacing.value(),
-            'vertical_exaggeration': self.input_vertical_exaggeration.value(),
 
             # Output parameters
             'workspace': self.input_workspace.text().strip(),
@@ -1784,41 +1807,80 @@ class MainDialog(QDialog):
             'uncertainty_enabled': self.input_uncertainty_enabled.isChecked(),
             'mc_samples': self.input_mc_samples.value(),
             'terrain_type_index': self.input_terrain_type.currentIndex(),
-            'foundation_depth_std': self.input_foundation_depth_std.value(),
-            'slope_angle_std': self.input_slope_angle_std.value(),
 
             # Bodenstabilisierung
             'enable_stabilization': self.input_enable_stabilization.isChecked(),
             'soil_type': self.input_soil_type.currentText().split(' (')[0]
                          if self.input_soil_type.currentText() != 'Unbekannt - Standardwert verwenden'
                          else 'Schluff',
-            'ev2_bestand': self.input_ev2_bestand.value(),
-            'water_content': self.input_water_content.value(),
-            'optimum_water': self.input_optimum_water.value()
         }
+        # All numeric fields (dimensions, slopes, spacings, soil values)
+        params.update(self._spinbox_params())
+        # Spacings of disabled profile types are not passed on
+        if not params['generate_cross_profiles']:
+            del params['cross_profile_spacing']
+        if not params['generate_long_profiles']:
+            del params['long_profile_spacing']
 
         # Emit signal
-        self.processing_requested.emit(params)
+        self._processing = True
+        self.processing_requested.emit(RunParams(**params))
 
         # Show progress
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.status_text.setVisible(True)
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._pending_messages.clear()
         self.status_text.clear()
+        self.status_text.setStyleSheet("")
 
         # Disable start button
         self.btn_start.setEnabled(False)
 
     def update_progress(self, value, message=""):
-        """Update progress bar and status."""
-        self.progress_bar.setValue(value)
+        """Queue a progress bar/status update (painted by _flush_progress)."""
+        self._pending_progress = value
         if message:
-            self.status_text.append(message)
+            self._pending_messages.append(message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Apply the latest queued progress value and all queued messages."""
+        self._progress_timer.stop()
+        if self._pending_progress is not None:
+            self.progress_bar.setValue(self._pending_progress)
+            self._pending_progress = None
+        if self._pending_messages:
+            self.status_text.appendPlainText("\n".join(self._pending_messages))
+            self._pending_messages.clear()
+
+    def reject(self):
+        """
+        Cancel a running calculation instead of closing the dialog.
+
+        "Abbrechen", Escape and the window close button all end up here.
+        While the workflow runs, the request is forwarded via
+        cancel_requested and the dialog stays open until the worker has
+        stopped and processing_finished was called.
+        """
+        if not self._processing:
+            super().reject()
+            return
+        if self.btn_cancel.isEnabled():
+            self.btn_cancel.setEnabled(False)
+            self.update_progress(self.progress_bar.value(), "⏹️ Abbruch angefordert...")
+            self.cancel_requested.emit()
 
     def processing_finished(self, success=True, message=""):
         """Called when processing finishes with bilingual messages."""
+        self._processing = False
+        self._flush_progress()
         self.progress_bar.setVisible(False)
         self.btn_start.setEnabled(True)
+        self.btn_cancel.setEnabled(True)
 
         lang = get_language()
 
@@ -1858,6 +1920,7 @@ class MainDialog(QDialog):
         Note:
             If a site with the same site_id already exists, it will be updated.
         """
+        self._ensure_all_tabs_built()
         from ..core.site_data import SiteData
 
         # Validate input
@@ -1970,6 +2033,7 @@ class MainDialog(QDialog):
 
     def clear_processed_sites(self):
         """Clear all processed sites from the multi-site report list."""
+        self._ensure_all_tabs_built()
         # Remove all checkboxes from layout
         for site_id, checkbox in self.site_checkboxes.items():
             self.sites_checkbox_layout.removeWidget(checkbox)
@@ -1991,6 +2055,7 @@ class MainDialog(QDialog):
         Returns:
             str: Format string - 'html', 'pdf', or 'excel'
         """
+        self._ensure_all_tabs_built()
         format_index = self.input_multisite_report_format.currentIndex()
         format_map = {
             0: 'html',
@@ -2006,6 +2071,7 @@ class MainDialog(QDialog):
         Returns:
             str: Output file path, or None if not set
         """
+        self._ensure_all_tabs_built()
         path = self.input_multisite_report_output.text().strip()
         return path if path else None
 
@@ -2016,6 +2082,7 @@ class MainDialog(QDialog):
         Returns:
             dict: Cost parameters (cut, fill, gravel costs per m³)
         """
+        self._ensure_all_tabs_built()
         return {
             'cost_cut': self.input_cost_cut.value(),
             'cost_fill': self.input_cost_fill.value(),
@@ -2024,6 +2091,7 @@ class MainDialog(QDialog):
 
     def _on_generate_multisite_report(self):
         """Handle generate multi-site report button click."""
+        self._ensure_all_tabs_built()
         try:
             # Validate selected sites
             selected_sites = self.get_selected_sites()
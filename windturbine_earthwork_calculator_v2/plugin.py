@@ -144,6 +144,7 @@ class WindTurbineEarthworkCalculatorPlugin:
         if not self.dialog:
             self.dialog = MainDialog(self.iface.mainWindow())
             self.dialog.processing_requested.connect(self._on_processing_requested)
+            self.dialog.cancel_requested.connect(self._on_cancel_requested)
 
         # Show dialog
         self.dialog.show()
@@ -156,6 +157,11 @@ class WindTurbineEarthworkCalculatorPlugin:
         self.workflow_runner = WorkflowRunner(self.iface, params, self.dialog)
         self.workflow_runner.start()
 
+    def _on_cancel_requested(self):
+        """Forward a cancel from the dialog to the running workflow."""
+        if self.workflow_runner:
+            self.workflow_runner.cancel()
+
     @staticmethod
     def tr(message):
         """Get the translation for a string using Qt translation API.
@@ -8,7 +8,6 @@ Version: 2.0.0
 """
 
 import os
-import tempfile
 from pathlib import Path
 
 from qgis.PyQt.QtCore import QCoreApplication
@@ -41,7 +40,7 @@ from PyQt5.QtCore import QVariant
 import processing
 
 from ..core.dxf_importer import DXFImporter
-from ..core.dem_downloader import DEMDownloader
+from ..core.dem_downloader import DEMDownloader, copy_file
 from ..core.earthwork_calculator import EarthworkCalculator
 from ..core.profile_generator import ProfileGenerator
 from ..core.report_generator import ReportGenerator
@@ -383,13 +382,11 @@ class OptimizePlatformHeightAlgorithm(QgsProcessingAlgorithm):
 
             force_refresh = self.parameterAsBoolean(parameters, self.FORCE_REFRESH, context)
 
-            # Create temporary DEM file
-            temp_dem_path = tempfile.mktemp(suffix='.tif', prefix='dem_mosaic_')
-
+            # The mosaic is reused from the DEM cache when the tile set matches
             downloader = DEMDownloader(force_refresh=force_refresh)
             dem_path = downloader.download_for_geometry(
                 polygon,
-                temp_dem_path,
+                None,
                 buffer_m=250,
                 feedback=feedback
             )
@@ -608,8 +605,7 @@ class OptimizePlatformHeightAlgorithm(QgsProcessingAlgorithm):
 
             # Copy DEM to GeoPackage (as separate TIFF for now)
             dem_tiff_path = str(Path(output_gpkg).with_suffix('.dem.tif'))
-            import shutil
-            shutil.copy(dem_path, dem_tiff_path)
+            copy_file(dem_path, dem_tiff_path)
             feedback.pushInfo(f"✓ DGM gespeichert: {dem_tiff_path}")
 
             # ===== SCHRITT 8: DGM MIT HÖHENLINIEN LADEN =====
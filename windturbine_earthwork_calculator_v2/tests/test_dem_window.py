@@ -0,0 +1,58 @@
+"""
+Tests for the DEM pixel window of EarthworkCalculator.
+
+``_pixel_window`` converts a bounding box into the raster window read by
+the vectorized DEM sampling and the height sweep. Before, the window of a
+north-up raster (negative pixel height) had its rows reversed and came
+out empty, so sampling always fell back to the slow path.
+"""
+
+import unittest
+
+from qgis.core import QgsRectangle
+
+from windturbine_earthwork_calculator_v2.core.earthwork_calculator import _pixel_window
+
+
+class TestPixelWindow(unittest.TestCase):
+    """Pixelfenster eines Rechtecks in einem 100 x 100 Raster."""
+
+    BBOX = QgsRectangle(1010.0, 1950.0, 1020.0, 1960.0)
+
+    def test_north_up_raster(self):
+        """Negative Pixelhöhe: yMaximum liegt in der oberen Zeile."""
+        geotransform = (1000.0, 1.0, 0.0, 2000.0, 0.0, -1.0)
+
+        window = _pixel_window(self.BBOX, geotransform, 100, 100)
+
+        # Zeilen 40 (y = 1960) bis einschließlich 50 (y = 1950)
+        self.assertEqual(window, (10, 40, 11, 11))
+
+    def test_south_up_raster(self):
+        """Positive Pixelhöhe: yMinimum liegt in der oberen Zeile."""
+        geotransform = (1000.0, 1.0, 0.0, 1900.0, 0.0, 1.0)
+
+        window = _pixel_window(self.BBOX, geotransform, 100, 100)
+
+        # Zeilen 50 (y = 1950) bis einschließlich 60 (y = 1960)
+        self.assertEqual(window, (10, 50, 11, 11))
+
+    def test_clamped_to_raster(self):
+        """Über den Rand ragende Rechtecke werden auf das Raster begrenzt."""
+        geotransform = (1015.0, 1.0, 0.0, 1955.0, 0.0, -1.0)
+
+        window = _pixel_window(self.BBOX, geotransform, 3, 2)
+
+        self.assertEqual(window, (0, 0, 3, 2))
+
+    def test_outside_raster(self):
+        """Rechteck außerhalb des Rasters ergibt ein leeres Fenster."""
+        geotransform = (2000.0, 1.0, 0.0, 2000.0, 0.0, -1.0)
+
+        x_off, y_off, width, height = _pixel_window(self.BBOX, geotransform, 100, 100)
+
+        self.assertLessEqual(width, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+"""
+Tests for the height sweep kernel of EarthworkCalculator.
+
+``_sweep_heights`` evaluates many platform heights in one pass over the
+DEM pixels. These tests check it against volumes computed by hand on a
+tiny grid (following the rules of ``EarthworkCalculator.calculate_scenario``),
+and check that the golden-section search of ``find_optimum`` finds the
+same height as an exhaustive sweep over all steps.
+"""
+
+import math
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+from qgis.core import QgsGeometry
+
+from windturbine_earthwork_calculator_v2.core.earthwork_calculator import (
+    EarthworkCalculator,
+    _sweep_heights,
+)
+
+
+class TestSweepHeights(unittest.TestCase):
+    """Volumina des Kernels für mehrere Höhen in einem Durchlauf."""
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.elevations = 300.0 + rng.normal(0.0, 1.5, 400)
+        self.inside = np.zeros(400, dtype=bool)
+        self.inside[:150] = True
+        self.distances = np.where(self.inside, 0.0, rng.uniform(0.1, 8.0, 400))
+        self.terrain_min = float(self.elevations[self.inside].min())
+        self.terrain_max = float(self.elevations[self.inside].max())
+        self.tan_slope = math.tan(math.radians(45.0))
+
+    def test_hand_computed_volumes(self):
+        """
+        Vier Pixel à 2 m², Böschung 45°, von Hand nachgerechnet.
+
+        Plattform: 101 m und 99 m. Außen: 102 m im Abstand 0.5 m und
+        98 m im Abstand 3.0 m. Die Böschungsbreite ist die größte
+        Höhendifferenz zur Plattform (tan 45° = 1); Böschungspixel zählen
+        mit der halben Differenz zur Plattformhöhe.
+
+        - h = 100.0: Breite 1.0, nur das nahe Pixel liegt in der Böschung
+          (Abtrag (102 - 100) / 2 = 1.0)
+        - h = 99.5: Breite 1.5, Plattform 1.5 Abtrag / 0.5 Auftrag,
+          Böschung (102 - 99.5) / 2 = 1.25 Abtrag
+        - h = 102.0: Breite 3.0, beide Außenpixel in der Böschung,
+          Plattform 1 + 3 Auftrag, Böschung 0 und (102 - 98) / 2 = 2 Auftrag
+        """
+        elevations = np.array([101.0, 99.0, 102.0, 98.0], dtype=np.float32)
+        inside = np.array([True, True, False, False])
+        distances = np.array([0.0, 0.0, 0.5, 3.0], dtype=np.float32)
+        heights = np.array([100.0, 99.5, 102.0])
+
+        volumes = _sweep_heights(
+            elevations, inside, distances, heights, 99.0, 101.0, 1.0, 2.0
+        )
+
+        # (Plattform-Abtrag, Plattform-Auftrag, Böschung-Abtrag,
+        #  Böschung-Auftrag, Böschungsbreite) je Höhe
+        expected = [
+            (2.0, 2.0, 2.0, 0.0, 1.0),
+            (3.0, 1.0, 2.5, 0.0, 1.5),
+            (0.0, 8.0, 0.0, 4.0, 3.0),
+        ]
+        for k, row in enumerate(expected):
+            for values, value in zip(volumes, row):
+                self.assertAlmostEqual(values[k], value, places=6)
+
+    def test_block_split_is_consistent(self):
+        """Aufteilung in Blöcke ändert die Ergebnisse nicht."""
+        heights = np.arange(298.0, 302.0, 0.5)
+        full = _sweep_heights(
+            self.elevations, self.inside, self.distances, heights,
+            self.terrain_min, self.terrain_max, self.tan_slope, 1.0
+        )
+        first = _sweep_heights(
+            self.elevations, self.inside, self.distances, heights[:3],
+            self.terrain_min, self.terrain_max, self.tan_slope, 1.0
+        )
+        rest = _sweep_heights(
+            self.elevations, self.inside, self.distances, heights[3:],
+            self.terrain_min, self.terrain_max, self.tan_slope, 1.0
+        )
+
+        for values, a, b in zip(full, first, rest):
+            np.testing.assert_allclose(values, np.concatenate([a, b]))
+
+
+def _make_calculator(elevation_fn, size=30, platform=(10, 20)):
+    """
+    EarthworkCalculator auf einem synthetischen 1-m-DGM.
+
+    Die Plattform ist das Quadrat platform × platform; elevation_fn(xs, ys)
+    liefert die Geländehöhe der Pixelmittelpunkte. _prepare_height_sweep
+    wird durch die synthetischen Kernel-Eingaben ersetzt, GDAL wird nicht
+    benötigt.
+    """
+    lo, hi = platform
+    polygon = QgsGeometry.fromWkt(
+        f"POLYGON(({lo} {lo}, {hi} {lo}, {hi} {hi}, {lo} {hi}, {lo} {lo}))"
+    )
+    dem_layer = MagicMock()
+    dem_layer.rasterUnitsPerPixelX.return_value = 1.0
+    dem_layer.rasterUnitsPerPixelY.return_value = 1.0
+    calc = EarthworkCalculator(dem_layer, polygon, {'slope_angle': 45.0})
+
+    xs, ys = np.meshgrid(np.arange(size) + 0.5, np.arange(size) + 0.5)
+    xs, ys = xs.ravel(), ys.ravel()
+    elevations = elevation_fn(xs, ys).astype(np.float32)
+    inside = (xs > lo) & (xs < hi) & (ys > lo) & (ys < hi)
+    distances = np.zeros(elevations.shape, dtype=np.float32)
+    distances[~inside] = calc._distance_to_polygon(xs[~inside], ys[~inside])
+
+    platform_elevations = elevations[inside]
+    sweep = {
+        'elevations': elevations,
+        'inside': inside,
+        'distances': distances,
+        'terrain_stats': (
+            float(platform_elevations.min()), float(platform_elevations.max()),
+            float(platform_elevations.mean()), float(platform_elevations.std())
+        ),
+        'tan_slope': math.tan(math.radians(45.0)),
+    }
+    calc._prepare_height_sweep = lambda heights: sweep
+    return calc
+
+
+def _exhaustive_optimum(calc, min_height, max_height, step):
+    """Beste Höhe über alle Schritte, mit derselben Rangfolge wie find_optimum."""
+    heights = np.arange(min_height, max_height + step, step)
+    sweep = calc._prepare_height_sweep(heights)
+    results = [results for _, results in calc._iter_scenarios(heights, sweep)]
+    best = min(
+        range(len(heights)),
+        key=lambda i: (results[i]['total_volume_moved'], abs(results[i]['net_volume']), i)
+    )
+    return heights[best], results[best], len(heights)
+
+
+class TestFindOptimum(unittest.TestCase):
+    """Goldener Schnitt gegen vollständige Suche über alle Höhenschritte."""
+
+    def assert_matches_exhaustive(self, calc, min_height, max_height, step=0.1):
+        """find_optimum liefert Höhe und Volumen der vollständigen Suche."""
+        expected_height, expected, num_candidates = _exhaustive_optimum(
+            calc, min_height, max_height, step
+        )
+        height, results = calc.find_optimum(min_height, max_height, step)
+
+        self.assertAlmostEqual(height, expected_height, places=6)
+        self.assertEqual(results['total_volume_moved'], expected['total_volume_moved'])
+        self.assertEqual(results['net_volume'], expected['net_volume'])
+        self.assertEqual(results['optimization']['num_candidates'], num_candidates)
+        return height, results
+
+    def test_interior_minimum(self):
+        """Geneigtes, welliges Gelände: Optimum liegt im Suchbereich."""
+        calc = _make_calculator(
+            lambda xs, ys: 300.0 + 0.15 * xs + 0.05 * ys + 0.3 * np.sin(xs) * np.cos(ys)
+        )
+        height, results = self.assert_matches_exhaustive(calc, 298.0, 308.0)
+
+        self.assertGreater(height, 298.0)
+        self.assertLess(height, 308.0)
+        # Die Suche wertet deutlich weniger Höhen aus als die vollständige Suche
+        self.assertLess(
+            results['optimization']['num_scenarios'],
+            results['optimization']['num_candidates']
+        )
+
+    def test_all_results_hold_full_sweep(self):
+        """all_results enthält alle Höhenschritte, nicht nur die gesuchten."""
+        calc = _make_calculator(
+            lambda xs, ys: 300.0 + 0.15 * xs + 0.05 * ys + 0.3 * np.sin(xs) * np.cos(ys)
+        )
+        _, results = calc.find_optimum(298.0, 308.0, 0.1)
+        optimization = results['optimization']
+
+        all_heights = [r['platform_height'] for r in optimization['all_results']]
+        self.assertEqual(len(all_heights), optimization['num_candidates'])
+        self.assertEqual(all_heights, sorted(all_heights))
+
+    def test_plateau_ranked_by_net_volume(self):
+        """
+        Plateau: Zwischen 100 m und 102 m ist das Gesamtvolumen gleich.
+
+        Das Gelände besteht nur aus der Plattform (keine Böschungspixel),
+        halb auf 100 m, halb auf 102 m. Alle Höhen dazwischen bewegen
+        gleich viel Boden; entschieden wird über die kleinste Nettomenge,
+        also den Massenausgleich bei 101 m.
+        """
+        calc = _make_calculator(
+            lambda xs, ys: np.where(xs < 5.0, 100.0, 102.0),
+            size=10, platform=(0, 10)
+        )
+        height, results = self.assert_matches_exhaustive(calc, 98.0, 104.0)
+
+        self.assertAlmostEqual(height, 101.0, places=6)
+        self.assertEqual(results['net_volume'], 0.0)
+
+    def test_minimum_at_lower_boundary(self):
+        """Gelände liegt unter dem Suchbereich: Optimum ist die Untergrenze."""
+        calc = _make_calculator(lambda xs, ys: 300.0 + 0.1 * xs)
+        height, _ = self.assert_matches_exhaustive(calc, 304.0, 310.0)
+
+        self.assertEqual(height, np.arange(304.0, 310.0 + 0.1, 0.1)[0])
+
+    def test_minimum_at_upper_boundary(self):
+        """Gelände liegt über dem Suchbereich: Optimum ist die Obergrenze."""
+        calc = _make_calculator(lambda xs, ys: 300.0 + 0.1 * xs)
+        height, _ = self.assert_matches_exhaustive(calc, 290.0, 299.0)
+
+        # Letzter Kandidat wie in find_optimum (Rundung kann 299.1 einschließen)
+        self.assertEqual(height, np.arange(290.0, 299.0 + 0.1, 0.1)[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
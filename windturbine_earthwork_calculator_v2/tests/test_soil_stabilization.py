@@ -35,15 +35,15 @@ class TestSoilStabilization(unittest.TestCase):
         )
 
         # Erwartung: 4-6% für Ton, plus Trocknung
-        self.assertGreaterEqual(result['percentage'], 4.0)
-        self.assertLessEqual(result['percentage'], 8.0)
-        self.assertGreater(result['kg_per_m2'], 0)
-        self.assertGreater(result['kg_per_m3'], 0)
-        self.assertEqual(result['treatment_depth_m'], 0.30)
-        self.assertGreater(result['expected_ev2_after'], 20.0)
+        self.assertGreaterEqual(result.percentage, 4.0)
+        self.assertLessEqual(result.percentage, 8.0)
+        self.assertGreater(result.kg_per_m2, 0)
+        self.assertGreater(result.kg_per_m3, 0)
+        self.assertEqual(result.treatment_depth_m, 0.30)
+        self.assertGreater(result.expected_ev2_after, 20.0)
 
-        print(f"✓ test_lime_dosage_clay: {result['percentage']:.1f}% "
-              f"({result['kg_per_m2']:.0f} kg/m²)")
+        print(f"✓ test_lime_dosage_clay: {result.percentage:.1f}% "
+              f"({result.kg_per_m2:.0f} kg/m²)")
 
     def test_lime_dosage_schluff(self):
         """Test Kalkdosierung für Schluff"""
@@ -56,12 +56,12 @@ class TestSoilStabilization(unittest.TestCase):
         )
 
         # Erwartung: 3-5% für Schluff
-        self.assertGreaterEqual(result['percentage'], 3.0)
-        self.assertLessEqual(result['percentage'], 7.0)
-        self.assertGreater(result['expected_ev2_after'], 25.0)
+        self.assertGreaterEqual(result.percentage, 3.0)
+        self.assertLessEqual(result.percentage, 7.0)
+        self.assertGreater(result.expected_ev2_after, 25.0)
 
-        print(f"✓ test_lime_dosage_schluff: {result['percentage']:.1f}% "
-              f"({result['kg_per_m2']:.0f} kg/m²)")
+        print(f"✓ test_lime_dosage_schluff: {result.percentage:.1f}% "
+              f"({result.kg_per_m2:.0f} kg/m²)")
 
     def test_no_lime_for_sand(self):
         """Test: Keine Kalkstabilisierung für Sand"""
@@ -74,9 +74,9 @@ class TestSoilStabilization(unittest.TestCase):
         )
 
         # Sand sollte keine Kalkbehandlung bekommen
-        self.assertEqual(result['percentage'], 0.0)
-        self.assertEqual(result['kg_per_m2'], 0.0)
-        self.assertEqual(result['expected_ev2_after'], 30.0)
+        self.assertEqual(result.percentage, 0.0)
+        self.assertEqual(result.kg_per_m2, 0.0)
+        self.assertEqual(result.expected_ev2_after, 30.0)
 
         print(f"✓ test_no_lime_for_sand: Kein Kalk (wie erwartet)")
 
@@ -89,16 +89,16 @@ class TestSoilStabilization(unittest.TestCase):
         )
 
         # Bei Ev2=45 erwarten wir 35cm Schichtdicke
-        self.assertEqual(result['thickness_m'], 0.35)
-        self.assertGreater(result['mass_tons'], 0)
-        self.assertGreater(result['compacted_volume_m3'], 0)
-        self.assertGreater(result['loose_volume_m3'], result['compacted_volume_m3'])
+        self.assertEqual(result.thickness_m, 0.35)
+        self.assertGreater(result.mass_tons, 0)
+        self.assertGreater(result.compacted_volume_m3, 0)
+        self.assertGreater(result.loose_volume_m3, result.compacted_volume_m3)
 
         expected_volume = 3000.0 * 0.35
-        self.assertAlmostEqual(result['compacted_volume_m3'], expected_volume, places=1)
+        self.assertAlmostEqual(result.compacted_volume_m3, expected_volume, places=1)
 
-        print(f"✓ test_gravel_thickness_low_ev2: {result['thickness_m']*100:.0f} cm, "
-              f"{result['mass_tons']:.0f} t")
+        print(f"✓ test_gravel_thickness_low_ev2: {result.thickness_m*100:.0f} cm, "
+              f"{result.mass_tons:.0f} t")
 
     def test_gravel_thickness_high_ev2(self):
         """Test Schotterdicke bei hohem Ev2"""
@@ -109,10 +109,10 @@ class TestSoilStabilization(unittest.TestCase):
         )
 
         # Bei Ev2=100 erwarten wir 20cm Schichtdicke
-        self.assertEqual(result['thickness_m'], 0.20)
+        self.assertEqual(result.thickness_m, 0.20)
 
-        print(f"✓ test_gravel_thickness_high_ev2: {result['thickness_m']*100:.0f} cm, "
-              f"{result['mass_tons']:.0f} t")
+        print(f"✓ test_gravel_thickness_high_ev2: {result.thickness_m*100:.0f} cm, "
+              f"{result.mass_tons:.0f} t")
 
     def test_gravel_thickness_very_low_ev2(self):
         """Test Schotterdicke bei sehr niedrigem Ev2"""
@@ -123,9 +123,9 @@ class TestSoilStabilization(unittest.TestCase):
         )
 
         # Bei sehr niedrigem Ev2 erwarten wir maximale Dicke (40cm)
-        self.assertEqual(result['thickness_m'], 0.40)
+        self.assertEqual(result.thickness_m, 0.40)
 
-        print(f"✓ test_gravel_thickness_very_low_ev2: {result['thickness_m']*100:.0f} cm "
+        print(f"✓ test_gravel_thickness_very_low_ev2: {result.thickness_m*100:.0f} cm "
               f"(Maximum)")
 
     def test_full_calculation_with_lime(self):
@@ -139,22 +139,22 @@ class TestSoilStabilization(unittest.TestCase):
         )
 
         # Bei Ev2=25 sollte Kalkbehandlung vorgeschlagen werden
-        self.assertIsNotNone(result['lime_treatment'])
-        self.assertGreater(result['total_lime_tons'], 0)
-        self.assertGreater(result['total_gravel_tons'], 0)
-        self.assertEqual(result['area_m2'], 3000.0)
-        self.assertEqual(result['initial_ev2'], 25.0)
-        self.assertEqual(result['soil_type'], 'Schluff')
-        self.assertGreater(result['ev2_after_lime'], result['initial_ev2'])
-        self.assertEqual(result['final_ev2_expected'], 120.0)
-        self.assertIsInstance(result['quality_notes'], list)
-        self.assertGreater(len(result['quality_notes']), 0)
-        self.assertIn(result['reliability_rating'], ['high', 'medium', 'low'])
+        self.assertIsNotNone(result.lime_treatment)
+        self.assertGreater(result.total_lime_tons, 0)
+        self.assertGreater(result.total_gravel_tons, 0)
+        self.assertEqual(result.area_m2, 3000.0)
+        self.assertEqual(result.initial_ev2, 25.0)
+        self.assertEqual(result.soil_type, 'Schluff')
+        self.assertGreater(result.ev2_after_lime, result.initial_ev2)
+        self.assertEqual(result.final_ev2_expected, 120.0)
+        self.assertIsInstance(result.quality_notes, tuple)
+        self.assertGreater(len(result.quality_notes), 0)
+        self.assertIn(result.reliability_rating, ['high', 'medium', 'low'])
 
         print(f"✓ test_full_calculation_with_lime:")
-        print(f"  Kalk: {result['total_lime_tons']:.1f} t")
-        print(f"  Schotter: {result['total_gravel_tons']:.0f} t")
-        print(f"  Ev2: {result['initial_ev2']} → {result['final_ev2_expected']} MN/m²")
+        print(f"  Kalk: {result.total_lime_tons:.1f} t")
+        print(f"  Schotter: {result.total_gravel_tons:.0f} t")
+        print(f"  Ev2: {result.initial_ev2} → {result.final_ev2_expected} MN/m²")
 
     def test_no_lime_needed_high_ev2(self):
         """Test: Keine Kalkbehandlung bei ausreichendem Ev2"""
@@ -165,13 +165,13 @@ class TestSoilStabilization(unittest.TestCase):
         )
 
         # Bei Ev2=80 keine Kalkbehandlung nötig
-        self.assertIsNone(result['lime_treatment'])
-        self.assertEqual(result['total_lime_tons'], 0)
-        self.assertGreater(result['total_gravel_tons'], 0)
-        self.assertEqual(result['ev2_after_lime'], 80.0)
+        self.assertIsNone(result.lime_treatment)
+        self.assertEqual(result.total_lime_tons, 0)
+        self.assertGreater(result.total_gravel_tons, 0)
+        self.assertEqual(result.ev2_after_lime, 80.0)
 
         print(f"✓ test_no_lime_needed_high_ev2: Nur Schotter "
-              f"({result['total_gravel_tons']:.0f} t)")
+              f"({result.total_gravel_tons:.0f} t)")
 
     def test_reliability_rating(self):
         """Test Zuverlässigkeitsbewertung"""
@@ -181,7 +181,7 @@ class TestSoilStabilization(unittest.TestCase):
             soil_type='Sand',
             current_ev2=80.0
         )
-        self.assertEqual(result_high['reliability_rating'], 'high')
+        self.assertEqual(result_high.reliability_rating, 'high')
 
         # Niedrige Zuverlässigkeit: Sehr weicher Untergrund
         result_low = self.calc.calculate_full_requirements(
@@ -191,10 +191,10 @@ class TestSoilStabilization(unittest.TestCase):
             water_content=25.0,
             optimum_water=12.0
         )
-        self.assertEqual(result_low['reliability_rating'], 'low')
+        self.assertEqual(result_low.reliability_rating, 'low')
 
-        print(f"✓ test_reliability_rating: high={result_high['reliability_rating']}, "
-              f"low={result_low['reliability_rating']}")
+        print(f"✓ test_reliability_rating: high={result_high.reliability_rating}, "
+              f"low={result_low.reliability_rating}")
 
     def test_din_classification_conversion(self):
         """Test DIN 18196 Bodenklassen-Konvertierung"""
@@ -223,8 +223,8 @@ class TestSoilStabilization(unittest.TestCase):
             optimum_water=0
         )
 
-        notes = result['quality_notes']
-        self.assertIsInstance(notes, list)
+        notes = result.quality_notes
+        self.assertIsInstance(notes, tuple)
         self.assertGreater(len(notes), 0)
 
         # Prüfe dass Hinweis für unbekannten Wassergehalt vorhanden ist
@@ -238,6 +238,38 @@ class TestSoilStabilization(unittest.TestCase):
 
         print(f"✓ test_quality_notes_generation: {len(notes)} Hinweise generiert")
 
+    def test_batch_matches_single_calculation(self):
+        """Test dass die Batch-Berechnung dieselben Ergebnisse liefert"""
+        cases = [
+            (3000.0, 'Schluff', 25.0, 20.0, 14.0),
+            (3000.0, 'Ton', 20.0, 25.0, 12.0),
+            (2500.0, 'Ton', 30.0, None, None),
+            (3000.0, 'Sand', 30.0, None, None),
+            (1800.0, 'Sand', 80.0, None, None),
+            (3000.0, 'Kies', 120.0, 8.0, 8.0),
+        ]
+
+        batch = self.calc.calculate_full_requirements_batch(
+            platform_areas_m2=[c[0] for c in cases],
+            soil_types=[c[1] for c in cases],
+            current_ev2s=[c[2] for c in cases],
+            water_contents=[c[3] for c in cases],
+            optimum_waters=[c[4] for c in cases]
+        )
+
+        self.assertEqual(len(batch), len(cases))
+        for (area, soil, ev2, w, w_opt), batch_result in zip(cases, batch):
+            single = self.calc.calculate_full_requirements(
+                platform_area_m2=area,
+                soil_type=soil,
+                current_ev2=ev2,
+                water_content=w,
+                optimum_water=w_opt
+            )
+            self.assertEqual(batch_result, single)
+
+        print(f"✓ test_batch_matches_single_calculation: {len(cases)} Flächen identisch")
+
     def test_bgr_query_placeholder(self):
         """Test dass BGR-Abfrage Platzhalter funktioniert"""
         from qgis.core import QgsPointXY
@@ -0,0 +1,92 @@
+"""
+Tests for the shared-edge length of SurfaceValidator.
+
+Snapped surfaces are measured by matching identical edges; borders that
+are only partly snapped must still be measured in full.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from qgis.core import QgsGeometry
+
+from windturbine_earthwork_calculator_v2.core.surface_types import (
+    HeightMode,
+    SurfaceConfig,
+    SurfaceType,
+)
+from windturbine_earthwork_calculator_v2.core.surface_validators import SurfaceValidator
+
+
+def _surface(surface_type, wkt, **kwargs):
+    """SurfaceConfig mit Geometrie aus WKT."""
+    return SurfaceConfig(
+        surface_type=surface_type,
+        geometry=QgsGeometry.fromWkt(wkt),
+        dxf_path="dummy.dxf",
+        height_mode=HeightMode.OPTIMIZED,
+        **kwargs
+    )
+
+
+def _validator(crane_wkt, boom_wkt):
+    """SurfaceValidator für Kranstellfläche und Auslegerfläche."""
+    project = MagicMock()
+    project.crane_pad = _surface(SurfaceType.CRANE_PAD, crane_wkt)
+    project.foundation = _surface(
+        SurfaceType.FOUNDATION, "POLYGON((2 2, 8 2, 8 8, 2 8, 2 2))"
+    )
+    # Auslegerfläche braucht ein Längsgefälle im zulässigen Bereich
+    project.boom = _surface(SurfaceType.BOOM, boom_wkt, slope_longitudinal=2.0)
+    project.rotor_storage = None
+    return SurfaceValidator(project)
+
+
+class TestSharedEdgeLength(unittest.TestCase):
+    """Länge der gemeinsamen Kante zweier Flächen."""
+
+    # Kranstellfläche mit Zwischenpunkt bei x = 5 auf der Unterkante
+    CRANE = "POLYGON((0 0, 5 0, 10 0, 10 10, 0 10, 0 0))"
+
+    def test_fully_snapped_border(self):
+        """Vollständig gefangene Kante: Länge aus den identischen Kanten."""
+        validator = _validator(self.CRANE, "POLYGON((0 0, 0 -5, 5 -5, 5 0, 0 0))")
+
+        length = validator._calculate_shared_edge_length(
+            SurfaceType.CRANE_PAD, SurfaceType.BOOM
+        )
+
+        self.assertAlmostEqual(length, 5.0, places=6)
+
+    def test_partly_snapped_border(self):
+        """
+        Nur teilweise gefangene Kante wird vollständig gemessen.
+
+        Die Auslegerfläche teilt die Kante 0-5 exakt, läuft danach aber
+        mit eigener Kante 5-12 entlang der Unterkante 5-10 weiter. Die
+        gemeinsame Grenze ist 10 m lang, nicht nur die 5 m der exakt
+        übereinstimmenden Kante.
+        """
+        validator = _validator(
+            self.CRANE, "POLYGON((0 0, 0 -5, 12 -5, 12 0, 5 0, 0 0))"
+        )
+
+        length = validator._calculate_shared_edge_length(
+            SurfaceType.CRANE_PAD, SurfaceType.BOOM
+        )
+
+        self.assertAlmostEqual(length, 10.0, places=6)
+
+    def test_unsnapped_border(self):
+        """Ohne identische Kanten misst die GEOS-Verschneidung."""
+        validator = _validator(self.CRANE, "POLYGON((2 0, 2 -5, 8 -5, 8 0, 2 0))")
+
+        length = validator._calculate_shared_edge_length(
+            SurfaceType.CRANE_PAD, SurfaceType.BOOM
+        )
+
+        self.assertAlmostEqual(length, 6.0, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ Provides helper functions for geometric operations.
 import math
 from qgis.core import (
     QgsGeometry,
+    QgsGeometryEngine,
     QgsPointXY,
     QgsRectangle,
     QgsWkbTypes
@@ -86,6 +87,21 @@ def get_centroid(geometry):
     return geometry.centroid().asPoint()
 
 
+def prepared_engine(geometry: QgsGeometry) -> QgsGeometryEngine:
+    """
+    Create a prepared GEOS engine for repeated predicates on a geometry.
+
+    Args:
+        geometry (QgsGeometry): Geometry to test against; must outlive the engine
+
+    Returns:
+        QgsGeometryEngine: Engine with a prepared edge index
+    """
+    engine = QgsGeometry.createGeometryEngine(geometry.constGet())
+    engine.prepareGeometry()
+    return engine
+
+
 def create_bbox_with_buffer(geometry, buffer_distance):
     """
     Create a bounding box around a geometry with buffer.
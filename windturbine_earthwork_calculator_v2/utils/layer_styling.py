@@ -4,6 +4,8 @@ Layer styling utilities for Wind Turbine Earthwork Calculator V2
 Provides functions for styling raster layers with contour rendering and labels.
 """
 
+import os
+
 from qgis.core import (
     QgsRasterLayer,
     QgsVectorLayer,
@@ -22,6 +24,12 @@ from qgis.core import (
 from qgis.PyQt.QtCore import Qt, QVariant
 from qgis.PyQt.QtGui import QColor, QFont
 
+try:
+    from osgeo import gdal, ogr, osr
+    GDAL_AVAILABLE = True
+except ImportError:
+    GDAL_AVAILABLE = False
+
 
 def apply_contour_styling_to_raster(raster_layer, contour_interval=1.0, index_interval=5.0):
     """
@@ -158,6 +166,61 @@ def load_dem_with_contours_to_map(dem_path, layer_name="DEM Contours",
         return None
 
 
+def _generate_contours_gdal(dem_path, output_path, contour_interval):
+    """
+    Write contour lines of a DEM to a GeoPackage in-process.
+
+    Runs gdal.ContourGenerate on the opened band instead of starting the
+    gdal_contour tool through processing, so the DEM is read once in this
+    process. Band nodata is honoured like gdal_contour does by default.
+
+    Only output_path is written: the DEM is opened with GDAL's .aux.xml
+    sidecar (PAM) disabled, so nothing is created next to the DEM, which
+    may be a file of the shared DEM cache.
+
+    Returns:
+        str: Layer URI of the contour layer
+    """
+    if os.path.abspath(output_path) == os.path.abspath(dem_path):
+        raise ValueError(f"Contour output would overwrite the DEM: {output_path}")
+
+    pam_enabled = gdal.GetConfigOption('GDAL_PAM_ENABLED')
+    gdal.SetConfigOption('GDAL_PAM_ENABLED', 'NO')
+    try:
+        src_ds = gdal.Open(dem_path, gdal.GA_ReadOnly)
+        if src_ds is None:
+            raise IOError(f"Cannot open DEM: {dem_path}")
+        band = src_ds.GetRasterBand(1)
+        nodata = band.GetNoDataValue()
+
+        driver = ogr.GetDriverByName('GPKG')
+        if os.path.exists(output_path):
+            driver.DeleteDataSource(output_path)
+        out_ds = driver.CreateDataSource(output_path)
+
+        srs = None
+        projection = src_ds.GetProjection()
+        if projection:
+            srs = osr.SpatialReference()
+            srs.ImportFromWkt(projection)
+
+        layer = out_ds.CreateLayer('contours', srs=srs, geom_type=ogr.wkbLineString)
+        layer.CreateField(ogr.FieldDefn('ID', ogr.OFTInteger))
+        layer.CreateField(ogr.FieldDefn('ELEV', ogr.OFTReal))
+
+        gdal.ContourGenerate(
+            band, contour_interval, 0.0, [],
+            1 if nodata is not None else 0, nodata if nodata is not None else 0.0,
+            layer, 0, 1
+        )
+
+        out_ds = None
+        src_ds = None
+    finally:
+        gdal.SetConfigOption('GDAL_PAM_ENABLED', pam_enabled)
+    return f"{output_path}|layername=contours"
+
+
 def create_vector_contours_with_labels(dem_path, output_path,
                                        contour_interval=1.0, index_interval=5.0):
     """
@@ -175,24 +238,26 @@ def create_vector_contours_with_labels(dem_path, output_path,
         QgsVectorLayer: The contour vector layer with labels, or None if failed
     """
     try:
-        import processing
-        from qgis.core import QgsVectorLayer
-
         # Generate contours using GDAL
-        result = processing.run("gdal:contour", {
-            'INPUT': dem_path,
-            'BAND': 1,
-            'INTERVAL': contour_interval,
-            'FIELD_NAME': 'ELEV',
-            'CREATE_3D': False,
-            'IGNORE_NODATA': False,
-            'NODATA': None,
-            'OFFSET': 0,
-            'EXTRA': '',
-            'OUTPUT': output_path
-        })
-
-        contour_layer = QgsVectorLayer(result['OUTPUT'], 'Contour Lines', 'ogr')
+        if GDAL_AVAILABLE:
+            contour_uri = _generate_contours_gdal(dem_path, output_path, contour_interval)
+        else:
+            import processing
+            result = processing.run("gdal:contour", {
+                'INPUT': dem_path,
+                'BAND': 1,
+                'INTERVAL': contour_interval,
+                'FIELD_NAME': 'ELEV',
+                'CREATE_3D': False,
+                'IGNORE_NODATA': False,
+                'NODATA': None,
+                'OFFSET': 0,
+                'EXTRA': '',
+                'OUTPUT': output_path
+            })
+            contour_uri = result['OUTPUT']
+
+        contour_layer = QgsVectorLayer(contour_uri, 'Contour Lines', 'ogr')
 
         if not contour_layer.isValid():
             return None
@@ -5,6 +5,7 @@ Provides validation functions for user inputs and data with bilingual error mess
 """
 
 import os
+import stat
 from pathlib import Path
 from qgis.core import (
     QgsCoordinateReferenceSystem,
@@ -56,10 +57,13 @@ def validate_file_exists(file_path, extension=None):
     """
     path = Path(file_path)
 
-    if not path.exists():
+    # A single stat answers both "exists" and "is a regular file"
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
         raise ValidationError(_format_error('file_not_found', file_path=file_path))
 
-    if not path.is_file():
+    if not stat.S_ISREG(mode):
         raise ValidationError(_format_error('not_a_file', file_path=file_path))
 
     if extension and path.suffix.lower() != extension.lower():